@@ -18,6 +18,7 @@ class LoginError(Exception):
 
 class VersionControlAddon(AYONAddon, ITrayService, IPluginPaths):
     webserver = None
+    prefetch_daemon = None
     active_version_control_system = None
 
     @property
@@ -46,6 +47,9 @@ class VersionControlAddon(AYONAddon, ITrayService, IPluginPaths):
             self.enabled = False
             return
 
+        self.prefetch_settings = vc_settings.get("prefetch") or {}
+        self.connection_settings = vc_settings.get("connection") or {}
+
         valid_hosts = vc_settings["enabled_hosts"]
         current_host = get_current_host_name()
         self.log.debug(current_host)
@@ -109,6 +113,9 @@ class VersionControlAddon(AYONAddon, ITrayService, IPluginPaths):
         return settings
 
     def tray_exit(self) -> None:
+        if self.prefetch_daemon:
+            self.prefetch_daemon.stop()
+
         if (
             self.enabled
             and self.webserver
@@ -123,8 +130,110 @@ class VersionControlAddon(AYONAddon, ITrayService, IPluginPaths):
         if self.enabled:
             from version_control.rest.communication_server import WebServer
 
+            self._configure_connections()
             self.webserver = WebServer()
             self.webserver.start()
+            self._start_prefetch()
+
+    def _configure_connections(self) -> None:
+        connection_settings = self.connection_settings
+        if not connection_settings:
+            return
+
+        from version_control.backends.perforce.api import (
+            p4_login_cache,
+            p4_pool,
+            p4_workspace_cache,
+        )
+
+        p4_pool.configure_connection_pool(
+            max_size=connection_settings["pool_size"],
+            idle_timeout=connection_settings["idle_timeout"],
+            acquire_timeout=connection_settings["acquire_timeout"],
+        )
+        persist_path = None
+        if connection_settings["persist_workspace_cache"]:
+            persist_path = str(
+                pathlib.Path(os.environ["APPDATA"])
+                / "halon"
+                / "perforce_workspaces.json"
+            )
+
+        p4_workspace_cache.configure_workspace_cache(
+            ttl=connection_settings["workspace_cache_ttl"],
+            persist_path=persist_path,
+        )
+        p4_login_cache.configure_login_cache(
+            ttl=connection_settings["login_cache_ttl"]
+        )
+
+    def _start_prefetch(self) -> None:
+        prefetch_settings = self.prefetch_settings
+        if not prefetch_settings.get("enabled"):
+            return
+
+        from version_control.backends.perforce import prefetch, rest_routes
+
+        self.prefetch_daemon = prefetch.P4PrefetchDaemon(
+            partial(
+                self._get_prefetch_targets, prefetch_settings["projects"]
+            ),
+            interval=prefetch_settings["interval"] * 60,
+            bandwidth_limit=int(
+                prefetch_settings["bandwidth_limit"] * 1024 * 1024
+            ),
+            # Leave the server to the artist's own calls:
+            is_busy_fn=rest_routes.p4_executor.is_busy,
+        )
+        prefetch.configure_prefetch_daemon(self.prefetch_daemon)
+        self.prefetch_daemon.start()
+
+    def _get_prefetch_targets(self, project_names: typing.List[str]) -> typing.List:
+        from version_control.api import perforce
+        from version_control.api.models import get_server_workspaces
+        from version_control.backends.perforce.prefetch import PrefetchTarget
+
+        targets = []
+        for project_name in project_names:
+            try:
+                servers = perforce.fetch_project_servers(project_name)
+                workspaces = get_server_workspaces(project_name).workspaces
+                servers_by_name = {server.name: server for server in servers}
+                # Only prefetch from servers the artist already logged in to:
+                logins = {
+                    name: perforce.get_stored_login(servers_by_name[name])
+                    for name in {workspace.server for workspace in workspaces}
+                    if name in servers_by_name
+                }
+            except Exception as error:
+                self.log.warning(
+                    f"Unable to get the workspaces of {project_name}: {error}"
+                )
+                continue
+
+            for workspace in workspaces:
+                paths = list(workspace.always_sync)
+                if workspace.workspace_dir:
+                    paths.extend(
+                        f"{workspace.workspace_dir}/{startup_file}"
+                        for startup_file in workspace.startup_files
+                    )
+
+                server = logins.get(workspace.server)
+                if not paths or not server:
+                    continue
+
+                targets.append(
+                    PrefetchTarget(
+                        port=server.perforce_port,
+                        user=server.username,
+                        password=server.password,
+                        client=workspace.workspace_name,
+                        paths=tuple(paths),
+                    )
+                )
+
+        return targets
 
     def get_plugin_paths(self) -> typing.Dict:
         return {}
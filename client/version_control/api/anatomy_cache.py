@@ -0,0 +1,65 @@
+import copy
+import threading
+import time
+import typing
+
+from ayon_core.pipeline.anatomy.anatomy import Anatomy
+from ayon_core.pipeline.template_data import get_template_data_with_names
+
+
+class AnatomyCache:
+    """
+    Process wide cache of the ``Anatomy`` and template data of each project,
+    shared by all the workspaces of a project instead of built for each.
+
+    Attributes:
+        ttl (float): Seconds before the anatomy of a project is built again.
+    """
+
+    def __init__(self, ttl: float = 60.0):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._projects: typing.Dict[str, typing.Tuple[float, Anatomy, dict]] = {}
+
+    def get_anatomy(self, project_name: str) -> Anatomy:
+        """Get the shared anatomy of a project, it must not be modified."""
+        return self._get(project_name)[0]
+
+    def get_template_data(self, project_name: str) -> dict:
+        """Get a copy of the template data of a project."""
+        return copy.deepcopy(self._get(project_name)[1])
+
+    def invalidate(self, project_name: typing.Union[str, None] = None) -> None:
+        """Build the anatomy of a project, or of all of them, again on next access."""
+        with self._lock:
+            if project_name is None:
+                self._projects.clear()
+            else:
+                self._projects.pop(project_name, None)
+
+    def _get(self, project_name: str) -> typing.Tuple[Anatomy, dict]:
+        with self._lock:
+            cached = self._projects.get(project_name)
+
+        if cached is not None and time.monotonic() - cached[0] < self.ttl:
+            return cached[1], cached[2]
+
+        anatomy = Anatomy(project_name=project_name)
+        template_data = get_template_data_with_names(project_name)
+        with self._lock:
+            self._projects[project_name] = (time.monotonic(), anatomy, template_data)
+
+        return anatomy, template_data
+
+
+_anatomy_cache = None
+_anatomy_cache_lock = threading.Lock()
+
+
+def get_anatomy_cache() -> AnatomyCache:
+    global _anatomy_cache
+    with _anatomy_cache_lock:
+        if _anatomy_cache is None:
+            _anatomy_cache = AnatomyCache()
+
+    return _anatomy_cache
@@ -170,8 +170,17 @@ def filter_perforce_exists(
             len(workfiles),
         )
 
-    for i, file in enumerate(workfiles):
-        perforce_exists = PerforceRestStub.exists_on_server(file.as_posix())
+    exists_on_server = PerforceRestStub.batch(
+        [
+            {
+                "operation": "exists_on_server",
+                "path": [file.as_posix() for file in workfiles],
+            }
+        ]
+    )[0]
+    for i, (file, perforce_exists) in enumerate(
+        zip(workfiles, exists_on_server)
+    ):
         if not perforce_exists:
             unsubmitted_workfiles.append(file)
             log.warning(
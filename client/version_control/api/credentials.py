@@ -0,0 +1,131 @@
+import json
+import os
+import pathlib
+import tempfile
+import threading
+import typing
+from dataclasses import replace
+
+from ayon_core.lib.log import Logger
+
+from version_control.api.models import ServerInfo
+
+log = Logger.get_logger(__name__)
+
+
+def get_credentials_path() -> pathlib.Path:
+    return pathlib.Path(os.environ["APPDATA"]) / "halon" / "perforce_servers.json"
+
+
+class CredentialStore:
+    """
+    Process wide store of the server logins saved in ``perforce_servers.json``.
+
+    The file is parsed once and the servers are kept by name, the identity
+    ``ServerInfo`` compares by. Every lookup only stats the file, to reload
+    it when another process changed it. Changes are written to a temporary
+    file that then replaces the json, so readers never see it half written.
+
+    Attributes:
+        path (pathlib.Path): The json file the logins are saved in.
+    """
+
+    def __init__(self, path: pathlib.Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._servers: typing.Dict[str, ServerInfo] = {}
+        self._signature = None
+
+    def get(self, name: str) -> typing.Union[ServerInfo, None]:
+        """Get a copy of the saved server called ``name``, if any."""
+        with self._lock:
+            self._reload_if_changed()
+            server_info = self._servers.get(name)
+
+        return replace(server_info) if server_info else None
+
+    def get_all(self) -> typing.List[ServerInfo]:
+        with self._lock:
+            self._reload_if_changed()
+            return [replace(server_info) for server_info in self._servers.values()]
+
+    def set(self, server_info: ServerInfo) -> None:
+        """Save the login of a server, replacing any with the same name."""
+        with self._lock:
+            self._reload_if_changed()
+            self._servers[server_info.name] = replace(server_info)
+            self._save()
+
+    def remove(self, server_info: ServerInfo) -> bool:
+        """Remove the login of a server, returns False if it wasn't saved."""
+        with self._lock:
+            self._reload_if_changed()
+            if self._servers.pop(server_info.name, None) is None:
+                return False
+
+            self._save()
+            return True
+
+    def ensure_file(self) -> None:
+        """Create an empty json for the logins if there isn't one."""
+        with self._lock:
+            if not self.path.exists():
+                self._save()
+
+    def _get_signature(self) -> typing.Union[typing.Tuple[int, int], None]:
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+
+        return stat.st_mtime_ns, stat.st_size
+
+    def _reload_if_changed(self) -> None:
+        signature = self._get_signature()
+        if signature == self._signature:
+            return
+
+        servers = {}
+        if signature is not None:
+            log.debug(f"Perforce Config File: {self.path}")
+            try:
+                with self.path.open("r") as config_file:
+                    config = json.load(config_file)
+                servers = {x["name"]: ServerInfo(**x) for x in config}
+            except (OSError, ValueError, TypeError, KeyError) as error:
+                log.warning(f"Unable to read {self.path}: {error}")
+
+        self._servers = servers
+        self._signature = signature
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f"{self.path.stem}_", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(file_descriptor, "w") as config_file:
+                json.dump(
+                    list(map(lambda x: x.__dict__, self._servers.values())),
+                    config_file,
+                    indent=4,
+                )
+            os.replace(temp_path, self.path)
+        except Exception:
+            pathlib.Path(temp_path).unlink(missing_ok=True)
+            raise
+
+        self._signature = self._get_signature()
+
+
+_credential_store = None
+_credential_store_lock = threading.Lock()
+
+
+def get_credential_store() -> CredentialStore:
+    global _credential_store
+    with _credential_store_lock:
+        if _credential_store is None:
+            _credential_store = CredentialStore(get_credentials_path())
+
+    return _credential_store
@@ -7,7 +7,7 @@ from ayon_core.pipeline.context_tools import (get_current_host_name,
 from maya import OpenMaya
 from qtpy import QtWidgets
 
-from version_control.api.models.server_workspaces import ServerWorkspaces
+from version_control.api.models.server_workspaces import get_server_workspaces
 from version_control.api.perforce import get_connection_info, handle_login
 from version_control.rest.perforce.rest_stub import PerforceRestStub
 
@@ -24,6 +24,31 @@ def install_version_control_callbacks() -> None:
     OpenMaya.MSceneMessage.addCheckReferenceCallback(
         OpenMaya.MSceneMessage.kBeforeLoadReferenceCheck, _on_load_reference
     )
+    OpenMaya.MSceneMessage.addCallback(
+        OpenMaya.MSceneMessage.kBeforeSave, _on_before_save
+    )
+    OpenMaya.MSceneMessage.addCallback(
+        OpenMaya.MSceneMessage.kAfterSave, _on_after_save
+    )
+
+
+def _on_before_save(*args) -> None:
+    """
+    Pauses the tray's background prefetch while the scene saves,
+    so it doesn't compete with the save for the disk and network.
+    """
+    _pause_prefetch(300)
+
+
+def _on_after_save(*args) -> None:
+    _pause_prefetch(0)
+
+
+def _pause_prefetch(seconds: int) -> None:
+    try:
+        PerforceRestStub.pause_prefetch(seconds)
+    except Exception as error:
+        log.debug(f"Unable to pause the prefetch: {error}")
 
 
 def _on_load_reference(*args) -> None:
@@ -58,7 +83,7 @@ def _on_load_reference(*args) -> None:
                     log.error("Must be in a project context to run.")
                     return
 
-                server_workspaces = ServerWorkspaces(project)
+                server_workspaces = get_server_workspaces(project)
                 workspaces = server_workspaces.get_host_workspaces(host, True)
                 if not workspaces:
                     raise ValueError(f"Unable to get workspaces for {host}")
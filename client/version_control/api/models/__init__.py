@@ -1,4 +1,8 @@
-from .server_workspaces import ServerWorkspaces
+from .server_workspaces import (
+    ServerWorkspaces,
+    get_server_workspaces,
+    invalidate_server_workspaces,
+)
 from .connection_info import ConnectionInfo
 from .perforce_file_info import PerforceFileInfo
 from .workspace_info import WorkspaceInfo
@@ -11,4 +15,6 @@ __all__ = (
     "PerforceFileInfo",
     "WorkspaceInfo",
     "ServerInfo",
+    "get_server_workspaces",
+    "invalidate_server_workspaces",
 )
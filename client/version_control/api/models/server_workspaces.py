@@ -1,8 +1,10 @@
+import threading
 import typing
 from dataclasses import dataclass, field
 
 from ayon_core.lib.log import Logger
-from ayon_core.settings.lib import get_project_settings
+
+from version_control.api.settings_cache import get_settings_cache
 
 from .workspace_info import WorkspaceInfo
 
@@ -18,8 +20,10 @@ class ServerWorkspaces:
     Methods:
         __init__: Initializes the ServerWorkspaces object, optionally fetching project workspaces.
         fetch_project_workspaces(str): Fetches and populates workspaces for a specified project.
+        set_workspaces(List[WorkspaceInfo]): Sets the workspaces and indexes them by host and name.
         _add_workspace_info(str, dict): Generates a WorkspaceInfo instance from given settings.
         get_host_workspaces(str, bool): Retrieves workspaces associated with a specific host and primary status.
+        get_workspace_by_name(str): Retrieves the workspace with a given name.
     """
 
     workspaces: typing.List[WorkspaceInfo] = field(default_factory=lambda: [])
@@ -33,6 +37,7 @@ class ServerWorkspaces:
                 Defaults to None, which means no initial projects are fetched.
         """
 
+        self.set_workspaces([])
         if project_name:
             self.fetch_project_workspaces(project_name)
 
@@ -47,15 +52,38 @@ class ServerWorkspaces:
             None
         """
 
-        project_settings = get_project_settings(project_name)
-        version_control_settings = project_settings["version_control"]
-        self.workspaces = list(
-            map(
-                lambda x: self._add_workspace_info(project_name, x),
-                version_control_settings["workspace_settings"],
+        version_control_settings = get_settings_cache().get_settings(project_name)
+        self.set_workspaces(
+            list(
+                map(
+                    lambda x: self._add_workspace_info(project_name, x),
+                    version_control_settings["workspace_settings"],
+                )
             )
         )
-        log.debug(f"Workspace {self.workspaces}")
+        log.debug(f"Workspace {[x.name for x in self.workspaces]}")
+
+    def set_workspaces(self, workspaces: typing.List[WorkspaceInfo]) -> None:
+        """
+        Sets the workspaces and indexes them by host, primary status and name,
+        so they are looked up without going through all the workspaces.
+
+        Args:
+            workspaces (List[WorkspaceInfo]): The workspaces of the project.
+        """
+
+        self.workspaces = workspaces
+        self._primary_workspaces = [x for x in workspaces if x.primary]
+        self._host_workspaces: typing.Dict[str, typing.List[WorkspaceInfo]] = {}
+        self._primary_host_workspaces: typing.Dict[str, typing.List[WorkspaceInfo]] = {}
+        self._workspaces_by_name: typing.Dict[str, WorkspaceInfo] = {}
+        for workspace in workspaces:
+            for host in dict.fromkeys(workspace.hosts):
+                self._host_workspaces.setdefault(host, []).append(workspace)
+                if workspace.primary:
+                    self._primary_host_workspaces.setdefault(host, []).append(workspace)
+
+            self._workspaces_by_name.setdefault(workspace.name, workspace)
 
     def _add_workspace_info(self, project_name, settings):
         """
@@ -89,13 +117,64 @@ class ServerWorkspaces:
         """
 
         if not host:
-            return list(filter(lambda x: x.primary, self.workspaces))
+            return list(self._primary_workspaces)
 
         if primary:
-            return list(
-                filter(lambda x: host in x.hosts and x.primary, self.workspaces)
-            )
-        return list(filter(lambda x: host in x.hosts, self.workspaces))
+            return list(self._primary_host_workspaces.get(host, []))
+        return list(self._host_workspaces.get(host, []))
+
+    def get_workspace_by_name(
+        self, workspace_name: str
+    ) -> typing.Union[WorkspaceInfo, None]:
+        """
+        Retrieves the workspace with a given name.
+
+        Args:
+            workspace_name (str): The name of the workspace, as configured in the settings.
+
+        Returns:
+            WorkspaceInfo: The workspace, or None if there is no workspace with that name.
+        """
+
+        return self._workspaces_by_name.get(workspace_name)
+
+
+# project name -> (settings version, workspaces)
+_server_workspaces_cache: typing.Dict[str, typing.Tuple[str, ServerWorkspaces]] = {}
+_server_workspaces_cache_lock = threading.Lock()
+
+
+def get_server_workspaces(project_name: str) -> ServerWorkspaces:
+    """
+    Gets the workspaces of a project, shared by all callers. They are fetched
+    once, and fetched again once the version control settings of the project change.
+    The shared object must not be modified.
+
+    Args:
+        project_name (str): The name of the project to get the workspaces of.
+
+    Returns:
+        ServerWorkspaces: The workspaces of the project.
+    """
+
+    version = get_settings_cache().get_version(project_name)
+    with _server_workspaces_cache_lock:
+        cached = _server_workspaces_cache.get(project_name)
+
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    server_workspaces = ServerWorkspaces(project_name)
+    with _server_workspaces_cache_lock:
+        _server_workspaces_cache[project_name] = (version, server_workspaces)
+
+    return server_workspaces
+
 
-    def get_workspace_by_name(self, workspace_name: str) -> WorkspaceInfo:
-        return list(filter(lambda x: x.name == workspace_name, self.workspaces))[0]
+def invalidate_server_workspaces(project_name: typing.Union[str, None] = None) -> None:
+    """Fetch the workspaces of a project, or of all of them, again on next use."""
+    with _server_workspaces_cache_lock:
+        if project_name is None:
+            _server_workspaces_cache.clear()
+        else:
+            _server_workspaces_cache.pop(project_name, None)
@@ -3,13 +3,46 @@ import typing
 from dataclasses import dataclass, field
 
 from ayon_core.lib.log import Logger
-from ayon_core.pipeline.anatomy.anatomy import Anatomy
-from ayon_core.pipeline.template_data import get_template_data_with_names
 
+from version_control.api.anatomy_cache import get_anatomy_cache
 from version_control.api.exceptions import ConfigurationError
 
 
 log = Logger.get_logger(__name__)
+
+
+class _FormattedField:
+    """
+    Descriptor of a ``WorkspaceInfo`` field holding a template, which is
+    formatted by the ``formatter`` method the first time it is accessed.
+    Setting the field replaces the template.
+    """
+
+    def __init__(self, formatter: str):
+        self._formatter = formatter
+
+    def __set_name__(self, owner, name):
+        self._template_name = f"_{name}_template"
+        self._value_name = f"_{name}"
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            # The default value of the dataclass field:
+            return None
+
+        try:
+            return instance.__dict__[self._value_name]
+        except KeyError:
+            template = instance.__dict__.get(self._template_name)
+            value = getattr(instance, self._formatter)(template)
+            instance.__dict__[self._value_name] = value
+            return value
+
+    def __set__(self, instance, value):
+        instance.__dict__[self._template_name] = value
+        instance.__dict__.pop(self._value_name, None)
+
+
 @dataclass
 class WorkspaceInfo:
     """
@@ -30,7 +63,9 @@ class WorkspaceInfo:
         enable_autosync (bool): If True, the workspace enables automatic synchronization with Perforce.
         project_name (str): The name of the project associated with the workspace.
         startup_files (List[str]): A list of files to start with in the workspace.
-        workspace_name (Optional[str]): The workspace name formatted with placeholders for dynamic values. (default: None)
+        workspace_name (Optional[str]): The workspace name formatted with placeholders for dynamic values,
+            formatted on first access. (default: None)
+        workspace_dir (Optional[str]): The directory of the workspace, formatted from its root on first access. (default: None)
         workspace_root (Optional[str]): The root directory of the workspace formatted with placeholders for dynamic values. (default: None)
         exists (Optional[bool]): Indicates whether the workspace already exists. (default: False)
         username (Optional[str]): The workspace-specific username if different from the server's username. (default: None)
@@ -38,7 +73,6 @@ class WorkspaceInfo:
         template (Optional[str]): The template name used for publishing.
 
     Methods:
-        __post_init__: Post-initialization method to format workspace_name and workspace_root, and check workspace existence.
         _format_workspace_name(str): Helper to populate placeholder for workspace name with dynamic data.
         _workspace_exists: Determines if the workspace exists in Perforce.
         _format_workspace_root(str): Helper to populate placeholder for workspace root directory with relevant project settings.
@@ -60,30 +94,13 @@ class WorkspaceInfo:
     project_name: str
     startup_files: typing.List[str]
     always_sync: typing.List[str]
-    workspace_name: typing.Optional[str] = field(
-        default=None, metadata={"formatter": None}
-    )
-    workspace_dir: typing.Optional[str] = field(
-        default=None, metadata={"formatter": None}
-    )
+    workspace_name: typing.Optional[str] = _FormattedField("_format_workspace_name")
+    workspace_dir: typing.Optional[str] = _FormattedField("_format_workspace_dir")
     template_name: typing.Optional[str] = field(
         default=None, metadata={"formatter": None}
     )
 
-    def __post_init__(self) -> None:
-        """
-        Post-initialization method to format workspace_name and workspace_root, and check workspace existence.
-
-        This method formats the `workspace_name` and `workspace_root` attributes by replacing placeholders
-        with actual dynamic values as retrieved from data sources. It then checks if the workspace exists in Perforce.
-        """
-
-        if self.workspace_name is not None:
-            self.workspace_name = self._format_workspace_name(self.workspace_name)
-        if self.workspace_root is not None:
-            self.workspace_dir = self._format_workspace_dir()
-
-    def _format_workspace_name(self, workspace_name: str) -> str:
+    def _format_workspace_name(self, workspace_name: typing.Optional[str]) -> typing.Optional[str]:
         """
         Helper to populate placeholder for workspace name with dynamic data.
 
@@ -94,6 +111,9 @@ class WorkspaceInfo:
             str: The formatted workspace name.
         """
 
+        if workspace_name is None:
+            return None
+
         import socket
 
         log.debug(f"Workspace Name {workspace_name}")
@@ -106,7 +126,7 @@ class WorkspaceInfo:
 
         return workspace_name.format(**data)
 
-    def _format_workspace_dir(self) -> str:
+    def _format_workspace_dir(self, workspace_dir: typing.Optional[str]) -> typing.Optional[str]:
         """
         Helper to populate placeholder for workspace root directory with relevant project settings.
 
@@ -114,10 +134,15 @@ class WorkspaceInfo:
             workspace_dir (str): The original workspace root directory containing placeholders.
 
         Returns:
-            str: The formatted workspace root directory.
+            str: The formatted workspace root directory, or ``workspace_dir``
+                as is if the workspace has no root.
         """
 
-        anatomy = Anatomy(project_name=self.project_name)
+        if self.workspace_root is None:
+            return workspace_dir
+
+        anatomy_cache = get_anatomy_cache()
+        anatomy = anatomy_cache.get_anatomy(self.project_name)
         try:
             workspace_dir = str(anatomy.roots[self.workspace_root])
         except KeyError as err:
@@ -127,7 +152,7 @@ class WorkspaceInfo:
                 f"Please contact your Administrator."
             )
             raise ConfigurationError(msg) from err
-        data = get_template_data_with_names(self.project_name)
+        data = anatomy_cache.get_template_data(self.project_name)
         data["root"] = anatomy.roots
         data.update(anatomy.roots)
         formatted_workspace_dir = workspace_dir.format(**data)
@@ -1,26 +1,36 @@
-import json
-import os
+import copy
 import pathlib
+import threading
 import typing
+from dataclasses import replace
 
 from ayon_core.lib.log import Logger
 from ayon_core.pipeline.context_tools import get_current_host_name, get_current_project_name
-from ayon_core.settings import get_project_settings
 from ayon_core.tools.utils import qt_app_context
 from qtpy import QtWidgets
 
+from version_control.api.anatomy_cache import get_anatomy_cache
+from version_control.api.credentials import get_credential_store
 from version_control.api.exceptions import LoginError
 from version_control.api.models import (
     ConnectionInfo,
     ServerInfo,
-    ServerWorkspaces,
     WorkspaceInfo,
+    get_server_workspaces,
+    invalidate_server_workspaces,
 )
+from version_control.api.settings_cache import get_settings_cache
 from version_control.rest.perforce.rest_stub import PerforceRestStub
 from version_control.ui.login_window import LoginWindow
 
 log = Logger.get_logger(__name__)
 
+# (project, host, workspace) -> (settings version, workspace, server)
+_connection_cache: typing.Dict[
+    typing.Tuple, typing.Tuple[str, WorkspaceInfo, ServerInfo]
+] = {}
+_connection_cache_lock = threading.Lock()
+
 
 class ConnectionError(Exception):
     pass
@@ -38,6 +48,10 @@ def get_connection_info(
     updates the login credentials if necessary, and returns a ``ConnectionInfo`` object
     containing the necessary details to interact with the version control system.
 
+    The workspace and server are resolved once per project, host and workspace,
+    and resolved again once the version control settings of the project change.
+    The returned workspace and server are copies, the cached ones are never shared.
+
     Args:
         project_name (str): The name of the project.
         configured_workspace (str, optional): Configured workspace for the project. Defaults to None.
@@ -47,13 +61,85 @@ def get_connection_info(
         ConnectionInfo: An object containing the connection information for the specified project.
     """
 
-    current_workspace = get_workspace(project_name, configured_workspace, host)
-    servers = fetch_project_servers(project_name)
+    if not configured_workspace:
+        host = host or get_current_host_name()
+
+    # The host only picks the workspace when none is configured:
+    key = (project_name, None if configured_workspace else host, configured_workspace)
+    version = get_settings_cache().get_version(project_name)
+    with _connection_cache_lock:
+        cached = _connection_cache.get(key)
+
+    if cached is not None and cached[0] == version:
+        _, current_workspace, workspace_server = cached
+    else:
+        current_workspace = get_workspace(project_name, configured_workspace, host)
+        servers = fetch_project_servers(project_name)
+        workspace_server = _find_workspace_server(current_workspace, servers)
+        with _connection_cache_lock:
+            _connection_cache[key] = (
+                version, copy.copy(current_workspace), replace(workspace_server)
+            )
+
+    # A shallow copy keeps the lazily formatted fields of the workspace unformatted:
+    return _login_connection_info(copy.copy(current_workspace), replace(workspace_server))
+
+
+def invalidate_connection_cache(project_name: typing.Union[str, None] = None) -> None:
+    """
+    Resolve the connections of a project, or of all of them, again on next use.
+    Cached connections are also resolved again once the settings of their project change.
+    """
+    with _connection_cache_lock:
+        for key in list(_connection_cache):
+            if project_name is None or key[0] == project_name:
+                del _connection_cache[key]
+
+
+def invalidate_project_caches(project_name: typing.Union[str, None] = None) -> None:
+    """
+    Drop the cached settings, anatomy, workspaces and connections of a project,
+    or of all of them, so they are fetched again on next use.
+    """
+    get_settings_cache().invalidate(project_name)
+    get_anatomy_cache().invalidate(project_name)
+    invalidate_server_workspaces(project_name)
+    invalidate_connection_cache(project_name)
+
+
+def get_workspace_connection_info(
+    current_workspace: WorkspaceInfo, servers: typing.List[ServerInfo]
+) -> ConnectionInfo:
+    """
+    Retrieves the connection information of an already resolved workspace,
+    for example one of the ``ServerWorkspaces`` of a project.
+
+    Args:
+        current_workspace (WorkspaceInfo): The workspace to connect to.
+        servers (List[ServerInfo]): The servers of the workspace's project,
+            see ``fetch_project_servers``.
+
+    Returns:
+        ConnectionInfo: An object containing the connection information for the workspace.
+    """
+
+    workspace_server = _find_workspace_server(current_workspace, servers)
+    return _login_connection_info(current_workspace, workspace_server)
+
+
+def _find_workspace_server(
+    current_workspace: WorkspaceInfo, servers: typing.List[ServerInfo]
+) -> ServerInfo:
     server = current_workspace.server
     workspace_server = [x for x in servers if x.name == server]
     if not workspace_server:
         raise ValueError(f"Unable to find server {server}.")
-    workspace_server = workspace_server[0]
+    return workspace_server[0]
+
+
+def _login_connection_info(
+    current_workspace: WorkspaceInfo, workspace_server: ServerInfo
+) -> typing.Union[ConnectionInfo, None]:
     login = check_login(workspace_server)
     if login:
         if not login.username or not login.password:
@@ -78,8 +164,7 @@ def fetch_project_servers(project_name: str) -> typing.List[ServerInfo]:
     Returns:
         List[ServerInfo]: A list of `ServerInfo` objects representing the servers configured for the project.
     """
-    project_settings = get_project_settings(project_name)
-    version_control_settings = project_settings["version_control"]
+    version_control_settings = get_settings_cache().get_settings(project_name)
     return list(
         map(lambda x: ServerInfo(**x), version_control_settings["servers"])
     )
@@ -105,9 +190,14 @@ def get_workspace(
         None: if not inside a host.
     """
     log.debug(f"Project Name: {project_name}")
-    server_workspaces = ServerWorkspaces(project_name)
+    server_workspaces = get_server_workspaces(project_name)
     if configured_workspace:
-        return server_workspaces.get_workspace_by_name(configured_workspace)
+        current_workspace = server_workspaces.get_workspace_by_name(configured_workspace)
+        if not current_workspace:
+            raise RuntimeError(
+                f"Unable to find workspace {configured_workspace} for {project_name}"
+            )
+        return current_workspace
 
     current_host = host or get_current_host_name()
     current_workspace = None
@@ -117,7 +207,8 @@ def get_workspace(
         workspaces = server_workspaces.get_host_workspaces(
             current_host, primary=True
         )
-        current_workspace = workspaces[0]
+        if workspaces:
+            current_workspace = workspaces[0]
 
     if not current_workspace:
         raise RuntimeError(f"Unable to find workspace for {project_name}")
@@ -154,42 +245,20 @@ def handle_login(conn_info: ConnectionInfo, attempts: int = 3) -> None:
 
 
 def build_credentials(server_info_to_remove: ServerInfo = None):
-    perforce_connection_config = (
-        pathlib.Path(os.environ["APPDATA"]) / "halon" / "perforce_servers.json"
-    )
-    perforce_connection_config.parent.mkdir(parents=True, exist_ok=True)
-
-    if not perforce_connection_config.exists():
-        with perforce_connection_config.open("w") as config_file:
-            config_file.write(json.dumps([]))
-    else:
-        log.debug(f"Perforce Config File: {perforce_connection_config}")
-        if server_info_to_remove:
-            with perforce_connection_config.open("r") as config_file:
-                config = json.load(config_file)
-
-            servers = [ServerInfo(**x) for x in config]
-            if server_info_to_remove in servers:
-                servers.remove(server_info_to_remove)
-                with perforce_connection_config.open("w") as config_file:
-                    json.dump(
-                        list(map(lambda x: x.__dict__, servers)),
-                        config_file,
-                        indent=4,
-                    )
+    credential_store = get_credential_store()
+    credential_store.ensure_file()
+    if server_info_to_remove:
+        credential_store.remove(server_info_to_remove)
 
-    return perforce_connection_config
+    return credential_store.path
 
 
 def check_login(server_info: ServerInfo) -> typing.Union[ServerInfo, None]:
     log.info("Checking Login")
-    perforce_connection_config = build_credentials()
+    credential_store = get_credential_store()
 
-    with perforce_connection_config.open("r") as config_file:
-        config = json.load(config_file)
-
-    servers = [ServerInfo(**x) for x in config]
-    if server_info not in servers:
+    current_server = credential_store.get(server_info.name)
+    if current_server is None:
         with qt_app_context():
             login_window = LoginWindow(server_info.name)
             result = login_window.exec_()  # pyright: ignore[]
@@ -199,28 +268,39 @@ def check_login(server_info: ServerInfo) -> typing.Union[ServerInfo, None]:
                 server_info.username = username
                 server_info.password = password
 
-                servers.append(server_info)
-
-                with perforce_connection_config.open("w") as config_file:
-                    json.dump(
-                        list(map(lambda x: x.__dict__, servers)),
-                        config_file,
-                        indent=4,
-                    )
+                credential_store.set(server_info)
 
                 return server_info
             else:
                 log.info("Login was cancelled")
                 return None
     else:
-        current_server = list(filter(lambda x: server_info == x, servers))[0]
         server_info.username = current_server.username
         server_info.password = current_server.password
         return server_info
 
 
-def workspace_exists(conn_info: ConnectionInfo) -> bool:
-    handle_login(conn_info)
+def get_stored_login(server_info: ServerInfo) -> typing.Union[ServerInfo, None]:
+    """
+    Get the server with the username and password of a previous login,
+    or `None` if there isn't one. Unlike `check_login`, never prompts.
+    """
+    server = get_credential_store().get(server_info.name)
+    if server and server.username and server.password:
+        return ServerInfo(
+            name=server_info.name,
+            host=server_info.host,
+            port=server_info.port,
+            username=server.username,
+            password=server.password,
+        )
+
+    return None
+
+
+def workspace_exists(conn_info: ConnectionInfo, login: bool = True) -> bool:
+    if login:
+        handle_login(conn_info)
 
     return PerforceRestStub.workspace_exists(
         conn_info.workspace_info.workspace_name,
@@ -267,21 +347,44 @@ def sync_to_latest(conn_info: ConnectionInfo) -> None:
 
     handle_login(conn_info)
     PerforceRestStub.sync_latest_version(
-        conn_info.workspace_info.workspace_dir
+        f"{conn_info.workspace_info.workspace_dir}/...", checkpoint=True
     )
 
 
 def sync_target_to_latest(conn_info: ConnectionInfo, target: str) -> None:
     handle_login(conn_info)
     PerforceRestStub.sync_latest_version(
-        pathlib.Path(target).parent.as_posix()
+        f"{pathlib.Path(target).parent.as_posix()}/...", checkpoint=True
     )
 
 
+def sync_paths_to_latest(
+    conn_info: ConnectionInfo,
+    paths: typing.List[str],
+    login: bool = True,
+    checkpoint: bool = False,
+) -> None:
+    """
+    Sync the given files and folders to latest with a single batched call.
+
+    Args:
+        conn_info (ConnectionInfo): The connection of the paths' workspace.
+        paths (List[str]): The local paths of the files and folders to sync.
+        login (bool): Log in first, skip it if this server was just logged in to.
+        checkpoint (bool): Save the progress of a large sync, to resume it if interrupted.
+    """
+    if login:
+        handle_login(conn_info)
+
+    PerforceRestStub.sync_latest_version(paths, checkpoint=checkpoint)
+
+
 def sync_to_version(conn_info: ConnectionInfo, change_id: int) -> None:
     handle_login(conn_info)
     PerforceRestStub.sync_to_version(
-        f"{conn_info.workspace_info.workspace_dir}/...", change_id
+        f"{conn_info.workspace_info.workspace_dir}/...",
+        change_id,
+        checkpoint=True,
     )
 
 
@@ -289,7 +392,7 @@ def get_current_host_connection():
     project = get_current_project_name()
     host = get_current_host_name()
 
-    server_workspaces = ServerWorkspaces(project)
+    server_workspaces = get_server_workspaces(project)
     workspaces = server_workspaces.get_host_workspaces(host, True)
     if not workspaces:
         raise ValueError(f"Unable to get workspaces for {host}")
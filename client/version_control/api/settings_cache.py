@@ -0,0 +1,78 @@
+import copy
+import hashlib
+import json
+import threading
+import time
+import typing
+
+from ayon_core.lib.log import Logger
+from ayon_core.settings import get_project_settings
+
+log = Logger.get_logger(__name__)
+
+
+class SettingsCache:
+    """
+    Process wide cache of the ``version_control`` settings of each project.
+
+    The settings of a project are fetched at most once every ``ttl`` seconds.
+    Each fetch computes a version of the settings, a hash of their content,
+    which only changes when the settings do. Caches built from the settings
+    keep the version they were built with and are rebuilt when it changes.
+
+    Attributes:
+        ttl (float): Seconds before the settings of a project are fetched again.
+    """
+
+    def __init__(self, ttl: float = 60.0):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._projects: typing.Dict[str, typing.Tuple[float, str, dict]] = {}
+
+    def get_settings(self, project_name: str) -> dict:
+        """Get a copy of the ``version_control`` settings of a project."""
+        return copy.deepcopy(self._get(project_name)[1])
+
+    def get_version(self, project_name: str) -> str:
+        """Get the version of the settings of a project."""
+        return self._get(project_name)[0]
+
+    def invalidate(self, project_name: typing.Union[str, None] = None) -> None:
+        """Fetch the settings of a project, or of all of them, on next access."""
+        with self._lock:
+            if project_name is None:
+                self._projects.clear()
+            else:
+                self._projects.pop(project_name, None)
+
+    def _get(self, project_name: str) -> typing.Tuple[str, dict]:
+        with self._lock:
+            cached = self._projects.get(project_name)
+
+        if cached is not None and time.monotonic() - cached[0] < self.ttl:
+            return cached[1], cached[2]
+
+        settings = get_project_settings(project_name)["version_control"]
+        version = hashlib.sha1(
+            json.dumps(settings, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        if cached is not None and cached[1] != version:
+            log.debug(f"Version control settings of {project_name} changed")
+
+        with self._lock:
+            self._projects[project_name] = (time.monotonic(), version, settings)
+
+        return version, settings
+
+
+_settings_cache = None
+_settings_cache_lock = threading.Lock()
+
+
+def get_settings_cache() -> SettingsCache:
+    global _settings_cache
+    with _settings_cache_lock:
+        if _settings_cache is None:
+            _settings_cache = SettingsCache()
+
+    return _settings_cache
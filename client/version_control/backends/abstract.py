@@ -316,14 +316,30 @@ class VersionControl(object):
 
     @staticmethod
     @abc.abstractmethod
-    def sync_latest_version(path):
-        # type: (T_P4PATH) -> bool
+    def sync_latest_version(path, checkpoint=False):
+        # type: (T_P4PATH, bool) -> bool
+        """
+        Sync the given path/paths to their latest version.
+
+        Long lists of files and folders with many files to sync return a
+        result per given path, rather than per synced file: `None` if it
+        isn't on the server, `False` if any of its files failed to sync,
+        else `True`.
+        With `checkpoint`, the progress of such a sync is saved, so an
+        interrupted sync of the same paths is resumed.
+        """
+
         raise NotImplementedError()
 
     @staticmethod
     @abc.abstractmethod
-    def sync_to_version(path, version):
-        # type: (T_P4PATH, int) -> bool
+    def sync_to_version(path, version, checkpoint=False):
+        # type: (T_P4PATH, int, bool) -> bool
+        """
+        Sync the given path/paths to the given version.
+        Returns the same results as `sync_latest_version`.
+        """
+
         raise NotImplementedError()
 
     @staticmethod
@@ -12,19 +12,30 @@ import dataclasses
 import datetime
 import enum
 import functools
+import hashlib
 import inspect
+import itertools
+import math
 import pathlib
+import queue
 from qtpy import QtCore
 import socket
 import sys
 import threading
 import typing
+from . import p4_change_index
 from . import p4_errors
+from . import p4_login_cache
+from . import p4_pool
+from . import p4_stat
+from . import p4_sync
+from . import p4_workspace_cache
+from . import p4_workspace_index
 # from . import p4_offline
 import P4
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from functools import lru_cache
-from types import MethodType
 from ayon_core.lib.log import Logger
 
 log = Logger.get_logger('PerforceBackend')
@@ -33,6 +44,7 @@ _typing = False
 if _typing:
     from typing import Any
     from typing import Callable
+    from concurrent.futures import Future
     from typing import Generator
     from typing import Iterable
     from typing import Iterator
@@ -56,6 +68,14 @@ if _typing:
 
 T_StrTuple = typing.NewType("T_StrTuple", "tuple[str]")
 
+# Lower case texts of the errors of a missing or expired ticket:
+_LOGIN_ERRORS = (
+    "p4passwd",
+    "your session has expired",
+    "please login again",
+    "perforce password",
+)
+
 
 def make_tuple_if_not(value: Any) -> tuple[Any]:
     if not isinstance(value, (tuple, list)):
@@ -129,6 +149,24 @@ class P4ProgressHandler(P4.Progress):
         return P4ProgressSignaller()
 
 
+class P4StatHandler(P4.OutputHandler):
+    """
+    Output handler passing each fstat record to `callback` as it arrives,
+    rather than P4Python collecting them all into the result list.
+    The command is cancelled as soon as `callback` returns False.
+    """
+
+    def __init__(self, callback: Callable[[dict[str, Any]], bool]):
+        super().__init__()
+        self._callback = callback
+
+    def outputStat(self, stat: dict[str, Any]) -> int:
+        if not self._callback(stat):
+            return P4.OutputHandler.CANCEL
+
+        return P4.OutputHandler.HANDLED
+
+
 class P4ConnectionManagerSignaller(QtCore.QObject):
     connected = QtCore.Signal()
     disconnected = QtCore.Signal()
@@ -144,6 +182,51 @@ class P4PathDateData:
         self.date = date
 
 
+@dataclasses.dataclass(frozen=True)
+class P4Session:
+    """
+    The connection settings set by `login`.
+    Each `P4ConnectionManager` is bound to one, see `bind_session`.
+    """
+    port: str
+    user: str
+    password: str
+    client: str
+
+    @property
+    def key(self) -> str:
+        """Identifies the session in the REST api calls, without the password."""
+
+        session_id = "|".join((self.port, self.user, self.password, self.client))
+        return hashlib.sha1(session_id.encode()).hexdigest()
+
+
+class _ConnectMethod:
+    """
+    Descriptor exposing a `_connect_` method of P4ConnectionManager
+    without its prefix.
+
+    The first access on an instance wraps the bound method with
+    `__run_connect__` and stores it on the instance, which then
+    shadows this descriptor for any later access.
+    """
+
+    __slots__ = ("connect_name", "name")
+
+    def __init__(self, connect_name: str):
+        self.connect_name = connect_name
+        self.name = connect_name[len("_connect_"):]
+
+    def __get__(self, instance, owner=None):
+        # type: (P4ConnectionManager | None, type | None) -> Any
+        if instance is None:
+            return self
+
+        method = instance.__run_connect__(getattr(instance, self.connect_name))
+        instance.__dict__[self.name] = method
+        return method
+
+
 class P4ConnectionManager:
     """
     This class is the core of this module.
@@ -156,8 +239,9 @@ class P4ConnectionManager:
     The main mechanism is the handling of methods
     which require a p4 connection.
     Any attribute that both has `_connect_` as a prefix
-    and is a method, will lazily wrap said method with
-    `__run_connect__` and remove the `_connect_` prefix.
+    and is a method, is exposed without the prefix, wrapped with
+    `__run_connect__` the first time it is accessed on an instance.
+    The exposed names are set on the class once, when it is created.
 
     For example: `_connect_sync` will be accessed with `sync`.
 
@@ -167,6 +251,12 @@ class P4ConnectionManager:
     - wrapping of methods is handled lazily, thus is performant.
     - reduced verbosity of calling core method names.
 
+    It is recommended to use the full method name when
+    calling from within the object (include `_connect_` prefix).
+    This avoids unneccesary connection checks, providing a slight
+    performance boost. I.E:
+    `self._connect_checkout` rather than `self.checkout`
+
     The `__run_connect__` wrapper works in conjunction with the
     `__connect__` context manager to automatically manage the
     p4.connect and p4.disconnect functionality.
@@ -178,7 +268,12 @@ class P4ConnectionManager:
     # *** Any method that requires a connection to p4,
     # must be declared with the prefix: `_connect_` ***
 
-    The `__run_connect__` wrapper will also handle workspaces by
+    The `__run_connect__` wrapper will also handle workspaces.
+    Paths are routed straight to the workspaces owning them, using an
+    index of the workspace roots on the host. A batch of paths spanning
+    several workspaces is split, running each workspace's share
+    concurrently on its own connection.
+    Anything the index can't resolve is handled by
     attempting to run the given function in each workspace, returning
     as soon as the function runs successfully.
     The first workspace used will initially be the current workspace
@@ -189,8 +284,60 @@ class P4ConnectionManager:
     `p4.client` be their standard workspace, BUT if it fails, then
     the function will be run on all the other workspaces until it
     either succeeds or there are no workspaces left.
+
+    A manager keeps mutable state between the calls it runs, so each
+    instance serializes its calls with a re-entrant lock.
+    The module level functions use one manager per thread, which lets
+    threads run calls in parallel on their own pooled connections.
+    Each manager is bound to the session it was created with, or last
+    logged in with. The managers of the module level functions are bound
+    to the session of their thread when a function is looked up, see
+    `bind_session`, never to a session read while connecting.
     """
 
+    # The maximum number of connections probing folders in `is_latest`:
+    max_folder_probes: int = 4
+
+    # The maximum number of case variants of the extensions sent as an
+    # fstat `-F` filter by the folder queries, past which they are
+    # only checked as the records come in:
+    max_extension_filters: int = 32
+
+    # The maximum number of connections syncing chunks in `get_latest`:
+    max_sync_connections: int = 4
+
+    # The number of files in each chunk synced by `get_latest`,
+    # which also syncs this many file paths or more in chunks:
+    sync_chunk_files: int = 1000
+
+    # The share of the pool's connections that the chunked syncs of all
+    # the managers may take on top of their own, together:
+    sync_pool_share: float = 0.25
+
+    # Sync checkpoints older than this many seconds are discarded:
+    sync_checkpoint_max_age: float = 24 * 60 * 60
+
+    # Checkpoints of syncs to latest are discarded once the head
+    # changelist is more than this many changes past theirs:
+    sync_checkpoint_max_changes: int = 1000
+
+    # Sync the chunks one at a time with `sync --parallel` instead,
+    # for servers that allow it with `net.parallel.max`:
+    use_parallel_sync: bool = False
+
+    # Limits the rate of the chunked syncs of this manager,
+    # and pauses them between their chunks:
+    sync_throttle: p4_sync.P4SyncThrottle | None = None
+
+    # The queries of `query_stat` and the fstat record test answering each:
+    _stat_queries: dict[str, str] = {
+        "exists_on_server": "_is_stat_on_server",
+        "is_checked_out": "_is_stat_checked_out",
+    }
+
+    # The index of the `path` argument of each `_connect_` method:
+    _path_arg_indices: dict[str, int | None] = {}
+
     # Magic Methods:
     def __init__(
         self,
@@ -198,13 +345,19 @@ class P4ConnectionManager:
         started_fn: Callable[[str, int], None] | None = None,
         total_set_fn: Callable[[int], None] | None = None,
         updated_fn: Callable[[int], None] | None = None,
-        completed_fn: Callable[[str, int], None] | None = None
+        completed_fn: Callable[[str, int], None] | None = None,
+        session: P4Session | None = None,
     ):
 
         super().__init__()
 
+        self._lock = threading.RLock()
+        self._session: P4Session | None = None
+
         self._p4 = None
+        self._p4_lease = None
         self._connection_depth: int = 0
+        self._wait_for_connection = True
         self._host_name: str = ""
 
         self._is_offline = False
@@ -218,10 +371,13 @@ class P4ConnectionManager:
         self._attribute_errors: set[str] = set()
         self._path_existence_errors: set[str] = set()
         self.__workspace_cache__: list[str] = []
-        self.__clients_cache__: dict[str, dict[str, Any]] | None = None
         self._workspace_errors: set[str] = set()
+        self._failed_sync_chunks: list[list[str]] = []
+        if session is not None:
+            self._apply_session(session)
 
         self._signaller = P4ConnectionManagerSignaller()
+        self._progress_handler = None
 
         if not use_progress_hander:
             return
@@ -234,58 +390,58 @@ class P4ConnectionManager:
         )
         self.p4.progress = self._progress_handler
 
-    def __getattribute__(self, attribute_name) -> Any:
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._build_connect_methods()
+
+    @classmethod
+    def _build_connect_methods(cls) -> None:
         """
-        This is a custom handler for attribute access.
+        Expose every method with the `_connect_` prefix without the prefix,
+        as a `_ConnectMethod` that wraps it with `__run_connect__`.
 
-        It allows methods that need wrapping with
-        `__run_connect__` to be wrapped when first called.
-        The alternative was for `__run_connect__` to exist
-        outside of P4ConnectionManager, which seemed janky.
+        This is done once per class rather than on attribute access, so
+        looking up any other attribute costs no more than normal.
+        Existing attributes are never replaced.
 
-        A method with the prefix `_connect_` will be wrapped
-        with `__run_connect__` when first called and then assigned
-        back to the instance without the `_connect_` prefix.
-        This provides lazy creation and exposure of core methods.
-        For example:
-        This will expose the wrapped version of: `_connect_checkout`,
-        saving it as an attribute on the `P4ConnectionManager`
-        instance, to provide a quicker look up if accessed again:
+        The index of the `path` argument of each of these methods is
+        stored in `_path_arg_indices` at the same time, so that
+        `__run_connect__` never needs to inspect their signatures.
+        """
 
-        ```
-        cm = P4ConnectionManager()
-        cm.checkout
-        ```
+        path_arg_indices = {}  # type: dict[str, int | None]
+        for attribute_name in dir(cls):
+            if not attribute_name.startswith("_connect_"):
+                continue
 
-        It is recommended to use the full method name when
-        calling from within the object (include `_connect_` prefix).
-        This avoids unneccesary connection checks, providing a slight
-        performance boost. I.E:
-        `self._connect_checkout` rather than `self.checkout`
-        """
-        try:
-            attribute = object.__getattribute__(self, attribute_name)
-            return attribute
+            function = getattr(cls, attribute_name)
+            if not inspect.isfunction(function):
+                continue
 
-        except AttributeError:
-            attribute_name = f"_connect_{attribute_name}"
-            try:
-                attribute = object.__getattribute__(self, attribute_name)
-                if isinstance(attribute, MethodType):
-                    __run_connect__ = object.__getattribute__(self, "__run_connect__")
-                    attribute = __run_connect__(attribute)
-                    object.__setattr__(self, attribute_name.replace("_connect_", ""), attribute)
+            path_arg_indices[attribute_name] = cls._get_path_index_from_args(function)
+            name = attribute_name[len("_connect_"):]
+            existing = inspect.getattr_static(cls, name, None)
+            if existing is not None and not isinstance(existing, _ConnectMethod):
+                continue
 
-                return attribute
+            setattr(cls, name, _ConnectMethod(attribute_name))
 
-            except AttributeError:
-                _attribute_name = attribute_name.replace("_connect_", "")
-                class_name = object.__getattribute__(self, "__class__").__name__
-                raise AttributeError(f"{class_name} has no attribute: {_attribute_name}")
+        cls._path_arg_indices = path_arg_indices
 
     # Properties:
     @property
     def p4(self) -> P4.P4:
+        """
+        The pooled connection while connected, otherwise the
+        unconnected instance holding the port, user and client settings.
+        """
+        if self._p4_lease is not None:
+            return self._p4_lease
+
+        return self._p4_settings
+
+    @property
+    def _p4_settings(self) -> P4.P4:
         if self._p4 is None:
             self._p4 = P4.P4()
         return self._p4
@@ -311,22 +467,37 @@ class P4ConnectionManager:
             # self._offline_manager = p4_offline.P4ConnectionManager()
         return self._offline_manager
 
+    @property
+    def _workspace_cache_key(self) -> str:
+        return p4_workspace_cache.P4WorkspaceCache.make_key(
+            self.p4.port, self.p4.user, self.host_name
+        )
+
+    @property
+    def _change_index_key(self) -> str:
+        return p4_change_index.P4ChangeListIndex.make_key(
+            self.p4.port, self.p4.user, self.p4.client
+        )
+
     @property
     def _clients_cache(self) -> dict[str, dict[str, Any]]:
-        if self.__clients_cache__ is None:
-            host_name = self.host_name.lower()
-            self.__clients_cache__ = {
-                client["client"]: client
-                for client in self.p4.run_clients("--me")
-                if client["Host"].lower() == host_name
-            }
+        """
+        The client specs of the workspaces on this host.
+        These are shared between managers and only queried
+        again once the workspace cache's ttl has passed.
+        """
+
+        cache = p4_workspace_cache.get_workspace_cache()
+        clients = cache.get_clients(self._workspace_cache_key)
+        if clients is None:
+            clients = self._query_clients()
 
-        return self.__clients_cache__
+        return clients
 
     @property
     def _workspace_cache(self):
         if not self.__workspace_cache__:
-            self.__workspace_cache__ = self._connect_get_workspaces()
+            self.__workspace_cache__ = self._get_cached_workspaces()
 
         return self.__workspace_cache__
 
@@ -335,42 +506,108 @@ class P4ConnectionManager:
     def __connect__(self) -> Generator[P4.P4 | None, None, None]:
         """
         Context manager that connects to if not already connected p4,
-        yielding the instance of p4 and closing the connection when done.
+        yielding the instance of p4 and returning the connection
+        to the pool when done.
         """
 
-        if self._is_offline:
-            if not self._retry_p4_connection:
-                yield
-                return
+        with self._lock:
+            if self._is_offline:
+                if not self._retry_p4_connection:
+                    yield
+                    return
+
+            if self._p4_lease is None:
+                try:
+                    self._acquire_connection()
+                    if self._is_offline:
+                        self._signaller.connected.emit()
+                        self._is_offline = False
+                except p4_errors.P4ServerConnectionError as error:
+                    # The pool is exhausted rather than the server being
+                    # unreachable, so stay online and let the caller retry:
+                    if self._wait_for_connection:
+                        log.warning(f"No free P4 connection: {error}")
+
+                    raise
 
-        if not self.p4.connected():
+                except Exception as error:
+                    if not self._is_p4_exception(error):
+                        raise
+
+                    if "[P4.connect()] Connect to server failed; check $P4PORT" not in str(error):
+                        raise
+
+                    self._is_offline = True
+                    self._signaller.disconnected.emit()
+                    self._start_retry_p4_connection_timer()
+                    yield
+                    return
+
+            self._connection_depth += 1
             try:
-                self.p4.connect()
-                if self._is_offline:
-                    self._signaller.connected.emit()
-                    self._is_offline = False
+                yield self.p4
+                if self._connection_depth == 1:
+                    self._process_errors()
+                    self._process_warnings()
             except Exception as error:
-                if not self._is_p4_exception(error):
-                    raise
+                if self._is_p4_exception(error) and self._is_login_error(str(error)):
+                    self._invalidate_login()
 
-                if "[P4.connect()] Connect to server failed; check $P4PORT" not in str(error):
-                    raise
+                raise
+            finally:
+                self._connection_depth -= 1
+                if self._connection_depth == 0:
+                    if any(self._is_login_error(error) for error in self.p4.errors):
+                        self._invalidate_login()
 
-                self._is_offline = True
-                self._signaller.disconnected.emit()
-                self._start_retry_p4_connection_timer()
-                yield
-                return
+                    self._clear_errors()
+                    self._release_connection()
+
+    def _acquire_connection(self) -> None:
+        """
+        Lease an open connection from the pool, using the port, user
+        and client set on the unconnected `p4` instance.
+        Connections are returned to the pool rather than disconnected,
+        so repeated calls skip the connect and login handshake.
+        """
+
+        settings = self._p4_settings
+        lease = p4_pool.get_connection_pool().acquire(
+            settings.port,
+            settings.user,
+            password=settings.password or None,
+            client=settings.client,
+            wait=self._wait_for_connection,
+        )
+        if self._progress_handler is not None:
+            lease.progress = self._progress_handler
+
+        self._p4_lease = lease
+
+    def _apply_session(self, session: P4Session | None) -> None:
+        if session is None or session is self._session:
+            return
+
+        settings = self._p4_settings
+        if (settings.port, settings.user) != (session.port, session.user):
+            self.__workspace_cache__ = []
+
+        settings.port = session.port
+        settings.user = session.user
+        settings.password = session.password
+        settings.client = session.client
+        self._session = session
+
+    def _release_connection(self) -> None:
+        lease = self._p4_lease
+        if lease is None:
+            return
+
+        self._p4_lease = None
+        if self._progress_handler is not None:
+            lease.progress = None
 
-        self._connection_depth += 1
-        yield self.p4
-        self._connection_depth -= 1
-        if self._connection_depth == 0:
-            self.__clients_cache__ = None
-            self._process_errors()
-            self._process_warnings()
-            self.p4.disconnect()
-            self._clear_errors()
+        p4_pool.get_connection_pool().release(lease)
 
     def __run_connect__(self, function):
         # type: (Callable[..., Any]) -> Callable[..., Any]
@@ -393,6 +630,11 @@ class P4ConnectionManager:
 
         @functools.wraps(function)
         def _connect(*args, **kwargs):
+            # type: (Any, Any) -> Any
+            with self._lock:
+                return _run_connect(*args, **kwargs)
+
+        def _run_connect(*args, **kwargs):
             # type: (Any, Any) -> Any
             workspace_override = None
             args_info = self._get_path_arg_info(function, args) if args else (None, False)
@@ -406,13 +648,19 @@ class P4ConnectionManager:
                     )
                 else:
                     self._update_workspace_cache(workspace_override or self.p4.client)
-                    for workspace in self._workspace_cache:
-                        with self.workspace_as(workspace):
-                            self.__run_function__(
-                                function, paths, workspace, compile_result, args, kwargs
-                            )
-                            if self._break_run_loop:
-                                break
+                    groups = self._group_paths_by_workspace(paths) if paths else None
+                    if groups:
+                        self.__run_function_routed__(
+                            function, paths, groups, compile_result, args, kwargs
+                        )
+                    else:
+                        for workspace in self._workspace_cache:
+                            with self.workspace_as(workspace):
+                                self.__run_function__(
+                                    function, paths, workspace, compile_result, args, kwargs
+                                )
+                                if self._break_run_loop:
+                                    break
 
             if compile_result:
                 return self.result
@@ -431,13 +679,15 @@ class P4ConnectionManager:
 
         return _connect
 
-    def __run_function__(self, function, paths, workspace, compile_result, args, kwargs):
-        # type: (Callable[..., Any], tuple[str, ...] | None, str, bool, tuple[Any], dict[str, Any]) -> None
+    def __run_function__(
+        self, function, paths, workspace, compile_result, args, kwargs, check_paths=True
+    ):
+        # type: (Callable[..., Any], tuple[str, ...] | None, str, bool, tuple[Any], dict[str, Any], bool) -> None  # noqa
         self.result = None
         self._break_run_loop = False
         self._run_successfully = False
         try:
-            if paths and not self._are_paths_valid(paths, workspace):
+            if check_paths and paths and not self._are_paths_valid(paths, workspace):
                 return
 
             is_get_stat = function == self._connect_get_stat
@@ -479,6 +729,181 @@ class P4ConnectionManager:
 
         return
 
+    def __run_function_routed__(self, function, paths, groups, compile_result, args, kwargs):
+        # type: (Callable[..., Any], tuple[str, ...], dict[str, list[int]], bool, tuple[Any], dict[str, Any]) -> None  # noqa
+        """
+        Run the function once in each workspace that owns some of the paths,
+        as resolved by the workspace index, rather than trying every workspace.
+
+        A batch split over several workspaces runs its first group on this
+        manager's connection and the other groups concurrently, each on a
+        separate manager and pooled connection. The results are merged
+        back into the order of `paths`.
+
+        This manager keeps its connection for the whole call, so the group
+        managers don't wait for one: a group that hasn't started or can't
+        get a connection straight away runs on this manager's connection
+        once the first group is done, and a full pool never deadlocks.
+        """
+
+        group_items = [
+            (workspace, indices, tuple(paths[index] for index in indices))
+            for workspace, indices in groups.items()
+        ]
+        futures: list[tuple[str, list[int], tuple[str, ...], Future[tuple[Any, bool]]]] = []
+        if len(group_items) > 1:
+            executor = _get_group_executor()
+            for workspace, indices, group_paths in group_items[1:]:
+                manager = self._create_group_manager()
+                manager._wait_for_connection = False
+                future = executor.submit(
+                    manager._run_group,
+                    function.__name__,
+                    group_paths,
+                    workspace,
+                    compile_result,
+                    (group_paths, *args[1:]),
+                    kwargs,
+                )
+                futures.append((workspace, indices, group_paths, future))
+
+        workspace, indices, group_paths = group_items[0]
+        result, run_successfully = self._run_group_here(
+            function, group_paths, workspace, compile_result, args, kwargs
+        )
+        if not futures:
+            return
+
+        group_results = [(indices, result)]  # type: list[tuple[list[int], Any]]
+        for workspace, indices, group_paths, future in futures:
+            group_result = None  # type: tuple[Any, bool] | None
+            if not future.cancel():
+                try:
+                    group_result = future.result()
+                except p4_errors.P4ServerConnectionError:
+                    log.debug(f"No free connection for the paths in {workspace}")
+
+            if group_result is None:
+                group_result = self._run_group_here(
+                    function, group_paths, workspace, compile_result, args, kwargs
+                )
+
+            result, _run_successfully = group_result
+            run_successfully = run_successfully and _run_successfully
+            group_results.append((indices, result))
+
+        self.result = self._merge_results(paths, group_results)
+        self._run_successfully = run_successfully
+        self._break_run_loop = True
+
+    def _run_group_here(self, function, paths, workspace, compile_result, args, kwargs):
+        # type: (Callable[..., Any], tuple[str, ...], str, bool, tuple[Any], dict[str, Any]) -> tuple[Any, bool]
+        """
+        Run `function` for a group of paths owned by `workspace` on this
+        manager's connection, returning its result and if it succeeded.
+        """
+
+        with self.workspace_as(workspace):
+            self.__run_function__(
+                function,
+                paths,
+                workspace,
+                compile_result,
+                (paths, *args[1:]),
+                kwargs,
+                check_paths=False,
+            )
+
+        return self.result, self._run_successfully
+
+    def _create_group_manager(self) -> P4ConnectionManager:
+        """
+        Create a manager with the same connection settings as this one,
+        to run part of a path batch on its own connection.
+        """
+
+        manager = P4ConnectionManager(session=self._session)
+        manager._host_name = self._host_name
+        settings = self._p4_settings
+        manager_settings = manager._p4_settings
+        manager_settings.port = settings.port
+        manager_settings.user = settings.user
+        manager_settings.password = settings.password
+        manager_settings.client = settings.client
+        return manager
+
+    def _run_group(self, function_name, paths, workspace, compile_result, args, kwargs):
+        # type: (str, tuple[str, ...], str, bool, tuple[Any], dict[str, Any]) -> tuple[Any, bool]
+        """
+        Run the `_connect_` method `function_name` for a group of paths
+        owned by `workspace`, returning its result and if it succeeded.
+        """
+
+        with self._lock, self.__connect__():
+            if self._is_offline:
+                return None, False
+
+            function = getattr(self, function_name)
+            with self.workspace_as(workspace):
+                self.__run_function__(
+                    function, paths, workspace, compile_result, args, kwargs, check_paths=False
+                )
+
+            return self.result, self._run_successfully
+
+    def _run_in_workspace(self, workspace, function, *args):
+        # type: (str, Callable[..., Any], Any) -> Any
+        """
+        Connect and call `function` with this manager and `args` in `workspace`.
+        Used to run work for another manager on this manager's connection.
+        """
+
+        with self._lock, self.__connect__():
+            if self._is_offline:
+                return None
+
+            with self.workspace_as(workspace):
+                return function(self, *args)
+
+    def _fan_out(self, work, count):
+        # type: (Callable[[P4ConnectionManager], None], int) -> None
+        """
+        Call `work` with this manager along with up to `count - 1` group
+        managers, each on its own connection, in the current workspace.
+        `work` must take its items from a queue shared by all the calls,
+        so this manager alone can get through all of them.
+
+        The group managers run on the fan out executor, never on the
+        group executor this may be called from, and those that haven't
+        started once this manager is done are cancelled rather than
+        waited for, so a fan out never blocks on queued work.
+        They don't wait for a connection either, a group manager that
+        can't get one straight away leaves its share to the others.
+        """
+
+        executor = _get_fan_out_executor()
+        workspace = self.p4.client
+        futures: list[Future[Any]] = []
+        for _ in range(count - 1):
+            manager = self._create_group_manager()
+            manager._wait_for_connection = False
+            futures.append(executor.submit(manager._run_in_workspace, workspace, work))
+
+        try:
+            work(self)
+        finally:
+            for future in futures:
+                future.cancel()
+
+        for future in futures:
+            if future.cancelled():
+                continue
+
+            try:
+                future.result()
+            except p4_errors.P4ServerConnectionError:
+                log.debug("No free connection to help with a fan out")
+
     def __run_function_offline__(self, function, paths, compile_result, args, kwargs):
         # type: (Callable[..., Any], tuple[str, ...] | None, bool, tuple[Any], dict[str, Any]) -> None
         self.result = None
@@ -556,6 +981,67 @@ class P4ConnectionManager:
 
         return False
 
+    @staticmethod
+    def _is_stat_on_server(data: dict[str, Any]) -> bool:
+        """Test if the file of the given fstat data exists on the server."""
+
+        return "depotFile" in data
+
+    @staticmethod
+    def _is_stat_checked_out(data: dict[str, Any]) -> bool | None:
+        """
+        Test if the file of the given fstat data is opened for edit or add,
+        by anyone. Files that aren't on the server, or are deleted at
+        head, are `None`.
+        """
+
+        if not data or data.get("headAction") == "delete":
+            return None
+
+        for key in ("otherAction", "action"):
+            if key not in data:
+                continue
+
+            value = data[key]
+            if isinstance(value, list):
+                value = value[0]
+
+            return value in ("edit", "add")
+
+        return False
+
+    @staticmethod
+    def _is_stat_latest(data: dict[str, Any]) -> bool | None:
+        """
+        Test if the file of the given fstat data is at the head revision.
+        Files opened for add or edit count as latest, as they can't be synced.
+        """
+
+        if not data:
+            return None
+        if "action" in data and data["action"] in {"add", "move/add", "edit"}:
+            return True
+        if "headRev" not in data:
+            return False
+        if "haveRev" not in data:
+            return False
+
+        return data["headRev"] == data["haveRev"]
+
+    @staticmethod
+    def _is_stat_exclusive_to_other(data: dict[str, Any]) -> bool:
+        """
+        Test if the file of the given fstat data has the exclusive open
+        (`+l`) modifier and is opened by another user or workspace,
+        which means it can't be opened for edit.
+        """
+
+        if "action" in data or "otherOpen" not in data:
+            return False
+
+        _, _, modifiers = data.get("headType", "").partition("+")
+        return "l" in modifiers
+
     @staticmethod
     def _compile_result(compile_result, paths, result):
         # type: (bool, tuple[str] | None, Any | None) -> Any
@@ -564,6 +1050,60 @@ class P4ConnectionManager:
 
         return result
 
+    @staticmethod
+    def _merge_results(paths, group_results):
+        # type: (tuple[str, ...], list[tuple[list[int], Any]]) -> Any
+        """
+        Merge the results of a path batch that was run in several workspaces.
+
+        Compiled results are dicts keyed by path and are merged by key,
+        in the order of `paths`, results with one item per path are put
+        back at the index of their path.
+        Groups that failed have no result and leave their paths out, or `None`.
+        """
+
+        path_count = len(paths)
+
+        group_count = len(group_results)
+        group_results = [
+            (indices, result) for indices, result in group_results if result is not None
+        ]
+        results = [result for _, result in group_results]
+        if not results:
+            return None
+
+        if all(isinstance(result, dict) for result in results):
+            merged = {}  # type: dict[str, Any]
+            for result in results:
+                merged.update(result)
+
+            ordered = {}  # type: dict[str, Any]
+            for path in paths:
+                key = path.replace("\\...", "")
+                if key in merged:
+                    ordered[key] = merged.pop(key)
+
+            # Keys that aren't paths of the batch keep their group's order:
+            ordered.update(merged)
+            return ordered
+
+        if all(isinstance(result, bool) for result in results):
+            # A group that failed has no result, so the batch failed:
+            return len(results) == group_count and all(results)
+
+        if all(isinstance(result, (list, tuple)) for result in results):
+            if all(len(result) == len(indices) for indices, result in group_results):
+                ordered = [None] * path_count  # type: list[Any]
+                for indices, result in group_results:
+                    for index, item in zip(indices, result):
+                        ordered[index] = item
+
+                return ordered
+
+            return [item for result in results for item in result]
+
+        return results
+
     def _get_clean_p4_paths(self, paths: Iterable[str]):
         valid_paths = self._get_valid_path_objects(paths)
         return self._get_correct_p4_paths(valid_paths)
@@ -599,9 +1139,29 @@ class P4ConnectionManager:
 
         return False
 
-    @lru_cache(maxsize=64)
+    def _query_clients(self) -> dict[str, dict[str, Any]]:
+        """
+        Query the client specs of the workspaces on this host,
+        storing them in the workspace cache.
+        """
+
+        host_name = self.host_name.lower()
+        clients = {
+            client["client"]: client
+            for client in self.p4.run_clients("--me")
+            if client["Host"].lower() == host_name
+        }
+        p4_workspace_cache.get_workspace_cache().set_clients(
+            self._workspace_cache_key, clients
+        )
+        return clients
+
     def _get_workspace_roots(self, workspace: str) -> tuple[str, str]:
-        """Get the roots of the given workspace"""
+        """
+        Get the roots of the given workspace.
+        The depot root costs a `p4 where`, so both are cached
+        until the `Root` of the workspace changes.
+        """
 
         if workspace not in self._clients_cache:
             # @sharkmob-shea.richardson:
@@ -617,12 +1177,20 @@ class P4ConnectionManager:
             f"'Root' not found for workspace: '{workspace}'' - it is likely a dead!:\n{client}"
         )
         client_root = client["Root"]
+        cache = p4_workspace_cache.get_workspace_cache()
+        key = self._workspace_cache_key
+        roots = cache.get_roots(key, workspace, client_root)
+        if roots is not None:
+            return roots
+
         server_info = self._connect_get_path_info([f"{client_root}\\..."])[0]
         server_root = server_info["depotFile"].rstrip("...")
-        return (
+        roots = (
             str(pathlib.Path(client_root)).lower(),
             str(pathlib.Path(server_root)).lower()
         )
+        cache.set_roots(key, workspace, client_root, roots)
+        return roots
 
     @lru_cache(maxsize=64)
     def _is_path_under_root(
@@ -650,39 +1218,73 @@ class P4ConnectionManager:
 
     @lru_cache(maxsize=64)
     def _is_path_under_any_root(self, path: Union[str, pathlib.Path]):
+        with self.__connect__():
+            return self._get_workspace_index().resolve(str(path)) is not None
+
+    def _get_workspace_index(self) -> p4_workspace_index.P4WorkspaceIndex:
+        """
+        Get the index of the client and depot roots of the workspaces on
+        this host, building it if the workspace cache has none yet.
+        Building it resolves the roots of every workspace once, which
+        are then cached with the workspace specs.
+        """
+
+        cache = p4_workspace_cache.get_workspace_cache()
+        key = self._workspace_cache_key
+        index = cache.get_index(key)
+        if index is not None:
+            return index
+
+        index = p4_workspace_index.P4WorkspaceIndex()
         for workspace in self._workspace_cache:
-            with self.workspace_as(workspace):
-                client_root, server_root = self._get_workspace_roots(workspace)
-                if self._is_path_under_root(path, client_root, server_root):
-                    return True
-        return False
+            try:
+                with self.workspace_as(workspace):
+                    client_root, server_root = self._get_workspace_roots(workspace)
+            except Exception as error:
+                if not self._is_p4_exception(error):
+                    raise
+
+                log.debug(f"Failed to index the roots of workspace '{workspace}': {error}")
+                continue
+
+            index.add(workspace, client_root, server_root)
+
+        cache.set_index(key, index)
+        return index
+
+    def _group_paths_by_workspace(self, paths):
+        # type: (tuple[str, ...]) -> dict[str, list[int]] | None
+        """
+        Group the indices of the paths by the workspace owning them.
+        Returns `None` if any path is not under a known workspace root,
+        leaving the batch to be tried in each workspace instead.
+        """
 
-    @functools.lru_cache(maxsize=64)
-    def _args_has_path_or_workspace(self, signature):
-        # type: (inspect.Signature) -> bool
+        index = self._get_workspace_index()
+        groups, unresolved = index.group_paths(paths, preferred=self._workspace_cache)
+        if unresolved:
+            return None
+
+        return groups
+
+    @staticmethod
+    def _get_path_index_from_args(function):
+        # type: (Callable[..., Any]) -> int | None
         """
-        Test if the function to be wrapped has an argument
-        called `path`, returning True if so and False if not.
+        Get the index of the `path` argument of the given function,
+        excluding `self`, or `None` if it has no `path` argument.
         This will determine if path pre processing functions
         should be run on the functions args or not.
-
-        This is cached to provide the best possible performance.
         """
 
-        if "path" not in signature.parameters and "workspace" not in signature.parameters:
-            return False
-
-        return True
+        arg_names = tuple(inspect.signature(function).parameters)
+        if arg_names and arg_names[0] == "self":
+            arg_names = arg_names[1:]
 
-    @functools.lru_cache(maxsize=64)
-    def _get_path_index_from_args(self, signature):
-        # type: (inspect.Signature) -> int | None
-        arg_names = tuple(signature.parameters)
-        path_index = None
-        if "path" in arg_names:
-            path_index = arg_names.index("path")
+        if "path" not in arg_names:
+            return None
 
-        return path_index
+        return arg_names.index("path")
 
     def _set_retry_p4_connection(self, value: bool):
         self._retry_p4_connection = value
@@ -714,13 +1316,15 @@ class P4ConnectionManager:
 
     def _get_path_arg_info(self, function, args):
         # type: (Callable[..., Any], tuple[Any, ...]) -> tuple[tuple[str] | None, bool]
-        signature = inspect.signature(function)
-        compile_result = False
-        if not self._args_has_path_or_workspace(signature):
-            return None, compile_result
+        function_name = function.__name__
+        path_arg_indices = self._path_arg_indices
+        if function_name in path_arg_indices:
+            path_index = path_arg_indices[function_name]
+        else:
+            path_index = self._get_path_index_from_args(function)
 
+        compile_result = False
         path = None   # type: tuple[str] | None
-        path_index = self._get_path_index_from_args(signature)
         if path_index is not None:
             _path = args[path_index]
             compile_result = isinstance(_path, (list, tuple))
@@ -739,6 +1343,23 @@ class P4ConnectionManager:
         """
         return type(error).__name__ == "P4Exception"
 
+    def _is_login_error(self, error):
+        # type: (str) -> bool
+        """If the error is the server asking to log in again."""
+
+        error = error.lower()
+        return any(text in error for text in _LOGIN_ERRORS)
+
+    def _invalidate_login(self) -> None:
+        """
+        Drop the session from the login cache, so the next `login`
+        checks the ticket again rather than trusting the cache.
+        """
+
+        if self._session is not None:
+            log.debug("The P4 ticket is no longer valid")
+            p4_login_cache.get_login_cache().invalidate(self._session)
+
     def _clear_errors(self) -> None:
         self._attribute_errors.clear()
         self._workspace_errors.clear()
@@ -958,27 +1579,70 @@ class P4ConnectionManager:
         """Connects from values in Settings
 
         Override P4CONFIG values.
+
+        Logging in with a session that is in the login cache returns
+        straight away, whichever session logged in last. Once expired,
+        or after the server rejected its ticket, the ticket is checked
+        with `login -s` and only logs in again if it is no longer valid.
+
+        Returns the key of the session, which binds later calls
+        to it with `get_session` and `bind_session`.
         """
-        conn_manager = _get_connection_manager()
         log.debug("Connecting to P4...")
         log.debug(f"{host}:{port}")
 
-        if not conn_manager.p4.port == f"{host}:{port}":
-            conn_manager.p4.port = f"{host}:{port}"
+        if not workspace_name and workspace_dir:
+            workspace_name = os.path.basename(workspace_dir)
 
-        if conn_manager.p4.user != username:
-            conn_manager.p4.user = username
-            conn_manager.p4.password = password
-            conn_manager.p4.port = f"{host}:{port}"
+        session = P4Session(
+            port=f"{host}:{port}",
+            user=username,
+            password=password,
+            client=workspace_name or self._p4_settings.client,
+        )
+        _set_session(session)
+
+        login_cache = p4_login_cache.get_login_cache()
+        with self._lock:
+            is_same_session = session == self._session
+            self._apply_session(session)
+            if login_cache.is_valid(session):
+                if not is_same_session:
+                    # The workspaces of the session are still in the
+                    # workspace cache, only this manager's copy is stale:
+                    self.__workspace_cache__ = []
+                    self._is_path_under_any_root.cache_clear()
+
+                log.debug("Reusing a validated login session")
+                return session.key
 
-        log.debug(conn_manager.p4.port)
-        conn_manager.p4.connect()
-        conn_manager.p4.run_login(password=password)
-        if not workspace_name and workspace_dir:
-            conn_manager.p4.client = os.path.basename(workspace_dir)
-        elif workspace_name:
-            conn_manager.p4.client = workspace_name
-        conn_manager.__workspace_cache__ = self._connect_get_workspaces()
+            with self.__connect__():
+                # A new pooled connection has already logged in with
+                # this password, so only log in again if the ticket of
+                # a reused connection is no longer valid:
+                pool = p4_pool.get_connection_pool()
+                logged_in = pool.login(self.p4, password)
+                if not logged_in and not self._is_ticket_valid():
+                    logged_in = pool.login(self.p4, password, force=True)
+
+                if logged_in or not is_same_session:
+                    self.invalidate_workspace_cache()
+                    self.__workspace_cache__ = self._get_cached_workspaces()
+
+                login_cache.set_valid(session)
+
+            return session.key
+
+    def _is_ticket_valid(self) -> bool:
+        try:
+            self.p4.run_login("-s")
+        except Exception as error:
+            if not self._is_p4_exception(error):
+                raise
+
+            return False
+
+        return True
 
     # Connect Methods:
     def _connect_add(
@@ -1094,17 +1758,37 @@ class P4ConnectionManager:
         Checkout the given file(s).
         """
 
-        stat = self._connect_get_stat(path)
-        path = tuple((_stat["depotFile"] for _stat in stat if _stat))
-
-        result = self._connect_is_latest(path)
-        paths_to_sync = [path for path, is_latest in zip(path, result) if is_latest is False]
+        # A single fstat tells us which files are out of date, which are
+        # already opened and which are exclusively opened by someone else,
+        # so there is no need to query the server again before editing:
+        stat = [data for data in self._connect_get_stat(path) if data]
+        exclusive_paths = [
+            data["depotFile"] for data in stat if self._is_stat_exclusive_to_other(data)
+        ]
+        stat = [data for data in stat if data["depotFile"] not in exclusive_paths]
+        path = tuple((data["depotFile"] for data in stat))
+
+        paths_to_sync = [data["depotFile"] for data in stat if self._is_stat_latest(data) is False]
         if paths_to_sync:
-            self._connect_sync(paths_to_sync)
+            self._connect_get_latest(paths_to_sync)
+
+        edit_args = []  # type: list[str]
+        if change_description and path:
+            change_number = self._get_change_number_for_description(change_description)
+            edit_args = ["-c", change_number]
+
+            # `edit -c` won't move files that are already opened:
+            paths_to_reopen = [
+                data["depotFile"]
+                for data in stat
+                if "action" in data and data.get("change") != change_number
+            ]
+            if paths_to_reopen:
+                self.p4.run_reopen(edit_args, paths_to_reopen)
 
-        edit_result = self.p4.run_edit(path)
-        if change_description:
-            self._connect_create_change_list(change_description, files=path)
+        edit_result = self.p4.run_edit(edit_args, path) if path else []
+        if exclusive_paths:
+            raise p4_errors.P4ExclusiveCheckoutError(exclusive_paths)
 
         _result = self._process_result(
             edit_result,
@@ -1198,6 +1882,7 @@ class P4ConnectionManager:
 
         change_dict["Description"] = description
         save_change_result = self.p4.save_change(change_dict)
+        self._index_created_change(save_change_result, description)
         result = self._process_result(
             save_change_result, "", "", true_pattern="created."
         )
@@ -1230,22 +1915,70 @@ class P4ConnectionManager:
         # returns list as _process_result_ breaks dictionary
         return change_list
 
+    def _get_change_number_for_description(self, description: str) -> str:
+        """
+        Get the number of the pending change list with the given description,
+        creating an empty one if it doesn't exist yet.
+        """
+
+        try:
+            change_dict = self._connect_get_existing_change_list(description)
+        except P4.P4Exception:
+            change_dict = None
+
+        if change_dict:
+            return change_dict["Change"]
+
+        change_dict = self.p4.fetch_change()
+        if not change_dict:
+            raise P4.P4Exception("Failed to create a new change list")
+
+        change_dict["Description"] = description
+        change_dict["Files"] = []
+        save_change_result = self.p4.save_change(change_dict)
+        change = self._index_created_change(save_change_result, description)
+        if change is None:
+            raise P4.P4Exception(f"Failed to create a change list: {save_change_result}")
+
+        return change
+
+    def _index_created_change(self, save_change_result, description):
+        # type: (list[str], str) -> str | None
+        """
+        Add a change list to the change list index if `save_change` created it,
+        returning its number.
+        """
+
+        for line in save_change_result:
+            # Formatted as: "Change <number> created."
+            if isinstance(line, str) and line.startswith("Change ") and "created" in line:
+                change = line.split()[1]
+                p4_change_index.get_change_list_index().add(
+                    self._change_index_key, description, change
+                )
+                return change
+
+        return None
+
     def _connect_get_change_list_number(self, description: str):
         change_dict = self._connect_get_existing_change_list(description)
         if not change_dict:
             return
 
-        return change_dict["change"]
+        return change_dict["Change"]
 
     def create_workspace(self, name: str, root: str, stream: str, options: str):
-        client = self.p4.fetch_client()
-        client["Client"] = name
-        client["Root"] = root
-        client["Stream"] = stream
-        client["Options"] = options
-        log.debug('Creating Workspace:')
-        log.debug(client)
-        return self.p4.save_client(client)
+        with self.__connect__():
+            client = self.p4.fetch_client()
+            client["Client"] = name
+            client["Root"] = root
+            client["Stream"] = stream
+            client["Options"] = options
+            log.debug('Creating Workspace:')
+            log.debug(client)
+            result = self.p4.save_client(client)
+            self.invalidate_workspace_cache()
+            return result
 
     def _connect_delete(
         self,
@@ -1258,7 +1991,7 @@ class P4ConnectionManager:
 
         log.debug(f"Deleting {path}")
         if change_description:
-            change_number = self._connect_create_change_list(change_description)
+            change_number = self._get_change_number_for_description(change_description)
             result = self.p4.run_delete(["-c", change_number, path])
         else:
             result = self.p4.run_delete(path)
@@ -1284,18 +2017,34 @@ class P4ConnectionManager:
             true_pattern=f"Change {change_id} deleted.",
             false_pattern="open file(s) associated with it and can't be deleted"
         )
+        if result and result[0]:
+            p4_change_index.get_change_list_index().remove(self._change_index_key, change_id)
 
         return result
 
     def _connect_exists_on_server(self, path: T_PthStrLst) -> list[bool]:
-        # @sharkmob-shea.richardson:
-        # If self.path is a directory, limit the number of
-        # returned files from the fstat query, to avoid getting
-        # info on all sub files recursively. This is done by
-        # passing in the -m (max) argument and setting it as 1:
-        stat = self._connect_get_stat(path, ["-m 1"])
-        result = [True if "depotFile" in data else False for data in stat]
-        return result
+        result = dict.fromkeys(path, False)  # type: dict[str, bool]
+        files = [_path for _path in path if not _path.endswith("...")]
+        folders = [_path for _path in path if _path.endswith("...")]
+
+        # All the files are queried with a single fstat.
+        # `-m` can't be used here as it limits the total
+        # number of returned files, not the files per path:
+        if files:
+            stat = self._connect_get_stat(files)
+            for file, data in zip(files, stat):
+                result[file] = self._is_stat_on_server(data)
+
+        for folder in folders:
+            # @sharkmob-shea.richardson:
+            # If self.path is a directory, limit the number of
+            # returned files from the fstat query, to avoid getting
+            # info on all sub files recursively. This is done by
+            # passing in the -m (max) argument and setting it as 1:
+            stat = self._connect_get_stat((folder, ), ["-m 1"])
+            result[folder] = bool(stat) and "depotFile" in stat[0]
+
+        return list(result.values())
 
     def _connect_get_attribute(
         self,
@@ -1364,23 +2113,58 @@ class P4ConnectionManager:
         return result
 
     def _connect_get_existing_change_list(self, description: str) -> dict[str, Any]:
-        user_name = self._connect_get_user_name()
-        client = self.p4.client
-        changes: list[dict[str, Any]] = self.p4.run_changes(
-            ["-u", user_name, "-c", client, "-s", "pending"]
-        )
+        """
+        Get the spec of the pending change list with the given description.
 
+        The change number is looked up in the change list index, which is
+        only refreshed with `p4 changes -l` if the description is not in it
+        or the indexed change is no longer a pending change of this workspace.
+        """
+
+        description = description.strip()
+        change_index = p4_change_index.get_change_list_index()
+        key = self._change_index_key
+        change = change_index.get(key, description)
+        if change is not None:
+            change_dict = self._fetch_pending_change(change, description)
+            if change_dict:
+                return change_dict
+
+        changes = self.p4.run_changes(
+            ["-l", "-u", self.p4.user, "-c", self.p4.client, "-s", "pending"]
+        )  # type: list[dict[str, Any]]
         if not changes:
+            change_index.set_changes(key, [])
             raise P4.P4Exception("No changelists found!")
 
-        description = description.strip()
-        for change_data in self.p4.run_describe([change["change"] for change in changes]):
-            if description != change_data["desc"].strip():
-                continue
+        change = change_index.set_changes(key, changes).get(description)
+        if change is None:
+            raise P4.P4Exception(f'No changelist with description: "{description}" found!')
+
+        return self.p4.fetch_change(change)
 
-            return self.p4.fetch_change(change_data["change"])
+    def _fetch_pending_change(self, change: str, description: str) -> dict[str, Any] | None:
+        """
+        Fetch the spec of an indexed change, returning `None` if it is no
+        longer a pending change of this workspace with the given description.
+        """
+
+        try:
+            change_dict = self.p4.fetch_change(change)
+        except Exception as error:
+            if not self._is_p4_exception(error):
+                raise
+
+            return None
+
+        if (
+            change_dict.get("Status") != "pending"
+            or change_dict.get("Client") != self.p4.client
+            or change_dict.get("Description", "").strip() != description
+        ):
+            return None
 
-        raise P4.P4Exception(f'No changelist with description: "{description}" found!')
+        return change_dict
 
     def _connect_get_files(
         self, path: T_PthStrLst, extension: str | None = None, include_all: bool = False, query_sub_folders: bool = True
@@ -1411,80 +2195,171 @@ class P4ConnectionManager:
         fstat_args: Iterable[str] | None = None,
     ) -> list[tuple[P4PathDateData]]:
         result: list[tuple[P4PathDateData]] = []
-        fstat_args = list(fstat_args) if fstat_args else []
-        # -Sd: Sort by date.
-        # -Rc: Limit output to files mapped into the current workspace.
-        fstat_args.extend(("-Sd", "-Rc"))
         for _path in path:
             if not _path.endswith("..."):
                 raise AttributeError(
                     "get_files_in_folder_in_date_order can only be run on folders!"
                 )
 
-            stat = self._connect_get_stat((_path, ), args=fstat_args)
-            if name_pattern:
-                name_pattern = name_pattern.lower()
-
-            _extensions = None
-            if extensions is not None:
-                _extensions = set(
-                    (
-                        extension.lower()
-                        if extension.startswith(".")
-                        else ".{}".format(extension).lower()
-                        for extension in extensions
-                    )
+            path_result = self._iter_files_in_folder_by_date(
+                _path, name_pattern=name_pattern, extensions=extensions, fstat_args=fstat_args
+            )
+            result.append(tuple(path_result))
+
+        return result
+
+    def _iter_files_in_folder_by_date(
+        self,
+        path: str,
+        name_pattern: str | None = None,
+        extensions: Iterable[str] | None = None,
+        fstat_args: Iterable[str] | None = None,
+        newest_first: bool = False,
+        limit: int | None = None,
+    ) -> Iterator[P4PathDateData]:
+        """
+        Stream the files directly in the given folder in date order.
+
+        The server does most of the filtering: `folder/*` only matches the
+        files directly in the folder and the extensions are sent as an `-F`
+        expression. As `-F` matches case sensitively, the name is only
+        checked as the records come in, like the extensions are again.
+        `limit` is passed on as `-m` when there is nothing to check.
+        """
+
+        fstat_args = list(fstat_args) if fstat_args else []
+        # -Sd: Sort by date.
+        # -Rc: Limit output to files mapped into the current workspace.
+        fstat_args.extend(("-Sd", "-Rc"))
+        if newest_first:
+            # -r: Reverse the sort order.
+            fstat_args.append("-r")
+
+        name_pattern = name_pattern.lower() if name_pattern else None
+        _extensions = None
+        if extensions is not None:
+            _extensions = set(
+                (
+                    extension.lower()
+                    if extension.startswith(".")
+                    else ".{}".format(extension).lower()
+                    for extension in extensions
                 )
+            )
 
-            local_path = self._connect_get_local_path((_path, ))
-            if not local_path:
-                continue
+        filter_expression = self._get_extension_filter(_extensions)
+        unfiltered_args = list(fstat_args)
+        if filter_expression:
+            fstat_args.extend(("-F", filter_expression))
 
-            _local_path = local_path[0]
-            parent_path_client = pathlib.Path(_local_path)
-            path_result: list[P4PathDateData] = []
-            for data in stat:
-                path_date_data = P4PathDateData()
-                if not data:
-                    path_date_data.set_data(None, None)
+        if limit is not None and not name_pattern and not _extensions:
+            fstat_args.extend(("-m", str(limit)))
 
-                else:
+        # `*` doesn't match sub folders, unlike `...`:
+        folder_files = f"{path[:-3]}*" if path.endswith("...") else path
+        stat_count = 0
 
-                    local_path = pathlib.Path(data["clientFile"])
-                    if not local_path.parent == parent_path_client:
-                        continue
+        def _is_file_valid(data):
+            # type: (dict[str, Any]) -> bool
+            nonlocal stat_count
+            stat_count += 1
+            local_path = pathlib.Path(data["clientFile"])
+            if name_pattern and name_pattern not in local_path.stem.lower():
+                return False
 
-                    if name_pattern and name_pattern not in local_path.stem.lower():
-                        continue
+            if _extensions and local_path.suffix.lower() not in _extensions:
+                return False
 
-                    if _extensions and local_path.suffix.lower() not in _extensions:
-                        continue
+            return True
 
+        def _iter_path_date_data():
+            # type: () -> Iterator[P4PathDateData]
+            stat = self._iter_stat(folder_files, args=fstat_args, predicate=_is_file_valid)
+            try:
+                for data in stat:
+                    local_path = pathlib.Path(data["clientFile"])
                     if "action" in data and data["action"] == "add":
                         # @sharkmob-shea.richardson:
                         # As the file has been marked for add,
                         # all we have to go on is the last time
                         # the file was modified locally:
                         mod_time = local_path.stat().st_mtime
-                        mod_date = datetime.datetime.fromtimestamp(mod_time)
-                        path_date_data.set_data(local_path, mod_date)
-
                     else:
                         mod_time = int(data["headTime"])
-                        mod_date = datetime.datetime.fromtimestamp(mod_time)
-                        path_date_data.set_data(local_path, mod_date)
 
-                path_result.append(path_date_data)
+                    path_date_data = P4PathDateData()
+                    path_date_data.set_data(local_path, datetime.datetime.fromtimestamp(mod_time))
+                    yield path_date_data
+            finally:
+                stat.close()
 
-            result.append(tuple(path_result))
+            if stat_count:
+                return
 
-        return result
+            # The folder holds no files at all, which a filtered query
+            # can't tell apart from none of its files matching:
+            if not filter_expression or not self._has_stat(folder_files, unfiltered_args):
+                yield P4PathDateData()
+
+        return _iter_path_date_data()
+
+    def _has_stat(self, path, args):
+        # type: (str, list[str]) -> bool
+        """
+        Test if fstat returns any record for `path` with `args`.
+        Used to tell an empty folder apart from a folder without
+        any file matching the `-F` filter, which both return nothing.
+        """
+
+        stat = self._iter_stat(path, args=[*args, "-m", "1"])
+        try:
+            return next(stat, None) is not None
+        finally:
+            stat.close()
+
+    def _get_extension_filter(self, extensions):
+        # type: (set[str] | None) -> str
+        """
+        Build an fstat `-F` expression matching files by extension.
+
+        `-F` values match case sensitively, unlike the extension checks,
+        so every case variant of the lower case extensions is sent.
+        Returns an empty expression, leaving the extensions to the checks,
+        when that is more than `max_extension_filters` values or any of
+        them may be an operator of the filter syntax.
+        """
+
+        if not extensions:
+            return ""
+
+        if not all(
+            extension.count(".") == 1
+            and all(char.isalnum() or char in "._-" for char in extension)
+            for extension in extensions
+        ):
+            return ""
+
+        variants = sorted(
+            {
+                "".join(chars)
+                for extension in extensions
+                for chars in itertools.product(*({char, char.upper()} for char in extension))
+            }
+        )
+        if len(variants) > self.max_extension_filters:
+            return ""
+
+        expression = " | ".join(f"clientFile=*{variant}" for variant in variants)
+        return f"({expression})"
 
     def _connect_get_info(self):
         return self.p4.run_info()
 
-    def _connect_get_latest(self, path: T_PthStrLst) -> list[bool | None]:
+    def _connect_get_latest(self, path: T_PthStrLst, checkpoint: bool = False) -> list[bool | None]:
         log.debug(f"Get Latest Path {path}")
+        if self._should_sync_in_chunks(path, checkpoint=checkpoint):
+            return self._sync_in_chunks(path, checkpoint=checkpoint)
+
         try:
             sync_result = self.p4.run_sync(path)
             result = self._process_result(sync_result, "action", ("updated", "added"), set_none=True)
@@ -1529,6 +2404,304 @@ class P4ConnectionManager:
 
             return result
 
+    def _should_sync_in_chunks(self, path, revision="", checkpoint=False):
+        # type: (Sequence[str], str, bool) -> bool
+        """
+        Whether to preview the sync of the paths with `_sync_in_chunks`,
+        which only splits it in chunks if more than `sync_chunk_files`
+        files are transferred, rather than syncing them with a plain sync.
+
+        That is the case for `sync_chunk_files` paths or more, for folders
+        whose `sync -N` estimate is more than `sync_chunk_files` files and,
+        with `checkpoint`, for paths with a checkpoint to resume.
+        """
+
+        if checkpoint:
+            checkpoint_key = p4_sync.P4SyncCheckpoint.make_key(self.p4.port, self.p4.client, path)
+            if p4_sync.P4SyncCheckpoint.exists(checkpoint_key):
+                return True
+
+        if len(path) >= self.sync_chunk_files:
+            return True
+
+        if not any(_path.endswith("...") for _path in path):
+            return False
+
+        return self._get_sync_file_count(path, revision) > self.sync_chunk_files
+
+    def _get_sync_file_count(self, path, revision=""):
+        # type: (Sequence[str], str) -> int
+        """
+        The number of files a sync of the paths would add, update or
+        delete, as estimated by the server with `sync -N`.
+        """
+
+        estimates = self.p4.run_sync(
+            "-N", [f"{_path}{revision}" for _path in path], exception_level=1
+        )
+        for estimate in estimates:
+            if isinstance(estimate, str) and "files added/updated/deleted=" in estimate:
+                change_count_str = estimate.split("=")[1].split(",")[0]
+                return sum(int(value) for value in change_count_str.split("/"))
+
+        return 0
+
+    def _sync_in_chunks(self, path, revision="", checkpoint=False):
+        # type: (Sequence[str], str, bool) -> list[bool | None]
+        """
+        Sync the given paths in chunks of similar size, spread over up to
+        `max_sync_connections` pooled connections.
+
+        A `sync -n` preview lists the files to transfer with their sizes.
+        Up to `sync_chunk_files` files are synced as one chunk on this
+        manager's connection, more are split into chunks that sync exactly the previewed revisions,
+        reporting their progress as one through this manager's progress
+        handler. Chunks that fail are kept for `resume_sync`.
+        `revision` is a revision specifier, like `@123`, added to each path.
+
+        With `checkpoint`, the preview is pinned to a changelist and, if
+        it is split in chunks, they are saved to disk as a `P4SyncCheckpoint`.
+        If the last sync
+        of the same paths didn't complete, it is resumed from its checkpoint
+        instead of previewing the paths again, unless the checkpoint is
+        older than `sync_checkpoint_max_age` or, getting latest, more than
+        `sync_checkpoint_max_changes` changes behind the head changelist.
+
+        Returns a result per path: `None` if it isn't on the server,
+        `False` if any of its files are in a failed chunk, else `True`.
+        """
+
+        sync_checkpoint = None  # type: p4_sync.P4SyncCheckpoint | None
+        change = 0
+        preview_revision = revision
+        if checkpoint:
+            checkpoint_key = p4_sync.P4SyncCheckpoint.make_key(self.p4.port, self.p4.client, path)
+            sync_checkpoint = p4_sync.P4SyncCheckpoint.load(
+                checkpoint_key, max_age=self.sync_checkpoint_max_age
+            )
+            # Pin the preview to a changelist, so the saved chunks
+            # still match when an interrupted sync is resumed:
+            change = self._get_sync_change(path, revision)
+            preview_revision = f"@{change}"
+            if sync_checkpoint is not None:
+                if sync_checkpoint.revision == revision and (
+                    revision
+                    or change - sync_checkpoint.change <= self.sync_checkpoint_max_changes
+                ):
+                    return self._resume_sync_checkpoint(path, sync_checkpoint)
+
+                sync_checkpoint.remove()
+                sync_checkpoint = None
+
+        result = dict.fromkeys(path, True)  # type: dict[str, bool | None]
+        preview_paths = {f"{_path}{preview_revision}": _path for _path in path}
+        preview = self.p4.run_sync("-n", list(preview_paths), exception_level=1)
+        for warning in self.p4.warnings:
+            if warning.endswith(" - no such file(s)."):
+                _path = preview_paths.get(warning.replace(" - no such file(s).", ""))
+                if _path is not None:
+                    result[_path] = None
+
+        # The first record also holds the totals of the preview:
+        preview = [data for data in preview if isinstance(data, dict) and "depotFile" in data]
+        files = [(p4_sync.get_file_spec(data), int(data.get("fileSize", 0))) for data in preview]
+        if not files:
+            self._failed_sync_chunks = []
+            return list(result.values())
+
+        # Syncs of up to `sync_chunk_files` files stay on this connection:
+        chunk_count = math.ceil(len(files) / self.sync_chunk_files)
+        if chunk_count > 1:
+            chunk_count = max(self.max_sync_connections, chunk_count)
+
+        chunks = p4_sync.plan_chunks(files, chunk_count)
+        if checkpoint and chunk_count > 1:
+            sync_checkpoint = p4_sync.P4SyncCheckpoint(
+                checkpoint_key,
+                revision,
+                change,
+                chunks,
+                missing_paths=[_path for _path, value in result.items() if value is None],
+            )
+            sync_checkpoint.save()
+
+        self._failed_sync_chunks = self._sync_chunks(chunks, sync_checkpoint)
+        if not self._failed_sync_chunks:
+            if sync_checkpoint is not None:
+                sync_checkpoint.remove()
+
+            return list(result.values())
+
+        # The paths are indexed in a prefix trie, like workspace roots:
+        path_index = p4_workspace_index.P4WorkspaceIndex()
+        for _path in result:
+            path_index.add(_path, _path)
+
+        failed_files = {file_spec for chunk in self._failed_sync_chunks for file_spec in chunk}
+        for data in preview:
+            if p4_sync.get_file_spec(data) not in failed_files:
+                continue
+
+            _path = (
+                path_index.resolve(data.get("clientFile", ""))
+                or path_index.resolve(data["depotFile"])
+            )
+            if _path is not None:
+                result[_path] = False
+
+        return list(result.values())
+
+    def _resume_sync_checkpoint(self, path, sync_checkpoint):
+        # type: (Sequence[str], p4_sync.P4SyncCheckpoint) -> list[bool | None]
+        """
+        Sync the chunks left in the checkpoint of an interrupted sync.
+        When getting latest, the changes submitted since the checkpoint's
+        changelist are then synced on top, which only walks the files
+        changed by them.
+        """
+
+        log.info(f"Resuming the sync of {path} at change {sync_checkpoint.change}")
+        result = dict.fromkeys(path, True)  # type: dict[str, bool | None]
+        for _path in sync_checkpoint.missing_paths:
+            if _path in result:
+                result[_path] = None
+
+        self._failed_sync_chunks = self._sync_chunks(
+            sync_checkpoint.get_remaining_chunks(), sync_checkpoint
+        )
+        if self._failed_sync_chunks:
+            # The checkpoint doesn't know which path each file belongs to:
+            return [None if value is None else False for value in result.values()]
+
+        sync_checkpoint.remove()
+        if sync_checkpoint.revision:
+            return list(result.values())
+
+        latest_result = self._sync_in_chunks(path, revision=f"@{sync_checkpoint.change + 1},@now")
+        return [
+            False if latest_value is False else value
+            for value, latest_value in zip(result.values(), latest_result)
+        ]
+
+    def _get_sync_change(self, path, revision):
+        # type: (Sequence[str], str) -> int
+        """
+        The changelist of a `@<change>` revision, the last changelist
+        of the paths at any other revision, else the last submitted one.
+        """
+
+        if revision.startswith("@") and revision[1:].isdigit():
+            return int(revision[1:])
+
+        paths = [f"{_path}{revision}" for _path in path] if revision else []
+        return int(self.p4.run_changes("-m", "1", "-s", "submitted", paths)[0]["change"])
+
+    def _sync_chunks(self, chunks, sync_checkpoint=None):
+        # type: (list[list[str]], p4_sync.P4SyncCheckpoint | None) -> list[list[str]]
+        """
+        Sync the chunks on this manager's connection along with up to
+        `max_sync_connections - 1` group managers, each on its own
+        connection, all taking the next chunk from a shared queue.
+        The group managers of all the syncs together are limited to
+        `sync_pool_share` of the pool.
+        Chunks that fail are retried once here, returning those that
+        failed again. Synced chunks are recorded in `sync_checkpoint`.
+        """
+
+        progress = self._create_sync_progress(sum(len(chunk) for chunk in chunks))
+        failed_chunks = []  # type: list[list[str]]
+        chunk_iterator = iter(chunks)
+        chunks_lock = threading.Lock()
+
+        def _sync_chunk(manager, chunk):
+            # type: (P4ConnectionManager, list[str]) -> bool
+            if not manager._sync_chunk(chunk, progress, self.sync_throttle):
+                return False
+
+            if sync_checkpoint is not None:
+                sync_checkpoint.set_chunk_synced(chunk)
+
+            return True
+
+        def _sync(manager):
+            # type: (P4ConnectionManager) -> None
+            while True:
+                if self.sync_throttle is not None:
+                    self.sync_throttle.wait_while_paused()
+
+                with chunks_lock:
+                    chunk = next(chunk_iterator, None)
+
+                if chunk is None:
+                    return
+
+                if not _sync_chunk(manager, chunk):
+                    with chunks_lock:
+                        failed_chunks.append(chunk)
+
+        sync_count = 1
+        if not self.use_parallel_sync:
+            sync_count = max(1, min(self.max_sync_connections, len(chunks)))
+
+        # Extra connections are shared by all the syncs, so
+        # they never take the connections of other calls:
+        pool_size = p4_pool.get_connection_pool().max_size
+        sync_leases = p4_sync.get_sync_leases()
+        extra_count = sync_leases.take(sync_count - 1, int(pool_size * self.sync_pool_share))
+
+        # The chunks report their progress as a whole, rather than per file:
+        progress_handler = self.p4.progress
+        self.p4.progress = None
+        try:
+            self._fan_out(_sync, extra_count + 1)
+            failed_chunks = [chunk for chunk in failed_chunks if not _sync_chunk(self, chunk)]
+        finally:
+            self.p4.progress = progress_handler
+            sync_leases.give(extra_count)
+
+        progress.add_failed(sum(len(chunk) for chunk in failed_chunks))
+        progress.complete()
+        return failed_chunks
+
+    def _sync_chunk(self, chunk, progress, throttle=None):
+        # type: (list[str], p4_sync.P4SyncProgress, p4_sync.P4SyncThrottle | None) -> bool
+        args = []  # type: list[str]
+        if self.use_parallel_sync:
+            args.append(f"--parallel=threads={self.max_sync_connections}")
+
+        try:
+            # exception_level 1 stops "file(s) up-to-date." warnings
+            # of files synced by an earlier attempt from raising:
+            self.p4.run_sync(
+                args,
+                chunk,
+                handler=p4_sync.P4SyncOutputHandler(progress, throttle),
+                exception_level=1,
+            )
+        except Exception as error:
+            if not self._is_p4_exception(error):
+                raise
+
+            log.warning(f"Failed to sync a chunk of {len(chunk)} files: {error}")
+            return False
+
+        return True
+
+    def _create_sync_progress(self, total):
+        # type: (int) -> p4_sync.P4SyncProgress
+        if self._progress_handler is None:
+            return p4_sync.P4SyncProgress("Sync", total)
+
+        signaller = self._progress_handler.signaller
+        return p4_sync.P4SyncProgress(
+            "Sync",
+            total,
+            started_fn=signaller.started.emit,
+            total_set_fn=signaller.total_set.emit,
+            updated_fn=signaller.updated.emit,
+            completed_fn=signaller.completed.emit,
+        )
+
     def _connect_get_local_path(self, path: T_PthStrLst) -> tuple[str]:
         return tuple((data["path"].rstrip("...") for data in self.p4.run_where(path)))
 
@@ -1538,16 +2711,22 @@ class P4ConnectionManager:
         name_pattern: str | None = None,
         extensions: Iterable[str] | None = None,
     ):
-        paths = self._connect_get_files_in_folder_in_date_order(
-            path, name_pattern=name_pattern, extensions=extensions
+        if not path[0].endswith("..."):
+            raise AttributeError("get_newest_file_in_folder can only be run on folders!")
+
+        # Query the files newest first, so only the
+        # first matching file needs to be returned:
+        path_result = self._iter_files_in_folder_by_date(
+            path[0],
+            name_pattern=name_pattern,
+            extensions=extensions,
+            newest_first=True,
+            limit=1,
         )
-        if not paths:
-            return
-
-        if not paths[0]:
-            return
-
-        return paths[0][-1]
+        try:
+            return next(path_result, None)
+        finally:
+            path_result.close()
 
     def _connect_get_path_locations(self, path: T_PthStrLst) -> P4ReturnType:
         return self._connect_get_path_info(path)
@@ -1559,6 +2738,7 @@ class P4ConnectionManager:
         self,
         path: T_PthStrLst,
         revision: int | tuple[int],
+        checkpoint: bool = False,
     ) -> list[bool]:
         if not isinstance(revision, (list, tuple)):
             revision = tuple([revision] * len(path))
@@ -1567,6 +2747,11 @@ class P4ConnectionManager:
             raise AttributeError(f"revision count ({len(revision)}) "
                                  f"must match path count({len(path)})!")
 
+        if len(set(revision)) == 1 and self._should_sync_in_chunks(
+            path, revision=f"@{revision[0]}", checkpoint=checkpoint
+        ):
+            return self._sync_in_chunks(path, revision=f"@{revision[0]}", checkpoint=checkpoint)
+
         paths = [f"{_path}@{_revision}"
                  for _path, _revision in zip(path, revision)]
         sync_result = self.p4.run_sync(paths)
@@ -1641,6 +2826,97 @@ class P4ConnectionManager:
 
         return stat
 
+    def _connect_get_stat_batch(
+        self, path: str | Sequence[str], args: P4ArgsType = None
+    ) -> p4_stat.FileStatBatch:
+        """
+        Opt-in, compact alternative to `get_stat`, returning the records
+        as a columnar `FileStatBatch` rather than a dict per file.
+
+        The files come first, in the order of the paths, with an empty row
+        for files that aren't on the server, so the first rows are aligned
+        with the file paths. The records of the folders follow, streamed
+        straight into the batch, never holding their records as dicts.
+        """
+
+        paths = make_tuple_if_not(path)
+        files = tuple(_path for _path in paths if not _path.endswith("..."))
+        folders = tuple(_path for _path in paths if _path.endswith("..."))
+        batch = p4_stat.FileStatBatch()
+        if files:
+            batch.extend(self._connect_get_stat(files, args))
+
+        if folders:
+            batch.extend(self._iter_stat(folders, args=args))
+
+        return batch
+
+    def _iter_stat(self, path, args=None, predicate=None, buffer_size=1000):
+        # type: (str | Sequence[str], P4ArgsType, Callable[[dict[str, Any]], bool] | None, int) -> Iterator[dict[str, Any]]  # noqa
+        """
+        Stream the fstat records of the given path(s) as the server sends them.
+
+        Unlike `_connect_get_stat`, the records are never collected into a
+        list, so memory stays flat for huge folder queries. Records for
+        which `predicate` returns False are dropped as they arrive.
+        Closing the iterator early cancels the fstat on the server.
+
+        Must be consumed while connected, without running other commands
+        until the iterator is exhausted or closed, as the fstat runs on the
+        current connection in a background thread.
+        """
+
+        records = queue.Queue(maxsize=buffer_size)  # type: queue.Queue[Any]
+        cancelled = threading.Event()
+        finished = object()
+        p4 = self.p4
+        args = list(args) if args else []
+
+        def _put(item):
+            # type: (Any) -> bool
+            while not cancelled.is_set():
+                try:
+                    records.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+
+            return False
+
+        def _on_stat(stat):
+            # type: (dict[str, Any]) -> bool
+            if predicate is not None and not predicate(stat):
+                return not cancelled.is_set()
+
+            return _put(stat)
+
+        def _run_fstat():
+            try:
+                # exception_level 1 stops "no such file(s)"
+                # warnings from raising, like in `_connect_get_stat`:
+                p4.run_fstat(args, path, handler=P4StatHandler(_on_stat), exception_level=1)
+            except Exception as error:
+                _put(error)
+            finally:
+                _put(finished)
+
+        thread = threading.Thread(target=_run_fstat, name="P4StatStream", daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = records.get()
+                if item is finished:
+                    return
+
+                if isinstance(item, Exception):
+                    raise item
+
+                yield item
+
+        finally:
+            cancelled.set()
+            thread.join()
+
     def _connect_get_streams(self) -> tuple[str]:
         streams = self.p4.run_streams()
         return tuple((stream["Stream"] for stream in streams))
@@ -1650,24 +2926,48 @@ class P4ConnectionManager:
         return user_data["User"] if user_data and "User" in user_data else ""
 
     def workspace_exists(self, workspace) -> bool:
-        workspaces = self._connect_get_workspaces()
+        with self.__connect__():
+            workspaces = self._get_cached_workspaces()
+            if workspace not in workspaces:
+                # The workspace may have been created since the
+                # workspaces were cached, so only trust a hit:
+                workspaces = self._connect_get_workspaces()
         if not workspaces:
             return False
         return workspace in workspaces
 
     def _connect_get_workspaces(self, stream: str | None = None) -> list[str]:
-        host_name = self.host_name.lower()
-        client_data = self.p4.run_clients("--me")
+        """
+        Get the workspaces of this host, queried from the server rather
+        than the workspace cache, so new and deleted workspaces are
+        always listed correctly. The cache is refreshed at the same time.
+        """
+
+        workspaces = self.__workspace_cache__
+        clients = self._query_clients()
+        if set(workspaces) != set(clients):
+            self.__workspace_cache__ = []
+            self._is_path_under_any_root.cache_clear()
+
+        return self._get_cached_workspaces(stream)
+
+    def _get_cached_workspaces(self, stream: str | None = None) -> list[str]:
+        """
+        Get the workspaces of this host from the workspace cache.
+        Must be called while connected.
+        """
+
+        client_data = self._clients_cache.values()
         if stream:
             stream = stream.lower()
             workspaces = (
                 data["client"]
                 for data in client_data
-                if data["Host"].lower() == host_name and data["Stream"].lower() == stream
+                if data.get("Stream", "").lower() == stream
             )
 
         else:
-            workspaces = (data["client"] for data in client_data if data["Host"].lower() == host_name)
+            workspaces = (data["client"] for data in client_data)
 
         workspaces = list(dict.fromkeys(workspaces).keys())
         return workspaces
@@ -1701,19 +3001,19 @@ class P4ConnectionManager:
 
     def _connect_is_checked_out(self, path: T_PthStrLst) -> list[bool | None]:
         stat_result = self._connect_get_stat(path)
-        result = self._process_result(
-            stat_result,
-            ("otherAction", "action"),
-            ("edit", "add"),
-            none_keys=("headAction", ),
-            none_actions=("delete", ),
-            set_none=True
-        )
+        return [self._is_stat_checked_out(data) for data in stat_result]
 
-        return result
+    def _connect_is_latest(self, path, use_fstat_for_folders=False):
+        # type: (Sequence[str], bool) -> tuple[bool | None]
+        """
+        Test if the given files and folders are at their head revisions.
+
+        Folders are probed with `sync -N`, one per folder, spread over up to
+        `max_folder_probes` pooled connections. With `use_fstat_for_folders`
+        all the folders are answered by a single streamed fstat instead,
+        comparing the have and head revisions of their files.
+        """
 
-    def _connect_is_latest(self, path):
-        # type: (Sequence[str]) -> tuple[bool | None]
         result = dict.fromkeys(path, False)  # type: dict[str, bool | None]
         files = []  # type: list[str]
         folders = []  # type: list[str]
@@ -1724,49 +3024,138 @@ class P4ConnectionManager:
             files.append(_path)
 
         if folders:
-            def _is_folder_latest(folder):
-                # type: (str) -> bool | None
-                # @sharkmob-shea.richardson
-                # We have to test each folder individually else P4
-                # condenses all the returned statistics into one.
-                # This makes it impossible to work out which folders
-                # need syncing and which do not.
-                try:
-                    sync_result = self.p4.run_sync(("-N"), folder)[0]
-                except Exception as error:
-                    if not self._is_p4_exception(error):
-                        raise
+            if use_fstat_for_folders:
+                folders_latest = self._are_folders_latest_by_stat(folders)
+            else:
+                folders_latest = self._are_folders_latest(folders)
 
-                    return None
+            result.update(zip(folders, folders_latest))
 
-                change_count_str = sync_result.split("=")[1]  # type: str
-                change_count_str = change_count_str.split(",")[0]
-                change_counts = (bool(int(value)) for value in change_count_str.split("/"))
-                return not any(change_counts)
+        if files:
+            stat = self._connect_get_stat(files)
+            valid_states = {"add", "move/add", "edit"}
+            def _is_file_latest(data):
+                # type: (dict) -> bool | None
+                if not data:
+                    return
+                if "action" in data and data["action"] in valid_states:
+                    return True
+                if "headRev" not in data:
+                    return False
+                if "haveRev" not in data:
+                    return False
 
-            for folder in folders:
-                result[folder] = _is_folder_latest(folder)
+                return data["headRev"] == data["haveRev"]
 
-        stat = self._connect_get_stat(files)
-        valid_states = {"add", "move/add", "edit"}
-        def _is_file_latest(data):
-            # type: (dict) -> bool | None
-            if not data:
-                return
-            if "action" in data and data["action"] in valid_states:
-                return True
-            if "headRev" not in data:
+            for file, data in zip(files, stat):
+                is_latest = _is_file_latest(data)
+                result[file] = is_latest
+
+        return tuple(result.values())
+
+    def _is_folder_latest(self, folder):
+        # type: (str) -> bool | None
+        # @sharkmob-shea.richardson
+        # We have to test each folder individually else P4
+        # condenses all the returned statistics into one.
+        # This makes it impossible to work out which folders
+        # need syncing and which do not.
+        try:
+            sync_result = self.p4.run_sync(("-N"), folder)[0]
+        except Exception as error:
+            if not self._is_p4_exception(error):
+                raise
+
+            return None
+
+        change_count_str = sync_result.split("=")[1]  # type: str
+        change_count_str = change_count_str.split(",")[0]
+        change_counts = (bool(int(value)) for value in change_count_str.split("/"))
+        return not any(change_counts)
+
+    def _are_folders_latest(self, folders):
+        # type: (Sequence[str]) -> list[bool | None]
+        """
+        Probe the folders with `sync -N` in parallel.
+        This manager's connection probes folders along with up to
+        `max_folder_probes - 1` group managers, each on its own connection,
+        all taking the next folder to probe from a shared queue.
+        """
+
+        results = [None] * len(folders)  # type: list[bool | None]
+        indices = iter(range(len(folders)))
+        indices_lock = threading.Lock()
+
+        def _probe_folders(manager):
+            # type: (P4ConnectionManager) -> None
+            while True:
+                with indices_lock:
+                    index = next(indices, None)
+
+                if index is None:
+                    return
+
+                results[index] = manager._is_folder_latest(folders[index])
+
+        probe_count = max(1, min(self.max_folder_probes, len(folders)))
+        self._fan_out(_probe_folders, probe_count)
+        return results
+
+    def _are_folders_latest_by_stat(self, folders):
+        # type: (Sequence[str]) -> list[bool | None]
+        """
+        Test if the folders are latest with a single fstat of all of them.
+
+        A folder is out of date as soon as one of its files that isn't
+        opened has a have revision that differs from its head revision, or
+        is still had although deleted at head. The fstat is cancelled once
+        every folder is known to be out of date.
+        Folders without any files are `None`, like with `sync -N`.
+        """
+
+        # The folders are indexed in a prefix trie, like workspace roots:
+        folder_index = p4_workspace_index.P4WorkspaceIndex()
+        for folder in folders:
+            folder_index.add(folder, folder)
+
+        results = dict.fromkeys(folders)  # type: dict[str, bool | None]
+
+        def _get_folder(data):
+            # type: (dict[str, Any]) -> str | None
+            return (
+                folder_index.resolve(data.get("clientFile", ""))
+                or folder_index.resolve(data.get("depotFile", ""))
+            )
+
+        def _is_out_of_date(data):
+            # type: (dict[str, Any]) -> bool
+            folder = _get_folder(data)
+            if folder is None:
                 return False
-            if "haveRev" not in data:
+
+            if results[folder] is None:
+                results[folder] = True
+
+            if "action" in data:
                 return False
 
-            return data["headRev"] == data["haveRev"]
+            have_rev = data.get("haveRev")
+            if data.get("headAction", "").endswith("delete"):
+                return have_rev is not None
 
-        for file, data in zip(files, stat):
-            is_latest = _is_file_latest(data)
-            result[file] = is_latest
+            return have_rev != data.get("headRev")
 
-        return tuple(result.values())
+        fields = "depotFile,clientFile,headRev,haveRev,headAction,action"
+        stat = self._iter_stat(folders, args=["-T", fields], predicate=_is_out_of_date)
+        try:
+            for data in stat:
+                results[_get_folder(data)] = False
+                if not any(results.values()) and None not in results.values():
+                    break
+        finally:
+            stat.close()
+
+        return list(results.values())
 
     def _connect_is_stream_valid(self, stream: str) -> bool:
         streams = self._connect_get_streams()
@@ -1827,6 +3216,52 @@ class P4ConnectionManager:
 
         return result
 
+    def _connect_query_stat(self, path, queries):
+        # type: (T_PthStrLst, Sequence[str]) -> list[dict[str, Any]]
+        """
+        Answer several fstat based queries of the given paths at once,
+        returning a dict of each query's result for each path.
+
+        All the files are answered from a single fstat, shared by every
+        query, instead of one fstat per query. Folders are answered by
+        the `_connect_` method of each query.
+        The supported queries are the keys of `_stat_queries`.
+        """
+
+        unsupported = [query for query in queries if query not in self._stat_queries]
+        if unsupported:
+            raise ValueError(f"Unsupported stat queries: {unsupported}")
+
+        result = {_path: {} for _path in path}  # type: dict[str, dict[str, Any]]
+        files = [_path for _path in path if not _path.endswith("...")]
+        folders = [_path for _path in path if _path.endswith("...")]
+        if files:
+            stat = self._connect_get_stat(files)
+            for file, data in zip(files, stat):
+                result[file] = {
+                    query: getattr(self, self._stat_queries[query])(data)
+                    for query in queries
+                }
+
+        for folder in folders:
+            result[folder] = {
+                query: getattr(self, f"_connect_{query}")((folder, ))[0]
+                for query in queries
+            }
+
+        return list(result.values())
+
+    def _connect_resume_sync(self) -> bool:
+        """
+        Sync the chunks that failed in the last chunked `get_latest` again.
+        Returns True once every chunk has been synced.
+        """
+
+        if self._failed_sync_chunks:
+            self._failed_sync_chunks = self._sync_chunks(self._failed_sync_chunks)
+
+        return not self._failed_sync_chunks
+
     def _connect_revert(self, path: T_PthStrLst) -> list[bool] | None:
         revert_result: list[dict[str, Any]] = self.p4.run_revert(path)
         _revert_result = (data for data in revert_result if data["clientFile"] in path or data["depotFile"] in path)
@@ -1850,6 +3285,9 @@ class P4ConnectionManager:
     def _connect_submit_change_list(self, change_description: str) -> int | None:
         change_list_spec = self._connect_get_existing_change_list(change_description)
         result = self.p4.run_submit(change_list_spec)
+        p4_change_index.get_change_list_index().remove(
+            self._change_index_key, change_list_spec["Change"]
+        )
         if not result:
             return None
 
@@ -1875,12 +3313,25 @@ class P4ConnectionManager:
 
         change_list_spec["Description"] = new_description
         change_result = self.p4.save_change(change_list_spec)
+        change_index = p4_change_index.get_change_list_index()
+        change_index.remove(self._change_index_key, change_list_spec["Change"])
+        change_index.add(self._change_index_key, new_description, change_list_spec["Change"])
         result = self._process_result(
             change_result, "", "", true_pattern=f"Change {change_list_spec['Change']} updated."
         )
         return result
 
     # Public Methods:
+    def invalidate_workspace_cache(self) -> None:
+        """
+        Drop the cached workspaces and roots of the current server and user,
+        so they are queried again on next use.
+        """
+
+        p4_workspace_cache.get_workspace_cache().invalidate(self._workspace_cache_key)
+        self.__workspace_cache__ = []
+        self._is_path_under_any_root.cache_clear()
+
     @contextmanager
     def workspace_as(self, workspace: str) -> Iterator[None]:
         """Context manager that connects to if not already connected p4,
@@ -1900,7 +3351,7 @@ class P4ConnectionManager:
 
     def test_connection(self) -> bool:
         try:
-            with self.p4.connect():
+            with self._p4_settings.connect():
                 if self._is_offline:
                     self._signaller.connected.emit()
                     self._is_offline = False
@@ -1920,26 +3371,132 @@ class P4ConnectionManager:
             return False
 
 
-_connection_manager = None
+P4ConnectionManager._build_connect_methods()
+
+# The session of the last `login`, used by the threads without one bound:
+_session = None  # type: P4Session | None
+_sessions = {}  # type: dict[str, P4Session]
+_session_lock = threading.Lock()
+_thread_data = threading.local()
+
+
+def _get_session() -> P4Session | None:
+    """The session bound to this thread, else the one of the last `login`."""
+
+    session = getattr(_thread_data, "session", None)
+    if session is not None:
+        return session
+
+    with _session_lock:
+        return _session
+
+
+def _set_session(session: P4Session) -> None:
+    global _session
+    with _session_lock:
+        _session = session
+        _sessions[session.key] = session
+
+
+def get_session(key: str | None) -> P4Session | None:
+    """Get the session that logged in with the given key, if any."""
+
+    if not key:
+        return None
+
+    with _session_lock:
+        return _sessions.get(key)
+
+
+@contextmanager
+def bind_session(session: P4Session | None) -> Iterator[None]:
+    """
+    Context manager binding the module level functions called by this
+    thread to `session`, like the session of the DCC a REST call is
+    made for. Without a session, the thread uses the last `login`'s.
+    """
+
+    previous_session = getattr(_thread_data, "session", None)
+    _thread_data.session = session
+    try:
+        yield
+    finally:
+        _thread_data.session = previous_session
+
+
+_group_executor = None  # type: ThreadPoolExecutor | None
+_group_executor_lock = threading.Lock()
+
+
+def _get_group_executor() -> ThreadPoolExecutor:
+    """
+    Get the executor running the workspace groups of split path batches.
+    It has a worker for each connection the pool can open.
+    """
+
+    global _group_executor
+    with _group_executor_lock:
+        if _group_executor is None:
+            _group_executor = ThreadPoolExecutor(
+                max_workers=p4_pool.get_connection_pool().max_size,
+                thread_name_prefix="P4WorkspaceGroup",
+            )
+
+    return _group_executor
+
+
+_fan_out_executor = None  # type: ThreadPoolExecutor | None
+_fan_out_executor_lock = threading.Lock()
+
+
+def _get_fan_out_executor() -> ThreadPoolExecutor:
+    """
+    Get the executor running the group managers of `_fan_out`.
+    It is separate from the group executor, as fan outs are started
+    from group workers, which must never wait on their own executor.
+    """
+
+    global _fan_out_executor
+    with _fan_out_executor_lock:
+        if _fan_out_executor is None:
+            _fan_out_executor = ThreadPoolExecutor(
+                max_workers=p4_pool.get_connection_pool().max_size,
+                thread_name_prefix="P4FanOut",
+            )
+
+    return _fan_out_executor
 
 
 def _get_connection_manager() -> P4ConnectionManager:
-    # this doesn't work with REST api where thread is not main
-    #if threading.current_thread() is not threading.main_thread():
-        # # Generate a new P4ConnectionManager per thread:
-        # return P4ConnectionManager()
+    """
+    Get the P4ConnectionManager of the current thread.
+
+    Each thread gets its own manager so that concurrent calls, like
+    the REST api requests, don't share `result` or workspace state.
+    The manager is bound to the thread's session as it is returned, see
+    `bind_session`, so it never picks up another thread's `login`.
+    """
+
+    connection_manager = getattr(_thread_data, "connection_manager", None)
+    if connection_manager is None:
+        connection_manager = P4ConnectionManager()
+        _thread_data.connection_manager = connection_manager
 
-    global _connection_manager
-    if _connection_manager is None:
-        _connection_manager = P4ConnectionManager()
+    session = _get_session()
+    if session is not None:
+        with connection_manager._lock:
+            connection_manager._apply_session(session)
 
-    return _connection_manager
+    return connection_manager
 
 
 __all__ = (
     "_get_connection_manager",
     "P4ConnectionManager",
     "P4PathDateData",
+    "P4Session",
+    "bind_session",
+    "get_session",
     "exceptions",  # type: ignore
     "login",  # type: ignore
     "add",  # type: ignore
@@ -1969,9 +3526,11 @@ __all__ = (
     "get_revision_history",  # type: ignore
     "get_server_path",  # type: ignore
     "get_stat",  # type: ignore
+    "get_stat_batch",  # type: ignore
     "get_streams",  # type: ignore
     "get_user_name",  # type: ignore
     "get_workspaces",  # type: ignore
+    "invalidate_workspace_cache",  # type: ignore
     "host_name",  # type: ignore
     "is_checked_out_by_user",  # type: ignore
     "is_checked_out",  # type: ignore
@@ -1979,6 +3538,8 @@ __all__ = (
     "is_offline",  # type: ignore
     "is_stream_valid",  # type: ignore
     "move",  # type: ignore
+    "query_stat",  # type: ignore
+    "resume_sync",  # type: ignore
     "revert",  # type: ignore
     "run_command",  # type: ignore
     "set_attribute",  # type: ignore
@@ -6,6 +6,7 @@ import pathlib
 import six
 
 from . import p4_errors
+from . import p4_stat
 
 from contextlib import contextmanager
 from typing import Any
@@ -35,6 +36,18 @@ class P4PathDateData:
         ...
 
 
+@dataclasses.dataclass(frozen=True)
+class P4Session:
+    port: str
+    user: str
+    password: str
+    client: str
+
+    @property
+    def key(self) -> str:
+        ...
+
+
 class P4ConnectionManager:
     _signaller: P4ConnectionManagerSignaller = ...
 
@@ -701,14 +714,24 @@ class P4ConnectionManager:
     def get_latest(
         self,
         path: str | pathlib.Path,
+        checkpoint: bool = False,
         workspace_override: str | None = None
     ) -> bool | None:
         """
         Get latest on the given file(s).
 
+        Folders, and batches of `sync_chunk_files` paths or more, are synced in
+        chunks of similar size on up to `max_sync_connections` connections,
+        reporting their progress as a single sync. Chunks that fail to sync
+        can be synced again with `resume_sync`.
+
         Arguments:
         ----------
             - `path`: The file path(s) to get latest on.
+            - `checkpoint` (optional): If `True`, the chunks of the sync are saved to
+                disk as they complete, pinned to a changelist. If the last sync of
+                the same path(s) was interrupted, it resumes from that checkpoint.
+                Defaults to `False`
             - `workspace_override` (optional): If provided, uses the specific workspace
                 to first run the command under. If `None`, will use the current workspace
                 define by the local perforce settings. If the function fails, will
@@ -732,6 +755,7 @@ class P4ConnectionManager:
     def get_latest(
         self,
         path: Iterable[str | pathlib.Path],
+        checkpoint: bool = False,
         workspace_override: str | None = None
     ) -> dict[str, bool | None]:
         ...
@@ -889,6 +913,7 @@ class P4ConnectionManager:
         self,
         path: Iterable[str | pathlib.Path],
         revision: Iterable[int] | int,
+        checkpoint: bool = False,
         workspace_override: str | None = None
     ) -> list[bool]:
         """
@@ -901,6 +926,10 @@ class P4ConnectionManager:
                 `len(revision)` must match `len(path)` or will raise an `AttributeError`.
                 If a single number is provided then the same revision number will be use
                 for all files.
+            - `checkpoint` (optional): If `True`, the chunks of the sync are saved to
+                disk as they complete, pinned to a changelist. If the last sync of
+                the same path(s) was interrupted, it resumes from that checkpoint.
+                Defaults to `False`
             - `workspace_override` (optional): If provided, uses the specific workspace
                 to first run the command under. If `None`, will use the current workspace
                 define by the local perforce settings. If the function fails, will
@@ -923,6 +952,7 @@ class P4ConnectionManager:
         self,
         path: str | pathlib.Path,
         revision: int,
+        checkpoint: bool = False,
         workspace_override: str | None = None
     ) -> bool:
         """ """
@@ -1025,6 +1055,38 @@ class P4ConnectionManager:
         """ """
         ...
 
+    def get_stat_batch(
+        self,
+        path: str | pathlib.Path | Iterable[str | pathlib.Path],
+        args: Iterable[str] | None = None,
+        workspace_override: str | None = None
+    ) -> p4_stat.FileStatBatch:
+        """
+        Run fstat on the given file(s) or folder(s), returning a compact,
+        columnar `FileStatBatch` rather than a dictionary per file.
+
+        Arguments:
+        ----------
+            - `path`: The path(s) to get fstat for.
+            - `args` (optional): List of extra arguments to include
+                in the fstat command.
+                Defaults to `None`
+            - `workspace_override` (optional): If provided, uses the specific workspace
+                to first run the command under. If `None`, will use the current workspace
+                define by the local perforce settings. If the function fails, will
+                iterate over all other workspaces, running the function to see
+                if it will run successfully.
+                Defaults to `None`
+
+        Returns:
+        --------
+            - A `FileStatBatch` with a row per file. The given files come
+                first, in their order, with an empty row, without a depot file,
+                for files that don't exist on the server. The files of the
+                given folders follow.
+        """
+        ...
+
     def get_streams(self) -> tuple[str]:
         """
         Get a list of all streams available to the current user and host.
@@ -1197,6 +1259,7 @@ class P4ConnectionManager:
     def is_latest(
         self,
         path: str | pathlib.Path,
+        use_fstat_for_folders: bool = False,
         workspace_override: str | None = None
     ) -> bool | None:
 
@@ -1206,6 +1269,9 @@ class P4ConnectionManager:
         Arguments:
         ----------
             - `path`: The path(s) to query the status of.
+            - `use_fstat_for_folders` (optional): If `True`, answers all the folders
+                with a single `fstat` rather than a `sync -N` per folder.
+                Defaults to `False`
             - `workspace_override` (optional): If provided, uses the specific workspace
                 to first run the command under. If `None`, will use the current workspace
                 define by the local perforce settings. If the function fails, will
@@ -1231,6 +1297,7 @@ class P4ConnectionManager:
     def is_latest(
         self,
         path: Iterable[str | pathlib.Path],
+        use_fstat_for_folders: bool = False,
         workspace_override: str | None = None
     ) -> dict[str, bool | None]:
         ...
@@ -1299,6 +1366,59 @@ class P4ConnectionManager:
     ) -> dict[str, bool]:
         ...
 
+    @overload
+    def query_stat(
+        self,
+        path: str | pathlib.Path,
+        queries: Iterable[str],
+        workspace_override: str | None = None
+    ) -> dict[str, bool | None]:
+        """
+        Answer several fstat based queries of the given path(s) at once.
+        All the files are answered from a single fstat, shared by every query.
+
+        Arguments:
+        ----------
+            - `path`: The path(s) to query.
+            - `queries`: The names of the queries to answer for each path,
+                any of `"exists_on_server"` and `"is_checked_out"`.
+            - `workspace_override` (optional): If provided, uses the specific workspace
+                to first run the command under. If `None`, will use the current workspace
+                define by the local perforce settings. If the function fails, will
+                iterate over all other workspaces, running the function to see
+                if it will run successfully.
+                Defaults to `None`
+
+        Returns:
+        --------
+            - If a single path is provided:
+                A dictionary of the result of each query, as returned by
+                the function of the same name.
+            - If a list of paths are provided:
+                A dictionary where each key is the path and each value is
+                the dictionary of the result of each query for that path.
+        """
+        ...
+
+    @overload
+    def query_stat(
+        self,
+        path: Iterable[str | pathlib.Path],
+        queries: Iterable[str],
+        workspace_override: str | None = None
+    ) -> dict[str, dict[str, bool | None]]:
+        ...
+
+    def resume_sync(self) -> bool:
+        """
+        Sync the chunks that failed in the last chunked `get_latest` again.
+
+        Returns:
+        --------
+            `True` once every chunk has been synced, `False` if not.
+        """
+        ...
+
     @overload
     def revert(
         self,
@@ -1355,7 +1475,7 @@ exceptions: p4_errors.P4Exceptions = ...
 
 def _get_connection_manager() -> P4ConnectionManager:
     """
-    Get the P4ConnectionManager singleton instance
+    Get the P4ConnectionManager instance of the current thread
     """
 
 
@@ -2001,14 +2121,24 @@ def get_info() -> Any:
 @overload
 def get_latest(
     path: str | pathlib.Path,
+    checkpoint: bool = False,
     workspace_override: str | None = None
 ) -> bool | None:
     """
     Get latest on the given file(s).
 
+    Folders, and batches of `sync_chunk_files` paths or more, are synced in
+    chunks of similar size on up to `max_sync_connections` connections,
+    reporting their progress as a single sync. Chunks that fail to sync
+    can be synced again with `resume_sync`.
+
     Arguments:
     ----------
         - `path`: The file path(s) to get latest on.
+        - `checkpoint` (optional): If `True`, the chunks of the sync are saved to
+            disk as they complete, pinned to a changelist. If the last sync of
+            the same path(s) was interrupted, it resumes from that checkpoint.
+            Defaults to `False`
         - `workspace_override` (optional): If provided, uses the specific workspace
             to first run the command under. If `None`, will use the current workspace
             define by the local perforce settings. If the function fails, will
@@ -2032,6 +2162,7 @@ def get_latest(
 @overload
 def get_latest(
     path: Iterable[str | pathlib.Path],
+    checkpoint: bool = False,
     workspace_override: str | None = None
 ) -> dict[str, bool | None]:
     ...
@@ -2188,6 +2319,7 @@ def get_path_info(
 def get_revision(
     path: Iterable[str | pathlib.Path],
     revision: Iterable[int] | int,
+    checkpoint: bool = False,
     workspace_override: str | None = None
 ) -> list[bool]:
     """
@@ -2200,6 +2332,10 @@ def get_revision(
             `len(revision)` must match `len(path)` or will raise an `AttributeError`.
             If a single number is provided then the same revision number will be use
             for all files.
+        - `checkpoint` (optional): If `True`, the chunks of the sync are saved to
+            disk as they complete, pinned to a changelist. If the last sync of
+            the same path(s) was interrupted, it resumes from that checkpoint.
+            Defaults to `False`
         - `workspace_override` (optional): If provided, uses the specific workspace
             to first run the command under. If `None`, will use the current workspace
             define by the local perforce settings. If the function fails, will
@@ -2222,6 +2358,7 @@ def get_revision(
 def get_revision(
     path: str | pathlib.Path,
     revision: int,
+    checkpoint: bool = False,
     workspace_override: str | None = None
 ) -> bool:
     """ """
@@ -2325,6 +2462,38 @@ def get_stat(
     ...
 
 
+def get_stat_batch(
+    path: str | pathlib.Path | Iterable[str | pathlib.Path],
+    args: Iterable[str] | None = None,
+    workspace_override: str | None = None
+) -> p4_stat.FileStatBatch:
+    """
+    Run fstat on the given file(s) or folder(s), returning a compact,
+    columnar `FileStatBatch` rather than a dictionary per file.
+
+    Arguments:
+    ----------
+        - `path`: The path(s) to get fstat for.
+        - `args` (optional): List of extra arguments to include
+            in the fstat command.
+            Defaults to `None`
+        - `workspace_override` (optional): If provided, uses the specific workspace
+            to first run the command under. If `None`, will use the current workspace
+            define by the local perforce settings. If the function fails, will
+            iterate over all other workspaces, running the function to see
+            if it will run successfully.
+            Defaults to `None`
+
+    Returns:
+    --------
+        - A `FileStatBatch` with a row per file. The given files come
+            first, in their order, with an empty row, without a depot file,
+            for files that don't exist on the server. The files of the
+            given folders follow.
+    """
+    ...
+
+
 def get_streams() -> tuple[str]:
     """
     Get a list of all streams available to the current user and host.
@@ -2492,6 +2661,7 @@ def is_checked_out(path: str |pathlib.Path, workspace_override: str | None = Non
 @overload
 def is_latest(
     path: str | pathlib.Path,
+    use_fstat_for_folders: bool = False,
     workspace_override: str | None = None
 ) -> bool | None:
 
@@ -2501,6 +2671,9 @@ def is_latest(
     Arguments:
     ----------
         - `path`: The path(s) to query the status of.
+        - `use_fstat_for_folders` (optional): If `True`, answers all the folders
+            with a single `fstat` rather than a `sync -N` per folder.
+            Defaults to `False`
         - `workspace_override` (optional): If provided, uses the specific workspace
             to first run the command under. If `None`, will use the current workspace
             define by the local perforce settings. If the function fails, will
@@ -2526,6 +2699,7 @@ def is_latest(
 @overload
 def is_latest(
     path: Iterable[str | pathlib.Path],
+    use_fstat_for_folders: bool = False,
     workspace_override: str | None = None
 ) -> dict[str, bool | None]:
     ...
@@ -2596,6 +2770,60 @@ def move(
     ...
 
 
+@overload
+def query_stat(
+    path: str | pathlib.Path,
+    queries: Iterable[str],
+    workspace_override: str | None = None
+) -> dict[str, bool | None]:
+    """
+    Answer several fstat based queries of the given path(s) at once.
+    All the files are answered from a single fstat, shared by every query.
+
+    Arguments:
+    ----------
+        - `path`: The path(s) to query.
+        - `queries`: The names of the queries to answer for each path,
+            any of `"exists_on_server"` and `"is_checked_out"`.
+        - `workspace_override` (optional): If provided, uses the specific workspace
+            to first run the command under. If `None`, will use the current workspace
+            define by the local perforce settings. If the function fails, will
+            iterate over all other workspaces, running the function to see
+            if it will run successfully.
+            Defaults to `None`
+
+    Returns:
+    --------
+        - If a single path is provided:
+            A dictionary of the result of each query, as returned by
+            the function of the same name.
+        - If a list of paths are provided:
+            A dictionary where each key is the path and each value is
+            the dictionary of the result of each query for that path.
+    """
+    ...
+
+
+@overload
+def query_stat(
+    path: Iterable[str | pathlib.Path],
+    queries: Iterable[str],
+    workspace_override: str | None = None
+) -> dict[str, dict[str, bool | None]]:
+    ...
+
+
+def resume_sync() -> bool:
+    """
+    Sync the chunks that failed in the last chunked `get_latest` again.
+
+    Returns:
+    --------
+        `True` once every chunk has been synced, `False` if not.
+    """
+    ...
+
+
 @overload
 def revert(
     path: str | pathlib.Path,
@@ -2777,3 +3005,20 @@ def workspace_as(workspace: str) -> Iterator[None]:
     yielding the instance of p4 and closing the connection when done.
     """
     ...
+
+
+def get_session(key: str | None) -> P4Session | None:
+    """
+    Get the session that logged in with the given key, if any.
+    """
+    ...
+
+
+@contextmanager
+def bind_session(session: P4Session | None) -> Iterator[None]:
+    """
+    Context manager binding the module level functions called by this
+    thread to `session`. Without a session, the thread uses the last
+    `login`'s.
+    """
+    ...
@@ -0,0 +1,94 @@
+"""
+Process wide index of pending change list descriptions.
+
+Finding a pending change list by its description used to cost a
+`p4 describe` of every pending change of the workspace. The index maps
+the descriptions of each workspace's pending changes to their numbers,
+is refreshed with a single `p4 changes -l` on a miss and is kept up to
+date by the connection manager when it creates, renames, deletes or
+submits change lists.
+"""
+from __future__ import annotations
+
+import threading
+
+_typing = False
+if _typing:
+    from typing import Any
+    from typing import Iterable
+del _typing
+
+
+class P4ChangeListIndex:
+    """
+    Maps the descriptions of pending change lists to their numbers,
+    for each server, user and workspace.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._changes: dict[str, dict[str, str]] = {}
+
+    @staticmethod
+    def make_key(port: str, user: str, client: str) -> str:
+        return f"{port}|{user}|{client}"
+
+    def get(self, key: str, description: str) -> str | None:
+        with self._lock:
+            changes = self._changes.get(key)
+            if changes is None:
+                return None
+
+            return changes.get(description.strip())
+
+    def set_changes(self, key: str, changes: Iterable[dict[str, Any]]) -> dict[str, str]:
+        """
+        Replace the index of `key` with the result of `p4 changes -l`.
+        The first, newest, change wins if descriptions are duplicated.
+        """
+
+        index: dict[str, str] = {}
+        for change in changes:
+            index.setdefault(change["desc"].strip(), str(change["change"]))
+
+        with self._lock:
+            self._changes[key] = index
+
+        return index
+
+    def add(self, key: str, description: str, change: str | int) -> None:
+        with self._lock:
+            changes = self._changes.get(key)
+            if changes is not None:
+                changes[description.strip()] = str(change)
+
+    def remove(self, key: str, change: str | int) -> None:
+        change = str(change)
+        with self._lock:
+            changes = self._changes.get(key)
+            if changes is None:
+                return
+
+            for description, number in list(changes.items()):
+                if number == change:
+                    del changes[description]
+
+    def invalidate(self, key: str | None = None) -> None:
+        with self._lock:
+            if key is None:
+                self._changes.clear()
+            else:
+                self._changes.pop(key, None)
+
+
+_change_list_index = None
+_change_list_index_lock = threading.Lock()
+
+
+def get_change_list_index() -> P4ChangeListIndex:
+    global _change_list_index
+    with _change_list_index_lock:
+        if _change_list_index is None:
+            _change_list_index = P4ChangeListIndex()
+
+    return _change_list_index
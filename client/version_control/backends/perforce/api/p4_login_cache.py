@@ -0,0 +1,79 @@
+"""
+Process wide cache of validated login sessions.
+
+Every operation of the DCCs logs in first, which used to cost a full
+`p4 login` and a `p4 clients` query each time. A session that logged
+in is remembered for `ttl` seconds, during which logging in again with
+the same server, user, password and workspace returns straight away,
+whichever session logged in last.
+Once expired, the session's ticket is checked with a cheap `login -s`
+and only a session whose ticket is no longer valid logs in again.
+A session is dropped as soon as the server rejects its ticket.
+"""
+from __future__ import annotations
+
+import threading
+import time
+
+_typing = False
+if _typing:
+    from typing import Hashable
+del _typing
+
+
+class P4LoginCache:
+    """
+    The time each session, identified by its `P4Session`, last
+    logged in or had its ticket validated.
+
+    Arguments:
+    ----------
+        - `ttl`: Seconds before a session's ticket is validated again.
+    """
+
+    def __init__(self, ttl: float = 300.0):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._validated: dict[Hashable, float] = {}
+
+    def is_valid(self, session: Hashable) -> bool:
+        """If the session was validated less than `ttl` seconds ago."""
+
+        with self._lock:
+            validated = self._validated.get(session)
+
+        return validated is not None and time.monotonic() - validated < self.ttl
+
+    def set_valid(self, session: Hashable) -> None:
+        with self._lock:
+            self._validated[session] = time.monotonic()
+
+    def invalidate(self, session: Hashable | None = None) -> None:
+        with self._lock:
+            if session is None:
+                self._validated.clear()
+            else:
+                self._validated.pop(session, None)
+
+
+_login_cache = None
+_login_cache_lock = threading.Lock()
+
+
+def get_login_cache() -> P4LoginCache:
+    global _login_cache
+    with _login_cache_lock:
+        if _login_cache is None:
+            _login_cache = P4LoginCache()
+
+    return _login_cache
+
+
+def configure_login_cache(ttl: float | None = None) -> P4LoginCache:
+    """Update the settings of the module level cache."""
+
+    cache = get_login_cache()
+    if ttl is not None:
+        cache.ttl = ttl
+
+    return cache
@@ -0,0 +1,306 @@
+"""
+Pool of connected, logged in P4 instances.
+
+Opening a P4 connection costs a TCP handshake plus authentication, which
+adds up quickly when every `_connect_` call connects and disconnects.
+The pool keeps connections open once they are released, so that the next
+call for the same server and user can reuse one straight away.
+"""
+from __future__ import annotations
+
+import threading
+import time
+
+import P4
+from ayon_core.lib.log import Logger
+
+from . import p4_errors
+
+log = Logger.get_logger("PerforceConnectionPool")
+
+
+class _PooledConnection:
+    __slots__ = ("p4", "key", "last_used", "password")
+
+    def __init__(self, p4: P4.P4, key: tuple[str, str, str]):
+        self.p4 = p4
+        self.key = key
+        self.last_used = time.monotonic()
+        # The password the connection last logged in with:
+        self.password = None  # type: str | None
+
+
+class P4ConnectionPool:
+    """
+    Thread safe pool of open P4 connections keyed by the port, user
+    and client of the session they are leased for, so a connection is
+    never shared by two sessions.
+
+    Arguments:
+    ----------
+        - `max_size`: The maximum number of open connections, leased
+            and idle combined.
+        - `idle_timeout`: Seconds an idle connection is kept open
+            before it is disconnected.
+        - `health_check_interval`: Seconds a connection may sit idle
+            before it is checked with `p4 info -s` on its next lease.
+        - `acquire_timeout`: Seconds to wait for a free connection when
+            the pool is full. `None` waits indefinitely.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 8,
+        idle_timeout: float = 300.0,
+        health_check_interval: float = 30.0,
+        acquire_timeout: float | None = 60.0,
+    ):
+        self.max_size = max(1, max_size)
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.acquire_timeout = acquire_timeout
+
+        self._condition = threading.Condition()
+        self._idle: list[_PooledConnection] = []
+        self._leased: dict[int, _PooledConnection] = {}
+
+    @property
+    def size(self) -> int:
+        with self._condition:
+            return len(self._idle) + len(self._leased)
+
+    @property
+    def idle_count(self) -> int:
+        with self._condition:
+            return len(self._idle)
+
+    def acquire(
+        self,
+        port: str,
+        user: str,
+        password: str | None = None,
+        client: str = "",
+        wait: bool = True,
+    ) -> P4.P4:
+        """
+        Lease a connected P4 instance for the given port, user and client.
+
+        An idle connection is reused if one matches, otherwise a new one
+        is connected and logged in. When the pool is full, this waits up
+        to `acquire_timeout` for a free connection, or fails straight
+        away without `wait`.
+        """
+
+        key = (port, user, client)
+        deadline = (
+            time.monotonic()
+            if not wait
+            else None
+            if self.acquire_timeout is None
+            else time.monotonic() + self.acquire_timeout
+        )
+        while True:
+            with self._condition:
+                pooled = self._lease(key, deadline)
+
+            if pooled.p4.connected():
+                if self._is_healthy(pooled):
+                    pooled.last_used = time.monotonic()
+                    # The client may have been switched while it was leased:
+                    pooled.p4.client = client
+                    return pooled.p4
+
+                # The idle connection has gone stale, drop it and
+                # try again with the next one:
+                self.release(pooled.p4, discard=True)
+                continue
+
+            return self._connect(pooled, password)
+
+    def release(self, p4: P4.P4, discard: bool = False) -> None:
+        """
+        Return a leased connection to the pool.
+        Broken or discarded connections are disconnected instead.
+        """
+
+        with self._condition:
+            pooled = self._leased.pop(id(p4), None)
+            if pooled is None:
+                return
+
+            if discard or not p4.connected():
+                self._disconnect(pooled)
+            else:
+                pooled.last_used = time.monotonic()
+                self._idle.append(pooled)
+
+            self._reap_idle()
+            self._condition.notify()
+
+    def login(self, p4: P4.P4, password: str | None, force: bool = False) -> bool:
+        """
+        Log a leased connection in with `password`, unless it already
+        logged in with it, returning if `run_login` ran.
+        This is the only place pooled connections log in, so a new
+        connection is never logged in twice.
+        """
+
+        if not password:
+            return False
+
+        with self._condition:
+            pooled = self._leased.get(id(p4))
+
+        if not force and pooled is not None and pooled.password == password:
+            return False
+
+        p4.run_login(password=password)
+        if pooled is not None:
+            pooled.password = password
+
+        return True
+
+    def clear(self) -> None:
+        """Disconnect all the idle connections."""
+
+        with self._condition:
+            while self._idle:
+                self._disconnect(self._idle.pop())
+
+            self._condition.notify_all()
+
+    def _lease(self, key, deadline):
+        # type: (tuple[str, str, str], float | None) -> _PooledConnection
+        """
+        Lease an idle connection for `key` or reserve a slot for a new one.
+        Must be called while holding `self._condition`.
+        """
+
+        while True:
+            self._reap_idle()
+            pooled = self._pop_idle(key)
+            if pooled is None and self._idle and self._is_full():
+                # The pool is full, but an idle connection to another
+                # session can make room for this one:
+                self._disconnect(self._idle.pop(0))
+
+            if pooled is None and not self._is_full():
+                pooled = _PooledConnection(P4.P4(), key)
+
+            if pooled is not None:
+                self._leased[id(pooled.p4)] = pooled
+                return pooled
+
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise p4_errors.P4ServerConnectionError(
+                    f"Timed out waiting for a free connection to {key[0]} "
+                    f"(pool size: {self.max_size})"
+                )
+
+            self._condition.wait(remaining)
+
+    def _is_full(self) -> bool:
+        return len(self._idle) + len(self._leased) >= self.max_size
+
+    def _connect(self, pooled, password):
+        # type: (_PooledConnection, str | None) -> P4.P4
+        port, user, client = pooled.key
+        p4 = pooled.p4
+        try:
+            p4.port = port
+            p4.user = user
+            p4.client = client
+            p4.connect()
+            self.login(p4, password)
+
+        except Exception:
+            self.release(p4, discard=True)
+            raise
+
+        log.debug(f"Opened pooled connection to {port} as {user}")
+        return p4
+
+    def _pop_idle(self, key):
+        # type: (tuple[str, str, str]) -> _PooledConnection | None
+        for index in range(len(self._idle) - 1, -1, -1):
+            if self._idle[index].key == key:
+                return self._idle.pop(index)
+
+        return None
+
+    def _reap_idle(self) -> None:
+        if not self._idle:
+            return
+
+        expiry = time.monotonic() - self.idle_timeout
+        expired = [pooled for pooled in self._idle if pooled.last_used < expiry]
+        if not expired:
+            return
+
+        self._idle = [pooled for pooled in self._idle if pooled.last_used >= expiry]
+        for pooled in expired:
+            self._disconnect(pooled)
+
+    def _is_healthy(self, pooled: _PooledConnection) -> bool:
+        if not pooled.p4.connected():
+            return False
+
+        if time.monotonic() - pooled.last_used < self.health_check_interval:
+            return True
+
+        try:
+            pooled.p4.run_info("-s")
+        except Exception as error:
+            if type(error).__name__ != "P4Exception":
+                raise
+
+            log.debug(f"Pooled connection failed its health check: {error}")
+            return False
+
+        return True
+
+    @staticmethod
+    def _disconnect(pooled: _PooledConnection) -> None:
+        try:
+            if pooled.p4.connected():
+                pooled.p4.disconnect()
+        except Exception as error:
+            if type(error).__name__ != "P4Exception":
+                raise
+
+            log.debug(f"Failed to disconnect pooled connection: {error}")
+
+
+_POOL_SETTINGS = ("max_size", "idle_timeout", "health_check_interval", "acquire_timeout")
+_connection_pool = None
+_connection_pool_lock = threading.Lock()
+
+
+def get_connection_pool() -> P4ConnectionPool:
+    global _connection_pool
+    with _connection_pool_lock:
+        if _connection_pool is None:
+            _connection_pool = P4ConnectionPool()
+
+    return _connection_pool
+
+
+def configure_connection_pool(**kwargs) -> P4ConnectionPool:
+    """
+    Update the settings of the module level pool.
+    Accepts the same keyword arguments as `P4ConnectionPool`.
+    """
+
+    pool = get_connection_pool()
+    with pool._condition:
+        for name, value in kwargs.items():
+            if name not in _POOL_SETTINGS:
+                raise AttributeError(f"P4ConnectionPool has no setting: {name}")
+
+            setattr(pool, name, value)
+
+        pool.max_size = max(1, pool.max_size)
+        pool._condition.notify_all()
+
+    return pool
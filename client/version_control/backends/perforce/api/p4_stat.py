@@ -0,0 +1,251 @@
+"""
+Compact representations of fstat records.
+
+P4Python returns each fstat record as a dict of strings, which is
+heavy for large folder queries and means converting revisions and
+times with `int` every time they are read. `FileStat` holds a single
+record in typed slots, and `FileStatBatch` holds many records as
+columns: typed arrays for the revisions and times, and interned
+strings for the actions.
+
+Only the fields below are kept, any other fstat field is dropped.
+"""
+from __future__ import annotations
+
+import array
+import sys
+
+_typing = False
+if _typing:
+    from typing import Any
+    from typing import Iterable
+    from typing import Iterator
+del _typing
+
+# Actions of files opened by the current client that can't be synced:
+OPENED_ACTIONS = frozenset(("add", "move/add", "edit"))
+
+
+def _intern(value: str | None) -> str | None:
+    return sys.intern(value) if value else None
+
+
+class FileStat:
+    """
+    A single fstat record, with the revisions and head time as integers.
+    Missing revisions and times are `0`, as in `p4 fstat` revision `#0`.
+    """
+
+    __slots__ = (
+        "depot_file",
+        "client_file",
+        "head_rev",
+        "have_rev",
+        "head_time",
+        "head_action",
+        "head_type",
+        "action",
+        "change",
+        "other_open",
+    )
+
+    def __init__(
+        self,
+        depot_file: str | None = None,
+        client_file: str | None = None,
+        head_rev: int = 0,
+        have_rev: int = 0,
+        head_time: int = 0,
+        head_action: str | None = None,
+        head_type: str | None = None,
+        action: str | None = None,
+        change: str | None = None,
+        other_open: tuple[str, ...] = (),
+    ):
+        self.depot_file = depot_file
+        self.client_file = client_file
+        self.head_rev = head_rev
+        self.have_rev = have_rev
+        self.head_time = head_time
+        self.head_action = head_action
+        self.head_type = head_type
+        self.action = action
+        self.change = change
+        self.other_open = other_open
+
+    def __repr__(self) -> str:
+        return f"FileStat({self.depot_file!r}, head_rev={self.head_rev}, have_rev={self.have_rev})"
+
+    @classmethod
+    def from_record(cls, data: dict[str, Any]) -> FileStat:
+        """Create a `FileStat` from an fstat record, empty if the record is."""
+
+        if not data:
+            return cls()
+
+        return cls(
+            depot_file=data.get("depotFile"),
+            client_file=data.get("clientFile"),
+            head_rev=int(data.get("headRev", 0)),
+            have_rev=int(data.get("haveRev", 0)),
+            head_time=int(data.get("headTime", 0)),
+            head_action=_intern(data.get("headAction")),
+            head_type=_intern(data.get("headType")),
+            action=_intern(data.get("action")),
+            change=data.get("change"),
+            other_open=tuple(data.get("otherOpen", ())),
+        )
+
+    @property
+    def exists(self) -> bool:
+        return self.depot_file is not None
+
+    @property
+    def is_latest(self) -> bool | None:
+        """
+        If the file is at the head revision, `None` if it isn't on the server.
+        Files opened for add or edit count as latest, as they can't be synced.
+        """
+
+        if not self.exists:
+            return None
+
+        if self.action in OPENED_ACTIONS:
+            return True
+
+        if not self.head_rev or not self.have_rev:
+            return False
+
+        return self.head_rev == self.have_rev
+
+
+class FileStatBatch:
+    """
+    Columnar container of fstat records.
+
+    The revisions and head times are stored in typed arrays, and the
+    actions and file types as interned strings shared between records.
+    Rows of files that aren't on the server are kept, with no depot file,
+    so a batch stays aligned with the paths it was queried for.
+
+    Rows are read back as `FileStat` by index. The batch doesn't define
+    `__iter__`, so `__run_connect__` returns it whole rather than
+    compiling it into a dict per path; use `iter_stats` to loop over it.
+    """
+
+    __slots__ = (
+        "depot_files",
+        "client_files",
+        "head_revs",
+        "have_revs",
+        "head_times",
+        "head_actions",
+        "head_types",
+        "actions",
+        "changes",
+        "other_opens",
+    )
+
+    def __init__(self):
+        self.depot_files: list[str | None] = []
+        self.client_files: list[str | None] = []
+        self.head_revs = array.array("l")
+        self.have_revs = array.array("l")
+        self.head_times = array.array("q")
+        self.head_actions: list[str | None] = []
+        self.head_types: list[str | None] = []
+        self.actions: list[str | None] = []
+        self.changes: list[str | None] = []
+        self.other_opens: list[tuple[str, ...]] = []
+
+    def __len__(self) -> int:
+        return len(self.depot_files)
+
+    def __getitem__(self, index: int) -> FileStat:
+        return FileStat(
+            depot_file=self.depot_files[index],
+            client_file=self.client_files[index],
+            head_rev=self.head_revs[index],
+            have_rev=self.have_revs[index],
+            head_time=self.head_times[index],
+            head_action=self.head_actions[index],
+            head_type=self.head_types[index],
+            action=self.actions[index],
+            change=self.changes[index],
+            other_open=self.other_opens[index],
+        )
+
+    def __repr__(self) -> str:
+        return f"FileStatBatch({len(self)} files)"
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict[str, Any]]) -> FileStatBatch:
+        batch = cls()
+        batch.extend(records)
+        return batch
+
+    def append(self, data: dict[str, Any]) -> None:
+        """Add an fstat record, or an empty row if the record is empty."""
+
+        data = data or {}
+        self.depot_files.append(data.get("depotFile"))
+        self.client_files.append(data.get("clientFile"))
+        self.head_revs.append(int(data.get("headRev", 0)))
+        self.have_revs.append(int(data.get("haveRev", 0)))
+        self.head_times.append(int(data.get("headTime", 0)))
+        self.head_actions.append(_intern(data.get("headAction")))
+        self.head_types.append(_intern(data.get("headType")))
+        self.actions.append(_intern(data.get("action")))
+        self.changes.append(data.get("change"))
+        self.other_opens.append(tuple(data.get("otherOpen", ())))
+
+    def extend(self, records: Iterable[dict[str, Any]]) -> None:
+        for data in records:
+            self.append(data)
+
+    def iter_stats(self) -> Iterator[FileStat]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def have_revisions(self) -> list[int | None]:
+        """The have revision of each file, `None` if it isn't on the server."""
+
+        return [
+            None if depot_file is None else have_rev
+            for depot_file, have_rev in zip(self.depot_files, self.have_revs)
+        ]
+
+    def head_revisions(self) -> list[int | None]:
+        """The head revision of each file, `None` if it isn't on the server."""
+
+        return [
+            None if depot_file is None else head_rev
+            for depot_file, head_rev in zip(self.depot_files, self.head_revs)
+        ]
+
+    def revision_info(self) -> list[tuple[int, int] | tuple[None, None]]:
+        """The head and have revisions of each file."""
+
+        return [
+            (None, None) if depot_file is None else (head_rev, have_rev)
+            for depot_file, head_rev, have_rev in zip(
+                self.depot_files, self.head_revs, self.have_revs
+            )
+        ]
+
+    def is_latest(self) -> list[bool | None]:
+        """
+        If each file is at the head revision, compared column wise.
+        See `FileStat.is_latest`.
+        """
+
+        return [
+            None
+            if depot_file is None
+            else True
+            if action in OPENED_ACTIONS
+            else bool(have_rev) and head_rev == have_rev
+            for depot_file, action, head_rev, have_rev in zip(
+                self.depot_files, self.actions, self.head_revs, self.have_revs
+            )
+        ]
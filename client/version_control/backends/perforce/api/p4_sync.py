@@ -0,0 +1,351 @@
+"""
+Helpers for syncing large sets of files in parallel chunks.
+
+A `sync -n` preview lists every file a sync would transfer, with its
+size. The files are split into chunks of similar total size, which
+are then synced on several connections at once, while the progress
+of all the chunks is reported as one.
+
+The chunks of a sync can be saved to disk as a `P4SyncCheckpoint`,
+which records each chunk as it completes, so an interrupted sync
+resumes with the chunks that are left.
+"""
+from __future__ import annotations
+
+import hashlib
+import heapq
+import json
+import os
+import pathlib
+import threading
+import time
+
+import P4
+
+_typing = False
+if _typing:
+    from typing import Any
+    from typing import Callable
+    from typing import Iterable
+    from typing import Sequence
+del _typing
+
+
+def get_file_spec(data: dict[str, Any]) -> str:
+    """
+    Get the revision specific file spec of a `sync -n` record,
+    so a chunk syncs to exactly the revision that was previewed.
+    """
+
+    revision = data.get("rev")
+    if not revision or revision == "none":
+        return data["depotFile"]
+
+    return f"{data['depotFile']}#{revision}"
+
+
+def plan_chunks(
+    files: Sequence[tuple[str, int]], chunk_count: int
+) -> list[list[str]]:
+    """
+    Split `(file_spec, size)` pairs into `chunk_count` chunks of similar
+    total size, assigning the largest files first to the smallest chunk.
+    Empty chunks are dropped.
+    """
+
+    chunk_count = max(1, min(chunk_count, len(files)))
+    chunks = [[] for _ in range(chunk_count)]  # type: list[list[str]]
+    sizes = [(0, index) for index in range(chunk_count)]
+    for file_spec, size in sorted(files, key=lambda item: item[1], reverse=True):
+        total, index = heapq.heappop(sizes)
+        chunks[index].append(file_spec)
+        # Count every file as at least a byte, so lots of
+        # empty files are still spread over the chunks:
+        heapq.heappush(sizes, (total + max(size, 1), index))
+
+    return [chunk for chunk in chunks if chunk]
+
+
+class P4SyncLeases:
+    """
+    Counts the extra connections taken by all the chunked syncs of the
+    process, so that together they never take more than a share of the
+    pool and leave the other connections to the other calls.
+    Leases are granted without waiting, a sync granted none syncs all
+    of its chunks on its own connection.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def take(self, count: int, limit: int) -> int:
+        """Take up to `count` leases, keeping the total under `limit`."""
+
+        with self._lock:
+            granted = max(0, min(count, limit - self.count))
+            self.count += granted
+
+        return granted
+
+    def give(self, count: int) -> None:
+        with self._lock:
+            self.count = max(0, self.count - count)
+
+
+_sync_leases = P4SyncLeases()
+
+
+def get_sync_leases() -> P4SyncLeases:
+    return _sync_leases
+
+
+class P4SyncProgress:
+    """
+    Aggregates the progress of the chunks of a sync, counted in files,
+    and reports it through the given callables, which are usually
+    the signals of a `P4ProgressHandler`.
+    """
+
+    def __init__(
+        self,
+        description: str,
+        total: int,
+        started_fn: Callable[[str, int], None] | None = None,
+        total_set_fn: Callable[[int], None] | None = None,
+        updated_fn: Callable[[int], None] | None = None,
+        completed_fn: Callable[[str, int], None] | None = None,
+    ):
+        self.description = description
+        self.total = total
+        self.position = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+        self._updated_fn = updated_fn
+        self._completed_fn = completed_fn
+
+        if started_fn:
+            started_fn(description, total)
+
+        if total_set_fn:
+            total_set_fn(total)
+
+    def advance(self, count: int = 1) -> None:
+        with self._lock:
+            self.position += count
+            position = self.position
+
+        if self._updated_fn:
+            self._updated_fn(position)
+
+    def add_failed(self, count: int) -> None:
+        with self._lock:
+            self.failed += count
+
+    def complete(self) -> None:
+        if self._completed_fn:
+            self._completed_fn(self.description, self.failed)
+
+
+class P4SyncThrottle:
+    """
+    Limits the average transfer rate of syncs, by holding back the output
+    handlers of their chunks after each synced file. While a handler is
+    held P4 stops reading the server's data, so the server is held back
+    too. Shared by all the chunks of a sync.
+
+    Syncs are only paused between their chunks, never in the middle of
+    one, so a paused sync doesn't hold a half finished command open.
+    """
+
+    def __init__(
+        self,
+        bytes_per_second: int = 0,
+        is_paused_fn: Callable[[], bool] | None = None,
+    ):
+        self.bytes_per_second = bytes_per_second
+        self._is_paused_fn = is_paused_fn
+        self._lock = threading.Lock()
+        self._started: float | None = None
+        self._transferred = 0
+
+    def wait_while_paused(self) -> None:
+        """Wait before the next chunk of a sync, for as long as it's paused."""
+
+        if self._is_paused_fn is None or not self._is_paused_fn():
+            return
+
+        while self._is_paused_fn():
+            time.sleep(0.5)
+
+        # Don't let the pause count towards the average rate:
+        with self._lock:
+            self._started = None
+            self._transferred = 0
+
+    def wait(self, size: int) -> None:
+        """Wait after a file of `size` bytes was synced, as long as needed."""
+
+        if self.bytes_per_second <= 0:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            if self._started is None:
+                self._started = now
+
+            self._transferred += size
+            delay = self._started + self._transferred / self.bytes_per_second - now
+
+        if delay > 0:
+            time.sleep(delay)
+
+
+class P4SyncOutputHandler(P4.OutputHandler):
+    """
+    Output handler advancing a `P4SyncProgress` for each synced file,
+    and waiting on the `P4SyncThrottle` of the sync, if any.
+    The records are still reported, so they are returned by the sync.
+    """
+
+    def __init__(self, progress: P4SyncProgress, throttle: P4SyncThrottle | None = None):
+        super().__init__()
+        self._progress = progress
+        self._throttle = throttle
+
+    def outputStat(self, stat: dict[str, Any]) -> int:
+        self._progress.advance()
+        if self._throttle is not None:
+            self._throttle.wait(int(stat.get("fileSize", 0)))
+
+        return P4.OutputHandler.REPORT
+
+
+def get_checkpoint_dir() -> pathlib.Path:
+    """The folder of the sync checkpoints, next to the perforce servers config."""
+
+    app_data = os.environ.get("APPDATA") or pathlib.Path.home()
+    return pathlib.Path(app_data) / "halon" / "perforce_sync"
+
+
+class P4SyncCheckpoint:
+    """
+    The chunks of a sync, saved to disk so that an interrupted sync
+    can resume with the chunks that weren't synced yet.
+
+    A checkpoint is identified by the server, workspace and paths of
+    the sync. It holds the requested revision, the changelist the files
+    were previewed at, the paths that aren't on the server and the time
+    it was created at.
+    The chunks are written once, in `<key>.json`, while the indices of
+    the synced chunks are appended to `<key>.done` as they complete.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        revision: str,
+        change: int,
+        chunks: list[list[str]],
+        missing_paths: Iterable[str] = (),
+        synced: Iterable[int] = (),
+        created: float | None = None,
+    ):
+        self.key = key
+        self.revision = revision
+        self.change = change
+        self.chunks = chunks
+        self.missing_paths = list(missing_paths)
+        self.created = time.time() if created is None else created
+        self._synced = set(synced)
+        self._indices = {id(chunk): index for index, chunk in enumerate(chunks)}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(port: str, client: str, paths: Iterable[str]) -> str:
+        paths_key = "|".join(sorted(paths))
+        return hashlib.sha1(f"{port}|{client}|{paths_key}".encode()).hexdigest()
+
+    @staticmethod
+    def exists(key: str) -> bool:
+        return (get_checkpoint_dir() / f"{key}.json").exists()
+
+    @property
+    def file_path(self) -> pathlib.Path:
+        return get_checkpoint_dir() / f"{self.key}.json"
+
+    @property
+    def synced_file_path(self) -> pathlib.Path:
+        return self.file_path.with_suffix(".done")
+
+    @classmethod
+    def load(cls, key: str, max_age: float | None = None) -> P4SyncCheckpoint | None:
+        """
+        Load the checkpoint of `key`, `None` if there isn't a valid one.
+        A checkpoint older than `max_age` seconds is removed instead.
+        """
+
+        file_path = get_checkpoint_dir() / f"{key}.json"
+        synced_file_path = file_path.with_suffix(".done")
+        try:
+            with file_path.open("r") as checkpoint_file:
+                data = json.load(checkpoint_file)
+
+            synced = []  # type: list[int]
+            if synced_file_path.exists():
+                with synced_file_path.open("r") as synced_file:
+                    synced = [int(line) for line in synced_file if line.strip()]
+
+            sync_checkpoint = cls(
+                key,
+                data["revision"],
+                int(data["change"]),
+                data["chunks"],
+                missing_paths=data["missing_paths"],
+                synced=synced,
+                created=float(data["created"]),
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        if max_age is not None and time.time() - sync_checkpoint.created > max_age:
+            sync_checkpoint.remove()
+            return None
+
+        return sync_checkpoint
+
+    def save(self) -> None:
+        """Write the chunks, replacing the file so it is never half written."""
+
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        self.synced_file_path.unlink(missing_ok=True)
+        temp_file_path = self.file_path.with_suffix(".tmp")
+        with temp_file_path.open("w") as checkpoint_file:
+            json.dump(
+                {
+                    "revision": self.revision,
+                    "change": self.change,
+                    "chunks": self.chunks,
+                    "missing_paths": self.missing_paths,
+                    "created": self.created,
+                },
+                checkpoint_file,
+            )
+
+        os.replace(temp_file_path, self.file_path)
+
+    def remove(self) -> None:
+        self.file_path.unlink(missing_ok=True)
+        self.synced_file_path.unlink(missing_ok=True)
+
+    def get_remaining_chunks(self) -> list[list[str]]:
+        return [chunk for index, chunk in enumerate(self.chunks) if index not in self._synced]
+
+    def set_chunk_synced(self, chunk: list[str]) -> None:
+        """Record a chunk of this checkpoint as synced."""
+
+        index = self._indices[id(chunk)]
+        with self._lock:
+            self._synced.add(index)
+            with self.synced_file_path.open("a") as synced_file:
+                synced_file.write(f"{index}\n")
@@ -0,0 +1,217 @@
+"""
+Process wide cache of workspace specs and roots.
+
+Looking up the workspaces of the host costs a `p4 clients --me` and
+resolving the depot root of each workspace costs a `p4 where`.
+Both rarely change, so they are kept for `ttl` seconds across
+connections and threads, and can optionally be persisted to disk.
+"""
+from __future__ import annotations
+
+import json
+import os
+import pathlib
+import tempfile
+import threading
+import time
+
+from ayon_core.lib.log import Logger
+
+from . import p4_workspace_index
+
+_typing = False
+if _typing:
+    from typing import Any
+del _typing
+
+log = Logger.get_logger("PerforceWorkspaceCache")
+
+
+class P4WorkspaceCache:
+    """
+    Cache of the workspace specs and roots for each server, user and host.
+
+    Roots are stored with the `Root` of the spec they were resolved from,
+    so they are ignored as soon as a refreshed spec has a different root.
+    The workspace index built from them is kept in memory only and is
+    dropped whenever the specs or roots it was built from change.
+
+    Arguments:
+    ----------
+        - `ttl`: Seconds before cached workspaces are queried again.
+        - `persist_path` (optional): Json file the cache is loaded from
+            and saved to, to skip the queries in new processes too.
+    """
+
+    def __init__(self, ttl: float = 300.0, persist_path: str | None = None):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._indexes: dict[str, p4_workspace_index.P4WorkspaceIndex] = {}
+        self._persist_path: pathlib.Path | None = None
+        if persist_path:
+            self.set_persist_path(persist_path)
+
+    @staticmethod
+    def make_key(port: str, user: str, host_name: str) -> str:
+        return f"{port}|{user}|{host_name.lower()}"
+
+    def get_clients(self, key: str) -> dict[str, dict[str, Any]] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._is_expired(entry):
+                return None
+
+            return entry["clients"]
+
+    def set_clients(self, key: str, clients: dict[str, dict[str, Any]]) -> None:
+        with self._lock:
+            previous = self._entries.get(key)
+            roots = previous["roots"] if previous else {}
+            self._entries[key] = {
+                "time": time.time(),
+                "clients": clients,
+                "roots": {
+                    workspace: data
+                    for workspace, data in roots.items()
+                    if workspace in clients
+                    and clients[workspace].get("Root") == data[0]
+                },
+            }
+            self._indexes.pop(key, None)
+
+        self._save()
+
+    def get_roots(self, key: str, workspace: str, root: str) -> tuple[str, str] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            data = entry["roots"].get(workspace)
+            if data is None or data[0] != root:
+                return None
+
+            return data[1], data[2]
+
+    def set_roots(self, key: str, workspace: str, root: str, roots: tuple[str, str]) -> None:
+        with self._lock:
+            entry = self._entries.setdefault(
+                key, {"time": 0.0, "clients": {}, "roots": {}}
+            )
+            entry["roots"][workspace] = (root, roots[0], roots[1])
+            self._indexes.pop(key, None)
+
+        self._save()
+
+    def get_index(self, key: str) -> p4_workspace_index.P4WorkspaceIndex | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._is_expired(entry):
+                return None
+
+            return self._indexes.get(key)
+
+    def set_index(self, key: str, index: p4_workspace_index.P4WorkspaceIndex) -> None:
+        with self._lock:
+            self._indexes[key] = index
+
+    def invalidate(self, key: str | None = None) -> None:
+        """
+        Drop the cached workspaces of `key`, or of every server if `None`.
+        """
+
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self._indexes.clear()
+            else:
+                self._entries.pop(key, None)
+                self._indexes.pop(key, None)
+
+        self._save()
+
+    def set_persist_path(self, persist_path: str | None) -> None:
+        self._persist_path = pathlib.Path(persist_path) if persist_path else None
+        self._load()
+
+    def _is_expired(self, entry: dict[str, Any]) -> bool:
+        return time.time() - entry["time"] > self.ttl
+
+    def _load(self) -> None:
+        path = self._persist_path
+        if path is None or not path.exists():
+            return
+
+        try:
+            with path.open("r") as cache_file:
+                entries = json.load(cache_file)
+        except (OSError, ValueError) as error:
+            log.debug(f"Failed to load workspace cache '{path}': {error}")
+            return
+
+        with self._lock:
+            for key, entry in entries.items():
+                entry["roots"] = {
+                    workspace: tuple(data)
+                    for workspace, data in entry["roots"].items()
+                }
+                self._entries.setdefault(key, entry)
+
+    def _save(self) -> None:
+        path = self._persist_path
+        if path is None:
+            return
+
+        with self._lock:
+            data = json.dumps(self._entries)
+
+        # Write to a temporary file first, so other processes
+        # never read a half written cache:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            file_descriptor, temp_path = tempfile.mkstemp(
+                dir=path.parent, prefix=f".{path.name}", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(file_descriptor, "w") as cache_file:
+                    cache_file.write(data)
+
+                os.replace(temp_path, path)
+            except OSError:
+                os.remove(temp_path)
+                raise
+
+        except OSError as error:
+            log.debug(f"Failed to save workspace cache '{path}': {error}")
+
+
+_workspace_cache = None
+_workspace_cache_lock = threading.Lock()
+
+
+def get_workspace_cache() -> P4WorkspaceCache:
+    global _workspace_cache
+    with _workspace_cache_lock:
+        if _workspace_cache is None:
+            _workspace_cache = P4WorkspaceCache()
+
+    return _workspace_cache
+
+
+def configure_workspace_cache(
+    ttl: float | None = None, persist_path: str | None = None
+) -> P4WorkspaceCache:
+    """
+    Update the settings of the module level cache.
+    Setting `persist_path` loads any workspaces saved in it.
+    """
+
+    cache = get_workspace_cache()
+    if ttl is not None:
+        cache.ttl = ttl
+
+    if persist_path is not None:
+        cache.set_persist_path(persist_path)
+
+    return cache
@@ -0,0 +1,119 @@
+"""
+Prefix trie of workspace roots, used to find the workspace owning a path.
+
+Without it, a path can only be matched to its workspace by running the
+operation in each workspace until one accepts it. The trie is built
+once from the client and depot roots of the host's workspaces, and
+resolves a path by walking its components to the deepest root.
+"""
+from __future__ import annotations
+
+_typing = False
+if _typing:
+    from typing import Iterable
+    from typing import Sequence
+del _typing
+
+
+class _Node:
+    __slots__ = ("children", "workspaces")
+
+    def __init__(self):
+        self.children: dict[str, _Node] = {}
+        self.workspaces: list[str] = []
+
+
+def split_path(path: str) -> list[str]:
+    """
+    Split a client or depot path into lower case components.
+    Both separators are accepted and a trailing `...` is ignored.
+    """
+
+    path = str(path).replace("\\", "/").lower()
+    if path.endswith("..."):
+        path = path[:-3]
+
+    components = [component for component in path.split("/") if component]
+    if path.startswith("//"):
+        components.insert(0, "//")
+
+    return components
+
+
+class P4WorkspaceIndex:
+    """
+    Maps the client and depot roots of workspaces to their names.
+
+    A path resolves to the workspace with the longest root it is under,
+    so nested workspaces resolve to the innermost one. Workspaces sharing
+    a root, like two workspaces of the same stream sharing a depot root,
+    are resolved in the order of the given `preferred` workspaces.
+    """
+
+    def __init__(self):
+        self._root = _Node()
+        self._workspaces: list[str] = []
+
+    @property
+    def workspaces(self) -> tuple[str, ...]:
+        return tuple(self._workspaces)
+
+    def add(self, workspace: str, *roots: str) -> None:
+        for root in roots:
+            node = self._root
+            for component in split_path(root):
+                node = node.children.setdefault(component, _Node())
+
+            if workspace not in node.workspaces:
+                node.workspaces.append(workspace)
+
+        if workspace not in self._workspaces:
+            self._workspaces.append(workspace)
+
+    def resolve(self, path: str, preferred: Sequence[str] = ()) -> str | None:
+        """
+        Get the workspace owning `path`, or `None` if it is not under any root.
+        """
+
+        node = self._root
+        workspaces = node.workspaces
+        for component in split_path(path):
+            node = node.children.get(component)
+            if node is None:
+                break
+
+            if node.workspaces:
+                workspaces = node.workspaces
+
+        if not workspaces:
+            return None
+
+        if len(workspaces) > 1:
+            for workspace in preferred:
+                if workspace in workspaces:
+                    return workspace
+
+        return workspaces[0]
+
+    def group_paths(
+        self, paths: Iterable[str], preferred: Sequence[str] = ()
+    ) -> tuple[dict[str, list[int]], list[int]]:
+        """
+        Group the indices of `paths` by the workspace owning them.
+
+        Returns:
+        --------
+            The indices of each workspace, in the order the workspaces
+            are first seen, and the indices of the unresolved paths.
+        """
+
+        groups: dict[str, list[int]] = {}
+        unresolved: list[int] = []
+        for index, path in enumerate(paths):
+            workspace = self.resolve(path, preferred)
+            if workspace is None:
+                unresolved.append(index)
+            else:
+                groups.setdefault(workspace, []).append(index)
+
+        return groups, unresolved
@@ -17,6 +17,87 @@ if _typing:
 del _typing
 
 
+def _batch_exists_on_server(path, **_):
+    # type: (list[str]) -> list[bool] | dict[str, bool]
+    return api.exists_on_server(path)
+
+
+def _batch_is_checkouted(path, **_):
+    # type: (list[str]) -> list[bool | None] | dict[str, bool | None]
+    return api.is_checked_out(path)
+
+
+def _batch_checkout(path, comment="", **_):
+    # type: (list[str], str) -> list[bool] | dict[str, bool]
+    return api.checkout(path, change_description=comment)
+
+
+def _batch_add(path, comment="", **_):
+    # type: (list[str], str) -> list[bool] | dict[str, bool]
+    return api.add(path, change_description=comment)
+
+
+def _batch_delete(path, comment="", **_):
+    # type: (list[str], str) -> list[bool] | dict[str, bool]
+    return api.delete(path, change_description=comment)
+
+
+def _batch_sync_latest_version(path, **_):
+    # type: (list[str]) -> list[bool | None] | dict[str, bool | None]
+    return api.get_latest(path)
+
+
+BATCH_OPERATIONS = {
+    "exists_on_server": _batch_exists_on_server,
+    "is_checkouted": _batch_is_checkouted,
+    "checkout": _batch_checkout,
+    "add": _batch_add,
+    "delete": _batch_delete,
+    "sync_latest_version": _batch_sync_latest_version,
+}
+
+# The batch operations answered from fstat records, and the `query_stat`
+# query of each. Consecutive ones share a single fstat:
+STAT_OPERATIONS = {
+    "exists_on_server": "exists_on_server",
+    "is_checkouted": "is_checked_out",
+}
+
+
+def _get_result_keys(paths):
+    # type: (list[str]) -> list[str]
+    """
+    Get the keys the connection manager returns the result of each
+    of `paths` under, the clean P4 path without a folder's `...`.
+    """
+
+    manager = api.P4ConnectionManager
+    p4_paths = manager._get_correct_p4_paths(manager._get_valid_path_objects(paths))
+    return [path.replace("\\...", "") for path in p4_paths]
+
+
+def _map_batch_result(paths, result):
+    # type: (list[str], Any) -> list[Any]
+    """
+    Map the result of a path list call back onto `paths`.
+    The connection manager removes duplicate paths and returns the
+    results as a dict keyed by the clean path, which are looked up by
+    key. Paths without a result, like those of a failed workspace,
+    are `None`.
+    """
+
+    keys = _get_result_keys(paths)
+    if result is None:
+        return [None] * len(paths)
+
+    if isinstance(result, dict):
+        return [result.get(key) for key in keys]
+
+    values = list(result) if isinstance(result, (list, tuple)) else [result]
+    values_by_key = dict(zip(dict.fromkeys(keys), values))
+    return [values_by_key.get(key) for key in keys]
+
+
 class VersionControlPerforce(abstract.VersionControl):
     @staticmethod
     def workspace_exists(workspace):
@@ -71,14 +152,14 @@ class VersionControlPerforce(abstract.VersionControl):
         return api.create_workspace(workspace_name, workspace_root, stream, options)
 
     @staticmethod
-    def sync_latest_version(path):
-        # type: (pathlib.Path | str) -> bool | None
-        return api.get_latest(path)
+    def sync_latest_version(path, checkpoint=False):
+        # type: (pathlib.Path | str, bool) -> bool | None
+        return api.get_latest(path, checkpoint=checkpoint)
 
     @staticmethod
-    def sync_to_version(path, version):
-        # type: (pathlib.Path | str, int) -> bool | None
-        return api.get_revision(path, version)
+    def sync_to_version(path, version, checkpoint=False):
+        # type: (pathlib.Path | str, int, bool) -> bool | None
+        return api.get_revision(path, version, checkpoint=checkpoint)
 
     @staticmethod
     def add(path, comment=""):
@@ -164,3 +245,79 @@ class VersionControlPerforce(abstract.VersionControl):
         workspace_name = os.path.basename(workspace_dir)
         result = api.run_command("client", ["-o", workspace_name])
         return result.get("Stream")
+
+    @staticmethod
+    def batch(operations):
+        # type: (Sequence[dict[str, Any]]) -> list[list[Any]]
+        """
+        Run many path operations in as few P4 commands as possible.
+
+        Each operation is a dict with an `operation` name from
+        `BATCH_OPERATIONS`, a `path` list and optional arguments,
+        like `comment`. Consecutive operations with the same name and
+        arguments are merged, so each group becomes one `fstat`,
+        `edit`, `add`... call over all of its paths. Consecutive
+        operations of `STAT_OPERATIONS` share a single `fstat`.
+
+        Returns one list of per path results for each operation,
+        in the given order.
+        """
+
+        groups = []  # type: list[tuple[str, dict[str, Any], list[int]]]
+        for index, operation in enumerate(operations):
+            name = operation["operation"]
+            if name not in BATCH_OPERATIONS:
+                raise ValueError(f"Unsupported batch operation: {name}")
+
+            kwargs = {
+                key: value
+                for key, value in operation.items()
+                if key not in ("operation", "path")
+            }
+            if name in STAT_OPERATIONS:
+                # The stat operations take no arguments and are
+                # all answered by one `query_stat`:
+                name = "query_stat"
+                kwargs = {}
+
+            if groups and groups[-1][0] == name and groups[-1][1] == kwargs:
+                groups[-1][2].append(index)
+                continue
+
+            groups.append((name, kwargs, [index]))
+
+        results = [[] for _ in operations]  # type: list[list[Any]]
+        for name, kwargs, indices in groups:
+            paths = []  # type: list[str]
+            for index in indices:
+                path = operations[index]["path"]
+                paths.extend(path if isinstance(path, (list, tuple)) else [path])
+
+            if not paths:
+                continue
+
+            if name == "query_stat":
+                queries = list(dict.fromkeys(
+                    STAT_OPERATIONS[operations[index]["operation"]]
+                    for index in indices
+                ))
+                result = api.query_stat(paths, queries)
+            else:
+                result = BATCH_OPERATIONS[name](paths, **kwargs)
+
+            path_results = _map_batch_result(paths, result)
+            for index in indices:
+                path = operations[index]["path"]
+                count = len(path) if isinstance(path, (list, tuple)) else 1
+                index_results = path_results[:count]
+                path_results = path_results[count:]
+                if name == "query_stat":
+                    query = STAT_OPERATIONS[operations[index]["operation"]]
+                    index_results = [
+                        None if stat is None else stat[query]
+                        for stat in index_results
+                    ]
+
+                results[index] = index_results
+
+        return results
@@ -0,0 +1,176 @@
+"""
+Background prefetching of the files that application launches sync.
+
+The tray runs a `P4PrefetchDaemon` that periodically syncs the
+`always_sync` and `startup_files` paths of the configured workspaces,
+so the syncs of the launch hooks usually find nothing left to do.
+
+The daemon only syncs while the tray is idle: it waits while any
+REST call is queued or running and while a DCC has paused it, for
+example around a save, see `pause_prefetch`. Its syncs are bandwidth
+throttled and use their own connection settings, so they never change
+the session of the REST calls.
+"""
+from __future__ import annotations
+
+import dataclasses
+import threading
+import time
+
+from ayon_core.lib import Logger
+
+from . import api
+from .api import p4_sync
+
+_typing = False
+if _typing:
+    from typing import Callable
+    from typing import Sequence
+del _typing
+
+log = Logger.get_logger("PerforcePrefetch")
+
+
+@dataclasses.dataclass(frozen=True)
+class PrefetchTarget:
+    """The paths to prefetch in a workspace, with the settings to connect."""
+
+    port: str
+    user: str
+    password: str
+    client: str
+    paths: tuple[str, ...]
+
+
+class P4PrefetchDaemon:
+    """
+    Syncs the paths returned by `get_targets_fn` every `interval` seconds,
+    at up to `bandwidth_limit` bytes per second, `0` for no limit.
+
+    `is_busy_fn` (optional) returns True while other work should have the
+    connection to the server, the daemon waits for it to return False
+    before starting and pauses its syncs until it does.
+    """
+
+    def __init__(
+        self,
+        get_targets_fn: Callable[[], Sequence[PrefetchTarget]],
+        interval: float = 1800,
+        bandwidth_limit: int = 0,
+        is_busy_fn: Callable[[], bool] | None = None,
+    ):
+        self.interval = interval
+        self._get_targets_fn = get_targets_fn
+        self._is_busy_fn = is_busy_fn
+        self._paused_until = 0.0
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._throttle = p4_sync.P4SyncThrottle(bandwidth_limit, is_paused_fn=self.is_paused)
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="P4Prefetch", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self._thread = None
+
+    def pause(self, seconds: float) -> None:
+        """Pause for `seconds` from now, `0` resumes straight away."""
+
+        self._paused_until = time.monotonic() + seconds
+
+    def is_paused(self) -> bool:
+        if self._stop_event.is_set():
+            return False
+
+        if time.monotonic() < self._paused_until:
+            return True
+
+        return self._is_busy_fn is not None and self._is_busy_fn()
+
+    def prefetch(self) -> None:
+        """Sync the paths of every target, one target at a time."""
+
+        for target in self._get_targets_fn():
+            if self._stop_event.is_set():
+                return
+
+            self._wait_until_idle()
+            started = time.monotonic()
+            try:
+                self._sync_target(target)
+            except Exception as error:
+                log.warning(f"Failed to prefetch {target.client}: {error}")
+                continue
+
+            log.debug(
+                f"Prefetched {len(target.paths)} paths of {target.client} "
+                f"in {time.monotonic() - started:.1f}s"
+            )
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.prefetch()
+            except Exception as error:
+                log.warning(f"Prefetch failed: {error}")
+
+    def _wait_until_idle(self) -> None:
+        while self.is_paused() and not self._stop_event.wait(1):
+            continue
+
+    def _sync_target(self, target: PrefetchTarget) -> None:
+        session = api.P4Session(
+            port=target.port,
+            user=target.user,
+            password=target.password,
+            client=target.client,
+        )
+        manager = api.P4ConnectionManager(session=session)
+        # A single throttled connection, to leave the others to the artist,
+        # syncing small chunks as pauses only apply between chunks:
+        manager.max_sync_connections = 1
+        manager.sync_chunk_files = 100
+        manager.sync_throttle = self._throttle
+        manager.get_latest(list(target.paths), workspace_override=target.client)
+
+
+_prefetch_daemon = None  # type: P4PrefetchDaemon | None
+_prefetch_daemon_lock = threading.Lock()
+
+
+def get_prefetch_daemon() -> P4PrefetchDaemon | None:
+    with _prefetch_daemon_lock:
+        return _prefetch_daemon
+
+
+def configure_prefetch_daemon(daemon: P4PrefetchDaemon | None) -> None:
+    """Set the daemon of the tray, stopping the previous one."""
+
+    global _prefetch_daemon
+    with _prefetch_daemon_lock:
+        previous_daemon = _prefetch_daemon
+        _prefetch_daemon = daemon
+
+    if previous_daemon is not None and previous_daemon is not daemon:
+        previous_daemon.stop()
+
+
+def pause_prefetch(seconds: float) -> bool:
+    """Pause the tray's prefetching, returns False if it isn't running."""
+
+    daemon = get_prefetch_daemon()
+    if daemon is None:
+        return False
+
+    daemon.pause(seconds)
+    return True
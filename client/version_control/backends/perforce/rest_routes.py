@@ -1,5 +1,9 @@
 import json
+import asyncio
+import contextvars
 import datetime
+import threading
+import concurrent.futures
 from aiohttp.web_response import Response
 
 
@@ -10,14 +14,190 @@ from version_control.backends.perforce.backend import (
     VersionControlPerforce
 )
 from version_control.backends.perforce import api
+from version_control.backends.perforce import prefetch
+from version_control.rest.perforce.rest_stub import SESSION_HEADER
 
 
 log = Logger.get_logger("P4routes")
 
+# The session key sent by the DCC of the request being handled:
+_request_session_key = contextvars.ContextVar("p4_request_session_key", default=None)
+
+
+class P4Executor:
+    """
+    Bounded thread pool that runs the blocking P4 calls of the endpoints.
+
+    Running P4Python inside the coroutines blocks the webserver's only
+    event loop, so one long sync would stall every other request.
+    Each worker thread uses its own `P4ConnectionManager`, see
+    `api._get_connection_manager`, bound to the session of the call
+    for as long as it runs, see `api.bind_session`.
+
+    Per endpoint counters of queued, running, completed and failed calls
+    are kept to make the queue depth visible through `/perforce/metrics`.
+    """
+
+    def __init__(self, max_workers: int = 8):
+        self.max_workers = max_workers
+        self._executor = None
+        self._lock = threading.Lock()
+        self._metrics = {}
+
+    @property
+    def executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="PerforceRest",
+                )
+            return self._executor
+
+    async def run(self, name, semaphore, session, function, *args, **kwargs):
+        """
+        Run `function` on the executor without blocking the event loop.
+        `semaphore` (optional) limits the concurrent calls of one endpoint.
+        `session` (optional) is the `api.P4Session` the call runs with,
+        without one it runs with the session of the last login.
+        """
+
+        self._update_metrics(name, queued=1)
+
+        def _run():
+            self._update_metrics(name, queued=-1, running=1)
+            try:
+                with api.bind_session(session):
+                    result = function(*args, **kwargs)
+            except Exception:
+                self._update_metrics(name, running=-1, failed=1)
+                raise
+
+            self._update_metrics(name, running=-1, completed=1)
+            return result
+
+        submitted = False
+        try:
+            if semaphore is None:
+                future = self._submit(name, _run)
+                submitted = True
+                return await future
+
+            async with semaphore:
+                future = self._submit(name, _run)
+                submitted = True
+                return await future
+
+        finally:
+            if not submitted:
+                self._update_metrics(name, queued=-1)
+
+    def get_metrics(self) -> dict:
+        with self._lock:
+            metrics = {name: dict(values) for name, values in self._metrics.items()}
+
+        return {
+            "max_workers": self.max_workers,
+            "queued": sum(values["queued"] for values in metrics.values()),
+            "running": sum(values["running"] for values in metrics.values()),
+            "endpoints": metrics,
+        }
+
+    def is_busy(self) -> bool:
+        """If any call is queued or running."""
+
+        with self._lock:
+            return any(
+                values["queued"] or values["running"]
+                for values in self._metrics.values()
+            )
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self, name, function) -> asyncio.Future:
+        """
+        Submit `function` to the executor. A call cancelled before it
+        starts never runs `function`, so it is taken off the queue here.
+        """
+
+        def _on_done(future):
+            if future.cancelled():
+                self._update_metrics(name, queued=-1)
+
+        future = self.executor.submit(function)
+        future.add_done_callback(_on_done)
+        return asyncio.wrap_future(future)
+
+    def _update_metrics(self, name, **changes):
+        with self._lock:
+            values = self._metrics.setdefault(
+                name,
+                {
+                    "queued": 0,
+                    "running": 0,
+                    "completed": 0,
+                    "failed": 0,
+                    "peak_queued": 0,
+                },
+            )
+            for key, change in changes.items():
+                values[key] += change
+
+            values["peak_queued"] = max(values["peak_queued"], values["queued"])
+
+
+p4_executor = P4Executor()
+
+
+def _run_api(attribute_name, *args, **kwargs):
+    # Resolve the `api` function on the worker thread,
+    # so it runs on that thread's connection manager:
+    return getattr(api, attribute_name)(*args, **kwargs)
+
 
 class PerforceRestApiEndpoint(RestApiEndpoint):
+    # Maximum number of concurrent calls of this endpoint,
+    # `None` is only limited by the size of `p4_executor`:
+    max_concurrency = None
+
     def __init__(self):
         super(PerforceRestApiEndpoint, self).__init__()
+        self._semaphore = None
+
+    async def dispatch(self, request):
+        # Each request is handled in its own task, with its own context:
+        _request_session_key.set(request.headers.get(SESSION_HEADER))
+        return await super(PerforceRestApiEndpoint, self).dispatch(request)
+
+    async def run_p4(self, function, *args, **kwargs):
+        """
+        Run a blocking P4 call on `p4_executor`, with the session
+        of the DCC that made the request.
+        """
+
+        if self.max_concurrency and self._semaphore is None:
+            # Created lazily so it is bound to the webserver's loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        session_key = _request_session_key.get()
+        session = api.get_session(session_key)
+        if session_key and session is None:
+            log.debug("Unknown session, running with the last login")
+
+        return await p4_executor.run(
+            self.__class__.__name__,
+            self._semaphore,
+            session,
+            function,
+            *args,
+            **kwargs
+        )
 
     @staticmethod
     def json_dump_handler(value):
@@ -38,11 +218,18 @@ class PerforceRestApiEndpoint(RestApiEndpoint):
 
 class LoginEndpoint(PerforceRestApiEndpoint):
     """Returns list of workspaces."""
+    # Logins also set the session of the calls that don't send one,
+    # so run them one at a time:
+    max_concurrency = 1
+
     async def post(self, request) -> Response:
         content = await request.json()
-        result = api.login(content["host"], content["port"],
-                           content["username"], content["password"],
-                           content["workspace_dir"], content['workspace_name'])
+        result = await self.run_p4(
+            _run_api, "login",
+            content["host"], content["port"],
+            content["username"], content["password"],
+            content["workspace_dir"], content['workspace_name']
+        )
         return Response(
             status=200,
             body=self.encode(result),
@@ -54,7 +241,9 @@ class IsPathInAnyWorkspace(PerforceRestApiEndpoint):
     """Returns list of workspaces."""
     async def post(self, request) -> Response:
         content = await request.json()
-        result = api._is_path_under_any_root(content["path"])
+        result = await self.run_p4(
+            _run_api, "_is_path_under_any_root", content["path"]
+        )
         return Response(
             status=200,
             body=self.encode(result),
@@ -68,8 +257,9 @@ class AddEndpoint(PerforceRestApiEndpoint):
         log.debug("AddEndpoint called")
         content = await request.json()
 
-        result = VersionControlPerforce.add(content["path"],
-                                            content["comment"])
+        result = await self.run_p4(
+            VersionControlPerforce.add, content["path"], content["comment"]
+        )
         return Response(
             status=200,
             body=self.encode(result),
@@ -82,8 +272,9 @@ class DeleteEndpoint(PerforceRestApiEndpoint):
         log.debug("DeleteEndpoint called")
         content = await request.json()
 
-        result = VersionControlPerforce.delete(content["path"],
-                                            content["comment"])
+        result = await self.run_p4(
+            VersionControlPerforce.delete, content["path"], content["comment"]
+        )
         return Response(
             status=200,
             body=self.encode(result),
@@ -97,7 +288,8 @@ class CreateWorkspaceEndpoint(PerforceRestApiEndpoint):
         log.debug("CreateWorkspaceEndpoint called")
         content = await request.json()
 
-        result = VersionControlPerforce.create_workspace(
+        result = await self.run_p4(
+            VersionControlPerforce.create_workspace,
             content["workspace_name"],
             content["workspace_root"],
             content["stream"],
@@ -115,7 +307,9 @@ class WorkspaceExistsEndpoint(PerforceRestApiEndpoint):
     async def post(self, request) -> Response:
         log.debug("WorkspaceExists called")
         content = await request.json()
-        result = VersionControlPerforce.workspace_exists(content["workspace"])
+        result = await self.run_p4(
+            VersionControlPerforce.workspace_exists, content["workspace"]
+        )
         return Response(
             status=200,
             body=self.encode(result),
@@ -124,11 +318,18 @@ class WorkspaceExistsEndpoint(PerforceRestApiEndpoint):
 
 class SyncLatestEndpoint(PerforceRestApiEndpoint):
     """Returns list of dict with project info (id, name)."""
+    # Keep long syncs from taking every executor worker:
+    max_concurrency = 2
+
     async def post(self, request) -> Response:
         log.debug("SyncLatestEndpoint called")
         content = await request.json()
 
-        result = VersionControlPerforce.sync_latest_version(content["path"])
+        result = await self.run_p4(
+            VersionControlPerforce.sync_latest_version,
+            content["path"],
+            content.get("checkpoint", False)
+        )
         return Response(
             status=200,
             body=self.encode(result),
@@ -138,13 +339,19 @@ class SyncLatestEndpoint(PerforceRestApiEndpoint):
 
 class SyncVersionEndpoint(PerforceRestApiEndpoint):
     """Returns list of dict with project info (id, name)."""
+    max_concurrency = 2
+
     async def post(self, request) -> Response:
         log.debug("SyncVersionEndpoint called")
         content = await request.json()
 
         log.debug(f"Syncing '{content['path']}' to {content['version']}")
-        result = VersionControlPerforce.sync_to_version(content["path"],
-                                                        content["version"])
+        result = await self.run_p4(
+            VersionControlPerforce.sync_to_version,
+            content["path"],
+            content["version"],
+            content.get("checkpoint", False)
+        )
         log.debug("Synced")
         return Response(
             status=200,
@@ -160,8 +367,9 @@ class CheckoutEndpoint(PerforceRestApiEndpoint):
 
         content = await request.json()
 
-        result = VersionControlPerforce.checkout(content["path"],
-                                                 content["comment"])
+        result = await self.run_p4(
+            VersionControlPerforce.checkout, content["path"], content["comment"]
+        )
         return Response(
             status=200,
             body=self.encode(result),
@@ -176,7 +384,9 @@ class IsCheckoutedEndpoint(PerforceRestApiEndpoint):
 
         content = await request.json()
 
-        result = VersionControlPerforce.is_checkedout(content["path"])
+        result = await self.run_p4(
+            VersionControlPerforce.is_checkedout, content["path"]
+        )
         return Response(
             status=200,
             body=self.encode(result),
@@ -191,7 +401,7 @@ class GetChanges(PerforceRestApiEndpoint):
         content = await request.json()
 
         log.debug(f"Content {content}")
-        result = VersionControlPerforce.get_changes(content)
+        result = await self.run_p4(VersionControlPerforce.get_changes, content)
         return Response(
             status=200,
             body=self.encode(result),
@@ -205,7 +415,7 @@ class GetLastChangelist(PerforceRestApiEndpoint):
         log.debug("GetLatestChangelist called")
         content = await request.json()
 
-        result = VersionControlPerforce.get_last_change_list()
+        result = await self.run_p4(VersionControlPerforce.get_last_change_list)
         return Response(
             status=200,
             body=self.encode(result),
@@ -219,7 +429,9 @@ class SubmitChangelist(PerforceRestApiEndpoint):
         log.debug("SubmitChangelist called")
         content = await request.json()
 
-        result = VersionControlPerforce.submit_change_list(content["comment"])
+        result = await self.run_p4(
+            VersionControlPerforce.submit_change_list, content["comment"]
+        )
         return Response(
             status=200,
             body=self.encode(result),
@@ -233,7 +445,25 @@ class ExistsOnServer(PerforceRestApiEndpoint):
         log.debug("exists_on_server called")
         content = await request.json()
 
-        result = VersionControlPerforce.exists_on_server(content["path"])
+        result = await self.run_p4(
+            VersionControlPerforce.exists_on_server, content["path"]
+        )
+        return Response(
+            status=200,
+            body=self.encode(result),
+            content_type="application/json"
+        )
+
+
+class BatchEndpoint(PerforceRestApiEndpoint):
+    """Runs a list of path operations, returning their results in order."""
+    async def post(self, request) -> Response:
+        log.debug("BatchEndpoint called")
+        content = await request.json()
+
+        result = await self.run_p4(
+            VersionControlPerforce.batch, content["operations"]
+        )
         return Response(
             status=200,
             body=self.encode(result),
@@ -244,7 +474,7 @@ class ExistsOnServer(PerforceRestApiEndpoint):
 class GetServerVersionEndpoint(PerforceRestApiEndpoint):
     """Returns list of dict with project info (id, name)."""
     async def get(self) -> Response:
-        result = VersionControlPerforce.get_server_version()
+        result = await self.run_p4(VersionControlPerforce.get_server_version)
         return Response(
             status=200,
             body=self.encode(result),
@@ -257,7 +487,31 @@ class GetStreamEndpoint(PerforceRestApiEndpoint):
     async def post(self, request) -> Response:
         content = await request.json()
 
-        result = VersionControlPerforce.get_stream(content["workspace_dir"])
+        result = await self.run_p4(
+            VersionControlPerforce.get_stream, content["workspace_dir"]
+        )
+        return Response(
+            status=200,
+            body=self.encode(result),
+            content_type="application/json"
+        )
+
+
+class MetricsEndpoint(PerforceRestApiEndpoint):
+    """Returns queue depth and call counts of the P4 executor."""
+    async def get(self) -> Response:
+        return Response(
+            status=200,
+            body=self.encode(p4_executor.get_metrics()),
+            content_type="application/json"
+        )
+
+
+class PausePrefetchEndpoint(PerforceRestApiEndpoint):
+    """Pauses the background prefetch, for example while a DCC saves."""
+    async def post(self, request) -> Response:
+        content = await request.json()
+        result = prefetch.pause_prefetch(content.get("seconds", 60))
         return Response(
             status=200,
             body=self.encode(result),
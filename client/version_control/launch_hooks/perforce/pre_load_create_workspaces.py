@@ -4,7 +4,7 @@ from ayon_applications import LaunchTypes, PreLaunchHook
 from ayon_core.addon import AddonsManager
 from version_control.addon import VersionControlAddon
 from version_control.api import perforce
-from version_control.api.models import ServerWorkspaces
+from version_control.api.models import get_server_workspaces
 
 
 class PreLaunchCreateWorkspaces(PreLaunchHook):
@@ -39,7 +39,7 @@ class PreLaunchCreateWorkspaces(PreLaunchHook):
         if not version_control_settings["enabled"]:
             return
 
-        server_workspaces = ServerWorkspaces(project_name)
+        server_workspaces = get_server_workspaces(project_name)
 
         for workspace in server_workspaces.workspaces:
             conn_info = perforce.get_connection_info(
@@ -2,8 +2,10 @@ from ayon_applications import LaunchTypes, PreLaunchHook
 from ayon_applications.exceptions import ApplicationLaunchFailed
 from ayon_core.pipeline.anatomy.anatomy import Anatomy
 from version_control.api import perforce
-from version_control.api.models import ServerWorkspaces
+from version_control.api.models import get_server_workspaces
+import pathlib
 import platform
+import time
 
 
 class PrelaunchAlwaySyncFile(PreLaunchHook):
@@ -50,33 +52,63 @@ class PrelaunchAlwaySyncFile(PreLaunchHook):
         return True
 
     def execute(self):
+        started = time.perf_counter()
         project_name = self.data["project_name"]
         anatomy = Anatomy(project_name)
 
-        project_name = self.data["project_name"]
         project_settings = self.data["project_settings"]
         version_control_settings = project_settings['version_control']
 
         if not version_control_settings["enabled"]:
             return
 
-        server_workspaces = ServerWorkspaces(project_name)
+        server_workspaces = get_server_workspaces(project_name)
+        servers = perforce.fetch_project_servers(project_name)
 
+        # Log in once per server, the workspaces of a server share the
+        # session and their paths are routed to the right workspace:
+        logged_in_servers = set()
+        synced_folder_count = 0
         for workspace in server_workspaces.workspaces:
-            conn_info = perforce.get_connection_info(
-                project_name, configured_workspace=workspace.name
+            conn_info = perforce.get_workspace_connection_info(
+                workspace, servers
             )
+            if not conn_info:
+                raise ApplicationLaunchFailed(f"Unable to log in to {workspace.server}")
+
+            server_name = conn_info.workspace_server.name
+            login = server_name not in logged_in_servers
 
             self.log.debug(f"Checking if workspace {workspace.workspace_name} exists")
 
-            if not perforce.workspace_exists(conn_info):
+            if not perforce.workspace_exists(conn_info, login=login):
                 raise ApplicationLaunchFailed(f"Workspace {workspace.workspace_name} does not exist, did other hook not run?")
 
+            logged_in_servers.add(server_name)
             self.log.debug(f"Workspace {workspace.workspace_name} exists")
 
-            for sync_file in workspace.always_sync:
-                conn_info.workspace_info.stream
-                current_root = str(anatomy.roots[conn_info.workspace_info.workspace_root])
-                local_file = sync_file.replace(conn_info.workspace_info.stream, current_root)
-                self.log.info(f"Syncing: {local_file}")
-                perforce.sync_target_to_latest(conn_info, local_file)
+            if not workspace.always_sync:
+                continue
+
+            # Like `sync_target_to_latest`, each file's folder is synced,
+            # with the folders of all the files in one call:
+            current_root = str(anatomy.roots[conn_info.workspace_info.workspace_root])
+            local_files = (
+                sync_file.replace(conn_info.workspace_info.stream, current_root)
+                for sync_file in workspace.always_sync
+            )
+            local_folders = list(dict.fromkeys(
+                f"{pathlib.Path(local_file).parent.as_posix()}/..."
+                for local_file in local_files
+            ))
+            self.log.info(f"Syncing: {local_folders}")
+            perforce.sync_paths_to_latest(
+                conn_info, local_folders, login=False, checkpoint=True
+            )
+            synced_folder_count += len(local_folders)
+
+        self.log.info(
+            f"Always sync of {synced_folder_count} folders for "
+            f"{self.launch_context.app_name} took "
+            f"{time.perf_counter() - started:.2f}s"
+        )
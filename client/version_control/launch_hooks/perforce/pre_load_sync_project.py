@@ -15,7 +15,7 @@ from ayon_applications.exceptions import ApplicationLaunchFailed
 from ayon_core.tools.utils import qt_app_context
 
 from version_control.api import perforce
-from version_control.api.models import ServerWorkspaces
+from version_control.api.models import get_server_workspaces
 from version_control.ui.changes_viewer import ChangesWindows
 
 
@@ -45,7 +45,7 @@ class SyncUnrealProject(PreLaunchHook):
         if not version_control_settings["enabled"]:
             return
 
-        server_workspaces = ServerWorkspaces(project_name)
+        server_workspaces = get_server_workspaces(project_name)
 
         host_name = self.launch_context.host_name
         self.log.debug(f"Launch Context Host: {self.launch_context.host_name}")
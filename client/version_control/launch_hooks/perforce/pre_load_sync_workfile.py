@@ -1,7 +1,7 @@
 from ayon_applications import LaunchTypes, PreLaunchHook
 from ayon_applications.exceptions import ApplicationLaunchFailed
 from version_control.api import perforce
-from version_control.api.models import ServerWorkspaces
+from version_control.api.models import get_server_workspaces
 import platform
 
 
@@ -58,7 +58,7 @@ class PrelaunchSyncWorkfiles(PreLaunchHook):
         if not version_control_settings["enabled"]:
             return
 
-        server_workspaces = ServerWorkspaces(project_name)
+        server_workspaces = get_server_workspaces(project_name)
 
         for workspace in server_workspaces.workspaces:
             conn_info = perforce.get_connection_info(
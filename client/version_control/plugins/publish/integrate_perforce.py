@@ -62,27 +62,63 @@ class IntegratePerforce(pyblish.api.InstancePlugin):
                 f"- version: {version} submitted by {user} at {actual_time}"
             )
 
-            for source_path, version_control_path in repre["transfers"]:
-                is_on_server = PerforceRestStub.exists_on_server(
-                    version_control_path
-                )
-                if is_on_server:
-                    if PerforceRestStub.is_checkouted(version_control_path):
-                        raise RuntimeError(
-                            "{} is checkouted by someone already, "
-                            "cannot commit right now.".format(
-                                version_control_path
-                            )
+            transfers = repre["transfers"]
+            version_control_paths = [
+                version_control_path
+                for _, version_control_path in transfers
+            ]
+            is_on_server, is_checkouted = PerforceRestStub.batch(
+                [
+                    {
+                        "operation": "exists_on_server",
+                        "path": version_control_paths,
+                    },
+                    {
+                        "operation": "is_checkouted",
+                        "path": version_control_paths,
+                    },
+                ]
+            )
+
+            paths_to_checkout = []
+            paths_to_add = []
+            for version_control_path, on_server, checkouted in zip(
+                version_control_paths, is_on_server, is_checkouted
+            ):
+                if not on_server:
+                    paths_to_add.append(version_control_path)
+                    continue
+
+                if checkouted:
+                    raise RuntimeError(
+                        "{} is checkouted by someone already, "
+                        "cannot commit right now.".format(
+                            version_control_path
                         )
-                    if not PerforceRestStub.checkout(
-                        version_control_path, comment
-                    ):
+                    )
+                paths_to_checkout.append(version_control_path)
+
+            if paths_to_checkout:
+                checkout_result = PerforceRestStub.batch(
+                    [
+                        {
+                            "operation": "checkout",
+                            "path": paths_to_checkout,
+                            "comment": comment,
+                        }
+                    ]
+                )[0]
+                for version_control_path, checkouted in zip(
+                    paths_to_checkout, checkout_result
+                ):
+                    if not checkouted:
                         raise ValueError(
                             "File {} not checkouted".format(
                                 version_control_path
                             )
                         )
 
+            for source_path, version_control_path in transfers:
                 self.log.debug(f"{source_path} -- {version_control_path}")
                 if (
                     pathlib.Path(source_path)
@@ -90,8 +126,21 @@ class IntegratePerforce(pyblish.api.InstancePlugin):
                     and not pathlib.Path(version_control_path).exists()
                 ):
                     shutil.copy(source_path, version_control_path)
-                if not is_on_server:
-                    if not PerforceRestStub.add(version_control_path, comment):
+
+            if paths_to_add:
+                add_result = PerforceRestStub.batch(
+                    [
+                        {
+                            "operation": "add",
+                            "path": paths_to_add,
+                            "comment": comment,
+                        }
+                    ]
+                )[0]
+                for version_control_path, added in zip(
+                    paths_to_add, add_result
+                ):
+                    if not added:
                         raise ValueError(
                             "File {} not added to changelist".format(
                                 version_control_path
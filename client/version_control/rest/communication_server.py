@@ -7,6 +7,7 @@ from contextlib import closing
 
 from aiohttp import web
 
+from version_control.backends.perforce import rest_routes
 from version_control.rest.perforce.rest_api import PerforceModuleRestAPI
 
 log = logging.getLogger(__name__)
@@ -167,6 +168,8 @@ class WebServerThread(threading.Thread):
         log.debug("# Site stopped")
         await self.runner.cleanup()
         log.debug("# Server runner stopped")
+        rest_routes.p4_executor.shutdown()
+        log.debug("# P4 executor stopped")
         tasks = [
             task for task in asyncio.all_tasks()
             if task is not asyncio.current_task()
@@ -112,6 +112,13 @@ class PerforceModuleRestAPI:
             exists_on_server.dispatch
         )
 
+        batch = rest_routes.BatchEndpoint()
+        self.server_manager.add_route(
+            "POST",
+            self.prefix + "/batch",
+            batch.dispatch
+        )
+
         get_stream = rest_routes.GetStreamEndpoint()
         self.server_manager.add_route(
             "POST",
@@ -125,3 +132,17 @@ class PerforceModuleRestAPI:
             self.prefix + "/workspace_exists",
             workspace_exists.dispatch
         )
+
+        metrics = rest_routes.MetricsEndpoint()
+        self.server_manager.add_route(
+            "GET",
+            self.prefix + "/metrics",
+            metrics.dispatch
+        )
+
+        pause_prefetch = rest_routes.PausePrefetchEndpoint()
+        self.server_manager.add_route(
+            "POST",
+            self.prefix + "/pause_prefetch",
+            pause_prefetch.dispatch
+        )
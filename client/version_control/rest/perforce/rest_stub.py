@@ -1,8 +1,15 @@
+import collections
 import os
+import threading
+import time
 import typing
 
 import requests
 import six
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ayon_core.lib import Logger
 
 if six.PY2:
     import pathlib2 as pathlib
@@ -14,22 +21,189 @@ if _typing:
     from typing import Any, Sequence
 del _typing
 
+log = Logger.get_logger("PerforceRestStub")
 
-class PerforceRestStub:
-    @staticmethod
-    def _wrap_call(command, **kwargs):
-        webserver_url = os.environ.get("PERFORCE_WEBSERVER_URL")
+# The header holding the key of the session a call runs with,
+# as returned by the login of this process:
+SESSION_HEADER = "X-Perforce-Session"
+
+# Default of the `PerforceRestStub.configure` arguments that aren't changed,
+# as `None` is a valid value for some of them:
+_UNCHANGED = object()
+
+
+class _StubSession:
+    """Keep-alive HTTP session shared by every `PerforceRestStub` call.
+
+    Reusing one pooled session avoids a new TCP connection to the tray
+    webserver per call. Connection errors are retried with a backoff,
+    this is safe for POST requests as nothing reached the server yet.
+    The duration of each call is kept per command, see
+    `PerforceRestStub.get_call_stats`.
+    Once logged in, every call sends the key of the login's session,
+    so the tray runs it with this process's server, user and workspace.
+    """
+
+    connect_timeout = 5.0
+    # Syncs can take a long time, so don't time out waiting for them:
+    read_timeout = None
+    retries = 3
+    backoff_factor = 0.2
+    pool_maxsize = 8
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._session = None
+        self._webserver_url = None
+        self._stats = {}
+        self.session_key = None  # type: str | None
+        self.recent_calls = collections.deque(maxlen=100)
+
+    @property
+    def session(self) -> requests.Session:
+        with self._lock:
+            if self._session is None:
+                self._session = self._create_session()
+            return self._session
+
+    @property
+    def webserver_url(self) -> str:
+        if self._webserver_url is None:
+            webserver_url = os.environ.get("PERFORCE_WEBSERVER_URL")
+            if not webserver_url:
+                raise RuntimeError("Unknown url for Perforce")
+
+            self._webserver_url = webserver_url
+
+        return self._webserver_url
+
+    def reset(self, webserver_url=None):
+        # type: (str | None) -> None
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+            self._webserver_url = webserver_url
+
+    def post(self, command, payload):
+        # type: (str, dict[str, Any]) -> requests.Response
+        action_url = f"{self.webserver_url}/perforce/{command}"
+        headers = {SESSION_HEADER: self.session_key} if self.session_key else None
+        start = time.perf_counter()
+        try:
+            response = self.session.post(
+                action_url,
+                json=payload,
+                headers=headers,
+                timeout=(self.connect_timeout, self.read_timeout),
+            )
+        except requests.ConnectionError:
+            # The tray may have restarted on another url:
+            self._webserver_url = None
+            raise
+
+        finally:
+            self._record(command, time.perf_counter() - start)
+
+        return response
+
+    def get_stats(self):
+        # type: () -> dict[str, dict[str, float]]
+        with self._lock:
+            return {
+                command: dict(values) for command, values in self._stats.items()
+            }
+
+    def _record(self, command, duration):
+        # type: (str, float) -> None
+        with self._lock:
+            values = self._stats.setdefault(
+                command, {"count": 0, "total": 0.0, "max": 0.0}
+            )
+            values["count"] += 1
+            values["total"] += duration
+            values["max"] = max(values["max"], duration)
+            self.recent_calls.append((command, duration))
+
+        log.debug(f"{command} took {duration * 1000:.1f}ms")
+
+    def _create_session(self) -> requests.Session:
+        retry_kwargs = {
+            "total": self.retries,
+            "connect": self.retries,
+            "read": 0,
+            "status": 0,
+            "backoff_factor": self.backoff_factor,
+        }
+        try:
+            retry = Retry(allowed_methods=None, **retry_kwargs)
+        except TypeError:
+            # urllib3 < 1.26:
+            retry = Retry(method_whitelist=None, **retry_kwargs)
+
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
 
-        if not webserver_url:
-            raise RuntimeError("Unknown url for Perforce")
 
-        action_url = f"{webserver_url}/perforce/{command}"
+_stub_session = _StubSession()
 
-        response = requests.post(action_url, json=kwargs)
+
+class PerforceRestStub:
+    @staticmethod
+    def _wrap_call(command, **kwargs):
+        response = _stub_session.post(command, kwargs)
         if not response.ok:
             raise RuntimeError(response.text)
         return response.json()
 
+    @staticmethod
+    def configure(
+        connect_timeout=_UNCHANGED,
+        read_timeout=_UNCHANGED,
+        retries=_UNCHANGED,
+        backoff_factor=_UNCHANGED,
+        webserver_url=None,
+    ):
+        # type: (float | None, float | None, int, float, str | None) -> None
+        """Change the timeouts and retries of the shared HTTP session.
+
+        Arguments that aren't given are left unchanged.
+
+        Args:
+            connect_timeout (float | None, optional): Seconds to wait for
+                the connection to the tray webserver, `None` waits forever.
+            read_timeout (float | None, optional): Seconds to wait for a
+                response, `None` waits forever.
+            retries (int, optional): Retries of failed connections.
+            backoff_factor (float, optional): Backoff between retries.
+            webserver_url (str, optional): Url used instead of
+                `PERFORCE_WEBSERVER_URL`.
+        """
+        if connect_timeout is not _UNCHANGED:
+            _stub_session.connect_timeout = connect_timeout
+        if read_timeout is not _UNCHANGED:
+            _stub_session.read_timeout = read_timeout
+        if retries is not _UNCHANGED:
+            _stub_session.retries = retries
+        if backoff_factor is not _UNCHANGED:
+            _stub_session.backoff_factor = backoff_factor
+
+        _stub_session.reset(webserver_url)
+
+    @staticmethod
+    def get_call_stats():
+        # type: () -> dict[str, dict[str, float]]
+        """Call count, total and max duration in seconds per command."""
+        return _stub_session.get_stats()
+
     @staticmethod
     def is_in_any_workspace(path):
         response = PerforceRestStub._wrap_call("is_in_any_workspace", path=path)
@@ -56,6 +230,10 @@ class PerforceRestStub:
             workspace_dir=workspace_dir,
             workspace_name=workspace_name,
         )
+        # The key of the session the following calls run with:
+        if isinstance(response, str):
+            _stub_session.session_key = response
+
         return response
 
     @staticmethod
@@ -89,14 +267,16 @@ class PerforceRestStub:
         return response
 
     @staticmethod
-    def sync_latest_version(path):
-        response = PerforceRestStub._wrap_call("sync_latest_version", path=path)
+    def sync_latest_version(path, checkpoint=False):
+        response = PerforceRestStub._wrap_call(
+            "sync_latest_version", path=path, checkpoint=checkpoint
+        )
         return response
 
     @staticmethod
-    def sync_to_version(path, version):
+    def sync_to_version(path, version, checkpoint=False):
         response = PerforceRestStub._wrap_call(
-            "sync_to_version", path=path, version=version
+            "sync_to_version", path=path, version=version, checkpoint=checkpoint
         )
         return response
 
@@ -132,9 +312,49 @@ class PerforceRestStub:
         response = PerforceRestStub._wrap_call("exists_on_server", path=path)
         return response
 
+    @staticmethod
+    def batch(operations):
+        # type: (Sequence[dict[str, Any]]) -> list[list[Any]]
+        """Run many path operations in a single request.
+
+        Each operation is a dict with an `operation` name, a `path` list
+        and optional arguments, e.g.:
+            {"operation": "checkout", "path": [...], "comment": "..."}
+
+        Supported operations: exists_on_server, is_checkouted, checkout,
+        add, delete, sync_latest_version.
+
+        Returns:
+            list[list[Any]]: Per path results of each operation, in order.
+        """
+        operations = [
+            dict(
+                operation,
+                path=[
+                    str(path)
+                    for path in (
+                        operation["path"]
+                        if isinstance(operation["path"], (list, tuple))
+                        else [operation["path"]]
+                    )
+                ],
+            )
+            for operation in operations
+        ]
+        response = PerforceRestStub._wrap_call("batch", operations=operations)
+        return response
+
     @staticmethod
     def get_stream(workspace_dir):
         response = PerforceRestStub._wrap_call(
             "get_stream", workspace_dir=workspace_dir
         )
         return response
+
+    @staticmethod
+    def pause_prefetch(seconds=60):
+        """Pause the tray's background prefetch, `0` resumes it."""
+        response = PerforceRestStub._wrap_call(
+            "pause_prefetch", seconds=seconds
+        )
+        return response
@@ -7,7 +7,7 @@ from ayon_core.tools.workfiles.control import BaseWorkfileController
 from version_control.api.exceptions import LoginError
 from version_control.api.models.connection_info import ConnectionInfo
 from version_control.api.models.perforce_file_info import PerforceFileInfo
-from version_control.api.models.server_workspaces import ServerWorkspaces
+from version_control.api.models.server_workspaces import get_server_workspaces
 from version_control.api.perforce import get_connection_info
 from version_control.rest.perforce.rest_stub import PerforceRestStub
 
@@ -105,7 +105,7 @@ class UserSubmitController:
         host = self._host
         project = self._project
 
-        server_workspaces = ServerWorkspaces(project)
+        server_workspaces = get_server_workspaces(project)
         workspaces = server_workspaces.get_host_workspaces(self._host.name, True)
         if not workspaces:
             raise ValueError(f"Unable to get workspaces for {host.name}")
@@ -3,7 +3,7 @@ import typing
 from qtpy import QtCore, QtGui, QtWidgets
 
 from ayon_core.tools.utils.projects_widget import ProjectsQtModel
-from version_control.api.models import ServerWorkspaces
+from version_control.api.models import get_server_workspaces
 
 WORKSPACE_LABEL_ROLE = QtCore.Qt.UserRole + 100  # pyright: ignore[]
 WORKSPACE_SERVER_ROLE = QtCore.Qt.UserRole + 101  # pyright: ignore[]
@@ -38,7 +38,7 @@ class QtWorkspaceInfo(QtGui.QStandardItemModel):
             self.set_project(project_name)
 
     def set_project(self, project_name: str) -> None:
-        self._server_workspaces = ServerWorkspaces(project_name)
+        self._server_workspaces = get_server_workspaces(project_name)
         self._fill_items()
 
     def _fill_items(self):
@@ -18,8 +18,17 @@ from typing_extensions import override
 
 from version_control.addon import VersionControlAddon
 from version_control.api.exceptions import ConfigurationError
-from version_control.api.models import ConnectionInfo, WorkspaceInfo
-from version_control.api.perforce import create_workspace, get_connection_info
+from version_control.api.models import (
+    ConnectionInfo,
+    WorkspaceInfo,
+    invalidate_server_workspaces,
+)
+from version_control.api.perforce import (
+    create_workspace,
+    get_connection_info,
+    invalidate_connection_cache,
+    invalidate_project_caches,
+)
 from version_control.api.pipeline import VersionControlHost
 from version_control.ui.workspace_wizard.delegates import WorkspaceIconDelegate
 from version_control.ui.workspace_wizard.models import (
@@ -171,12 +180,20 @@ class PerforceWorkspaces(QtWidgets.QWizard):
 
             # Connect signals
             worker.finished.connect(thread.quit)
+            worker.finished.connect(
+                partial(self._on_workspace_created, self._project_name)
+            )
             worker.progress_updated.connect(self.show_progress)
             thread.started.connect(partial(worker.create_workspace, conn_info))
 
             # Start the thread
             thread.start()
 
+    def _on_workspace_created(self, project_name):
+        # The workspaces of the project are resolved again with the new one:
+        invalidate_server_workspaces(project_name)
+        invalidate_connection_cache(project_name)
+
     def show_progress(self, progress):
         QtWidgets.QMessageBox.information(
             self,
@@ -202,6 +219,8 @@ class PerforceWorkspaces(QtWidgets.QWizard):
                     selected_index, role=QtCore.Qt.ItemDataRole.DisplayRole
                 )
                 log.info(f"{project_name}")
+                # Pick up any change made to the settings of the project:
+                invalidate_project_caches(project_name)
                 project_settings = get_project_settings(project_name)
                 version_control_settings = project_settings["version_control"]
                 workspace_names = list(
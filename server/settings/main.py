@@ -138,6 +138,66 @@ class WorkspaceSettingsModel(BaseSettingsModel):
     )
 
 
+class PrefetchSettingsModel(BaseSettingsModel):
+    _isGroup = True
+    enabled: bool = Field(False, title="Enabled")
+    projects: list[str] = Field(
+        default_factory=list,
+        title="Projects",
+        description="Projects whose workspaces get their Always Sync and Start Up Files prefetched by the tray.",
+    )
+    interval: int = Field(
+        30,
+        title="Interval (minutes)",
+        ge=1,
+    )
+    bandwidth_limit: float = Field(
+        0.0,
+        title="Bandwidth Limit (MB/s)",
+        description="0 for no limit.",
+        ge=0,
+    )
+
+
+class ConnectionSettingsModel(BaseSettingsModel):
+    _isGroup = True
+    pool_size: int = Field(
+        8,
+        title="Connection Pool Size",
+        description="The maximum number of open connections to the Perforce servers.",
+        ge=1,
+    )
+    idle_timeout: int = Field(
+        300,
+        title="Idle Connection Timeout (seconds)",
+        description="How long an unused connection is kept open.",
+        ge=0,
+    )
+    acquire_timeout: int = Field(
+        60,
+        title="Connection Wait Timeout (seconds)",
+        description="How long a call waits for a free connection when all of them are in use.",
+        ge=1,
+    )
+    workspace_cache_ttl: int = Field(
+        300,
+        title="Workspace Cache Lifetime (seconds)",
+        description="How long the workspaces of the machine are cached before they are queried again.",
+        ge=0,
+    )
+    persist_workspace_cache: bool = Field(
+        True,
+        title="Persist Workspace Cache",
+        description="Save the cached workspaces to disk, so they are reused after the tray restarts.",
+    )
+    login_cache_ttl: int = Field(
+        300,
+        title="Login Cache Lifetime (seconds)",
+        description="How long a login is trusted before its ticket is checked again.",
+        ge=0,
+    )
+
+
 class LocalWorkspaceSettingsModel(BaseSettingsModel):
     name: str = Field("", title="Name", scope=["site"])
     server: str = Field("", title="Server", scope=["site"])
@@ -188,6 +248,18 @@ class VersionControlSettings(BaseSettingsModel):
             "studio -> project -> site"
         ),
     )
+    prefetch: PrefetchSettingsModel = Field(
+        default_factory=PrefetchSettingsModel,
+        title="Background Prefetch",
+        scope=["studio"],
+        description="Periodically sync files that launches need from the tray, while it is idle.",
+    )
+    connection: ConnectionSettingsModel = Field(
+        default_factory=ConnectionSettingsModel,
+        title="Perforce Connections",
+        scope=["studio"],
+        description="Connection pooling and caching of the tray's calls to the Perforce servers.",
+    )
     local_settings: LocalSubmodel = Field(
         default_factory=LocalSubmodel,
         title="Local settings",
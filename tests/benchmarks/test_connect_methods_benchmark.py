@@ -0,0 +1,47 @@
+"""
+Benchmark of the `_connect_` method dispatch, deselected by default.
+Run with: `python -m pytest tests/benchmarks -m benchmark -s`
+"""
+import timeit
+
+import pytest
+
+from version_control.backends.perforce.api import P4ConnectionManager
+
+pytestmark = pytest.mark.benchmark
+
+CALLS = 10000
+
+
+class _WrappingManager(P4ConnectionManager):
+    """
+    Resolves every attribute through a Python level `__getattribute__`,
+    as the manager did before the dispatch table.
+    """
+
+    def __getattribute__(self, attribute_name):
+        return object.__getattribute__(self, attribute_name)
+
+
+def _time_get_stat(manager):
+    # type: (P4ConnectionManager) -> float
+    manager.get_stat("/ws/file.ma")
+    return min(timeit.repeat(lambda: manager.get_stat("/ws/file.ma"), number=CALLS, repeat=3))
+
+
+def test_get_stat_dispatch(manager, p4_server):
+    wrapping_manager = _WrappingManager()
+    settings = wrapping_manager._p4_settings
+    settings.port = "fake:1666"
+    settings.user = "artist"
+    settings.client = "ws"
+
+    dispatch = _time_get_stat(manager)
+    wrapping = _time_get_stat(wrapping_manager)
+
+    print(
+        f"\n{CALLS} get_stat calls: dispatch {dispatch:.3f}s "
+        f"({dispatch / CALLS * 1e6:.1f}us per call), "
+        f"__getattribute__ {wrapping:.3f}s ({wrapping / CALLS * 1e6:.1f}us per call)"
+    )
+    assert p4_server.count("fstat") == 2 * (3 * CALLS + 1)
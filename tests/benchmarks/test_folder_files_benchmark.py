@@ -0,0 +1,98 @@
+"""
+Benchmark of the records returned by the folder queries against a fake
+depot, deselected by default.
+Run with: `python -m pytest tests/benchmarks -m benchmark -s`
+"""
+import pytest
+
+from p4_fake import matches_filter
+
+pytestmark = pytest.mark.benchmark
+
+FOLDER = "/ws/scenes"
+EXTENSIONS = (".ma", ".MA", ".mb", ".png", ".json")
+
+
+def _create_records(folder, count):
+    return [
+        {
+            "clientFile": f"{folder}/file_{index:04}{EXTENSIONS[index % len(EXTENSIONS)]}",
+            "headTime": str(index),
+        }
+        for index in range(count)
+    ]
+
+
+class _Handler:
+    def __init__(self):
+        self.records = 0
+
+    def outputStat(self, data):
+        self.records += 1
+        return 0
+
+
+@pytest.fixture
+def depot_server(p4_server):
+    """
+    A folder of 500 files of mixed extensions, with 20 sub folders
+    holding 500 files each, whose fstat records are counted.
+    """
+
+    direct = _create_records(FOLDER, 500)
+    nested = [
+        record
+        for index in range(20)
+        for record in _create_records(f"{FOLDER}/sub_{index:02}", 500)
+    ]
+    p4_server.returned_records = 0
+
+    def fstat(p4, args, kwargs):
+        records = direct if args[-1].endswith("*") else direct + nested
+        if "-F" in args:
+            expression = args[args.index("-F") + 1]
+            records = [data for data in records if matches_filter(expression, data["clientFile"])]
+
+        if "-r" in args:
+            records = records[::-1]
+
+        if "-m" in args:
+            records = records[:int(args[args.index("-m") + 1])]
+
+        handler = kwargs["handler"]
+        for data in records:
+            p4_server.returned_records += 1
+            handler.outputStat(data)
+
+        return []
+
+    p4_server.handlers["fstat"] = fstat
+    return p4_server
+
+
+def _count_recursive_records(manager):
+    # The query before the server side filtering, of every file under the folder:
+    handler = _Handler()
+    with manager.__connect__():
+        manager.p4.run_fstat("-Sd", "-Rc", f"{FOLDER}\\...", handler=handler)
+
+    return handler.records
+
+
+@pytest.mark.parametrize(
+    "query, kwargs",
+    [
+        ("get_files_in_folder_in_date_order", {}),
+        ("get_files_in_folder_in_date_order", {"extensions": ["ma"]}),
+        ("get_newest_file_in_folder", {}),
+        ("get_newest_file_in_folder", {"extensions": ["png"]}),
+    ],
+)
+def test_folder_query_records(manager, depot_server, query, kwargs):
+    recursive = _count_recursive_records(manager)
+    depot_server.returned_records = 0
+
+    getattr(manager, query)([FOLDER], **kwargs)
+
+    print(f"\n{query} {kwargs}: {depot_server.returned_records} of {recursive} records")
+    assert depot_server.returned_records < recursive
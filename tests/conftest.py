@@ -0,0 +1,78 @@
+"""
+Shared setup of the tests.
+
+The tests run outside of AYON, so the top level `version_control`
+package, which imports the addon and the tray, is registered without
+running its `__init__`. Dependencies that aren't installed, like
+P4Python, Qt or ayon_core, are replaced by the minimal stand-ins of
+`tests/fakes`, while installed ones take precedence.
+"""
+import pathlib
+import socket
+import sys
+import types
+
+import pytest
+
+TESTS_DIR = pathlib.Path(__file__).parent
+CLIENT_DIR = TESTS_DIR.parent / "client"
+
+sys.path.insert(0, str(CLIENT_DIR))
+sys.path.append(str(TESTS_DIR / "fakes"))
+
+if "version_control" not in sys.modules:
+    _package = types.ModuleType("version_control")
+    _package.__path__ = [str(CLIENT_DIR / "version_control")]
+    sys.modules["version_control"] = _package
+
+import P4  # noqa: E402
+
+from p4_fake import FakeP4, FakeServer  # noqa: E402
+
+HOST_NAME = "test-host"
+
+
+@pytest.fixture
+def p4_server(monkeypatch):
+    """
+    A `FakeServer` that every new P4 connection talks to, with fresh
+    module level pools and caches. It knows a workspace `ws` rooted
+    at `/ws` on this host.
+    """
+
+    from version_control.backends.perforce import api
+    from version_control.backends.perforce.api import p4_login_cache
+    from version_control.backends.perforce.api import p4_pool
+    from version_control.backends.perforce.api import p4_workspace_cache
+
+    server = FakeServer()
+    server.handlers["clients"] = lambda p4, args, kwargs: [
+        {"client": "ws", "Host": HOST_NAME, "Root": "/ws", "Stream": ""}
+    ]
+    server.handlers["where"] = lambda p4, args, kwargs: [
+        {"depotFile": "//depot/ws/...", "path": "/ws/..."}
+    ]
+    monkeypatch.setattr(FakeP4, "server", server)
+    monkeypatch.setattr(P4, "P4", FakeP4)
+    monkeypatch.setattr(socket, "gethostname", lambda: HOST_NAME)
+    monkeypatch.setattr(p4_pool, "_connection_pool", None)
+    monkeypatch.setattr(p4_login_cache, "_login_cache", None)
+    monkeypatch.setattr(p4_workspace_cache, "_workspace_cache", None)
+    monkeypatch.setattr(api, "_session", None)
+    monkeypatch.setattr(api, "_sessions", {})
+    monkeypatch.setattr(api, "_thread_data", __import__("threading").local())
+    yield server
+
+
+@pytest.fixture
+def manager(p4_server):
+    """A connection manager logged in to the fake server, in workspace `ws`."""
+
+    from version_control.backends.perforce import api
+
+    manager = api.P4ConnectionManager()
+    settings = manager._p4_settings
+    settings.port = "fake:1666"
+    settings.user = "artist"
+    settings.client = "ws"
+    return manager
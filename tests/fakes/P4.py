@@ -0,0 +1,47 @@
+"""Stand-in for P4Python, with just the names the addon imports."""
+
+
+class P4Exception(Exception):
+    pass
+
+
+class OutputHandler:
+    REPORT = 0
+    HANDLED = 1
+    CANCEL = 2
+
+    def outputStat(self, stat):
+        return self.REPORT
+
+
+class Progress:
+    def init(self, type):
+        pass
+
+    def setDescription(self, description, units):
+        pass
+
+    def setTotal(self, total):
+        pass
+
+    def update(self, position):
+        pass
+
+    def done(self, fail):
+        pass
+
+
+class P4:
+    """Replaced by `p4_fake.FakeP4` in the tests that run commands."""
+
+    def __init__(self):
+        self.port = ""
+        self.user = ""
+        self.password = ""
+        self.client = ""
+        self.progress = None
+        self.warnings = []
+        self.errors = []
+
+    def connected(self):
+        return False
@@ -0,0 +1,3 @@
+from .log import Logger
+
+__all__ = ("Logger",)
@@ -0,0 +1,7 @@
+import logging
+
+
+class Logger:
+    @staticmethod
+    def get_logger(name):
+        return logging.getLogger(name)
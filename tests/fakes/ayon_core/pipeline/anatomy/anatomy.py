@@ -0,0 +1,4 @@
+class Anatomy:
+    def __init__(self, project_name=None):
+        self.project_name = project_name
+        self.roots = {}
@@ -0,0 +1,2 @@
+def get_template_data_with_names(project_name, *args, **kwargs):
+    return {"project": {"name": project_name}}
@@ -0,0 +1,3 @@
+from .lib import get_project_settings
+
+__all__ = ("get_project_settings",)
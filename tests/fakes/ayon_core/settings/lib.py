@@ -0,0 +1,6 @@
+# The settings of each project, set by the tests:
+PROJECT_SETTINGS = {}
+
+
+def get_project_settings(project_name):
+    return PROJECT_SETTINGS[project_name]
@@ -0,0 +1,32 @@
+class _BoundSignal:
+    def __init__(self):
+        self._slots = []
+
+    def connect(self, slot):
+        self._slots.append(slot)
+
+    def emit(self, *args):
+        for slot in self._slots:
+            slot(*args)
+
+
+class Signal:
+    def __init__(self, *types):
+        self._name = ""
+
+    def __set_name__(self, owner, name):
+        self._name = f"_signal_{name}"
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        signal = instance.__dict__.get(self._name)
+        if signal is None:
+            signal = instance.__dict__[self._name] = _BoundSignal()
+
+        return signal
+
+
+class QObject:
+    pass
@@ -0,0 +1 @@
+"""Stand-in for qtpy, with just the names the addon's backend imports."""
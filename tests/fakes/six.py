@@ -0,0 +1,12 @@
+PY2 = False
+PY3 = True
+
+
+def add_metaclass(metaclass):
+    def wrapper(cls):
+        namespace = dict(cls.__dict__)
+        namespace.pop("__dict__", None)
+        namespace.pop("__weakref__", None)
+        return metaclass(cls.__name__, cls.__bases__, namespace)
+
+    return wrapper
@@ -0,0 +1,144 @@
+"""
+A fake P4 server and the P4 connections talking to it.
+
+`FakeP4` replaces `P4.P4`, so the connection manager and the pool run
+against a `FakeServer` that records every command and answers it with
+the handler set for that command, if any.
+"""
+import fnmatch
+import functools
+import threading
+
+import P4
+
+
+def flatten(args):
+    flat = []
+    for arg in args:
+        if isinstance(arg, (list, tuple)):
+            flat.extend(flatten(arg))
+        else:
+            flat.append(str(arg))
+
+    return flat
+
+
+class FakeCommand:
+    __slots__ = ("name", "args", "client", "connection", "user")
+
+    def __init__(self, name, args, client, connection, user=""):
+        self.name = name
+        self.args = args
+        self.client = client
+        self.connection = connection
+        self.user = user
+
+    def __repr__(self):
+        return f"{self.name} {' '.join(self.args)}"
+
+
+class FakeServer:
+    """
+    Records the commands of its connections and answers them with
+    `handlers[name](p4, args, kwargs)`, or an empty result.
+    """
+
+    def __init__(self):
+        self.handlers = {}
+        self.commands = []
+        self.open_connections = 0
+        self.peak_connections = 0
+        self._lock = threading.Lock()
+
+    def count(self, name):
+        return len(self.get_commands(name))
+
+    def get_commands(self, name):
+        with self._lock:
+            return [command for command in self.commands if command.name == name]
+
+    def connect(self):
+        with self._lock:
+            self.open_connections += 1
+            self.peak_connections = max(self.peak_connections, self.open_connections)
+
+    def disconnect(self):
+        with self._lock:
+            self.open_connections -= 1
+
+    def run(self, p4, name, args, kwargs):
+        with self._lock:
+            self.commands.append(FakeCommand(name, args, p4.client, id(p4), p4.user))
+
+        handler = self.handlers.get(name)
+        if handler is None:
+            return []
+
+        return handler(p4, args, kwargs)
+
+
+class FakeP4:
+    """A P4 connection to the `server` of the class, set by the fixtures."""
+
+    server = None  # type: FakeServer | None
+
+    def __init__(self):
+        self.port = ""
+        self.user = ""
+        self.password = ""
+        self.client = ""
+        self.progress = None
+        self.exception_level = 2
+        self.warnings = []
+        self.errors = []
+        self._connected = False
+
+    def connect(self):
+        self._connected = True
+        self.server.connect()
+
+    def disconnect(self):
+        self._connected = False
+        self.server.disconnect()
+
+    def connected(self):
+        return self._connected
+
+    def fetch_client(self, *args):
+        return {"Client": self.client}
+
+    def save_client(self, client):
+        return self._run("client", "-i", client["Client"])
+
+    def __getattr__(self, name):
+        if name.startswith("run_"):
+            return functools.partial(self._run, name[len("run_"):])
+
+        raise AttributeError(name)
+
+    def _run(self, name, *args, **kwargs):
+        self.warnings = []
+        self.errors = []
+        return self.server.run(self, name, flatten(args), kwargs)
+
+
+def matches_filter(expression, client_file):
+    """
+    Test `client_file` against an fstat `-F` expression of `&` separated
+    groups of `|` separated `clientFile=` patterns, case sensitively.
+    """
+
+    return all(
+        any(
+            fnmatch.fnmatchcase(client_file, term.split("=", 1)[1])
+            for term in group.strip("()").split(" | ")
+        )
+        for group in expression.split(" & ")
+    )
+
+
+def raise_warnings(p4, warnings):
+    """Fail a command with `warnings`, as P4 does for missing files."""
+
+    p4.warnings = list(warnings)
+    raise P4.P4Exception("\n".join(warnings))
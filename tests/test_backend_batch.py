@@ -0,0 +1,47 @@
+import pytest
+
+from version_control.backends.perforce import backend
+
+from p4_fake import raise_warnings
+
+
+@pytest.fixture
+def fstat_server(p4_server, manager, monkeypatch):
+    """Serve fstat for `/ws/edited.ma`, with `/ws/missing.ma` not on the server."""
+
+    records = {"/ws/edited.ma": {"depotFile": "//depot/ws/edited.ma", "action": "edit"}}
+
+    def fstat(p4, args, kwargs):
+        paths = [arg for arg in args if not arg.startswith("-")]
+        missing = [path for path in paths if path not in records]
+        if missing:
+            raise_warnings(p4, [f"{path} - no such file(s)." for path in missing])
+
+        return [records[path] for path in paths]
+
+    p4_server.handlers["fstat"] = fstat
+    monkeypatch.setattr(backend.api, "_get_connection_manager", lambda: manager)
+    return p4_server
+
+
+def test_stat_operations_share_one_fstat(fstat_server):
+    paths = ["/ws/edited.ma", "/ws/missing.ma"]
+    is_on_server, is_checked_out = backend.VersionControlPerforce.batch(
+        [
+            {"operation": "exists_on_server", "path": paths},
+            {"operation": "is_checkouted", "path": paths},
+        ]
+    )
+
+    assert is_on_server == [True, False]
+    assert is_checked_out == [True, None]
+    queried = [command for command in fstat_server.commands if command.name == "fstat"]
+    assert len(queried) == 2  # The fstat and its retry without the missing file
+
+
+def test_map_batch_result_by_key():
+    paths = ["/ws/a.ma", "/ws/b.ma", "/ws/a.ma"]
+
+    assert backend._map_batch_result(paths, {"/ws/b.ma": True}) == [None, True, None]
+    assert backend._map_batch_result(paths, {}) == [None, None, None]
+    assert backend._map_batch_result(paths, None) == [None, None, None]
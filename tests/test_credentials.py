@@ -0,0 +1,56 @@
+import json
+import os
+
+from version_control.api import credentials
+
+
+def _server(name="studio", username="artist", password="secret"):
+    return credentials.ServerInfo(
+        name=name, host="perforce", port=1666, username=username, password=password
+    )
+
+
+def test_logins_are_saved_to_json(tmp_path):
+    path = tmp_path / "halon" / "perforce_servers.json"
+    store = credentials.CredentialStore(path)
+    store.set(_server())
+    store.set(_server("remote", username="lead"))
+
+    assert {server["name"] for server in json.loads(path.read_text())} == {"studio", "remote"}
+    assert credentials.CredentialStore(path).get("remote") == _server("remote", username="lead")
+    assert list(path.parent.glob("*.tmp")) == []
+
+
+def test_get_returns_a_copy(tmp_path):
+    store = credentials.CredentialStore(tmp_path / "perforce_servers.json")
+    store.set(_server())
+
+    store.get("studio").password = "changed"
+
+    assert store.get("studio").password == "secret"
+
+
+def test_changes_of_other_processes_are_reloaded(tmp_path):
+    path = tmp_path / "perforce_servers.json"
+    store = credentials.CredentialStore(path)
+    store.set(_server())
+
+    other_store = credentials.CredentialStore(path)
+    other_store.set(_server(password="changed"))
+    # Make sure the change is seen even within the mtime resolution:
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 1))
+
+    assert store.get("studio").password == "changed"
+    assert other_store.remove(_server())
+    assert store.get("studio") is None
+    assert not store.remove(_server())
+
+
+def test_unreadable_file_has_no_logins(tmp_path):
+    path = tmp_path / "perforce_servers.json"
+    path.write_text("{not json")
+    store = credentials.CredentialStore(path)
+
+    assert store.get_all() == []
+    store.ensure_file()
+    assert path.read_text() == "{not json"
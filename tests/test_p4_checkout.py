@@ -0,0 +1,47 @@
+import pytest
+
+from version_control.backends.perforce.api import p4_errors
+
+RECORDS = {
+    "/ws/a.ma": {"depotFile": "//depot/ws/a.ma", "headRev": "2", "haveRev": "2"},
+    "/ws/b.ma": {"depotFile": "//depot/ws/b.ma", "headRev": "4", "haveRev": "4"},
+    "/ws/locked.ma": {
+        "depotFile": "//depot/ws/locked.ma",
+        "headRev": "1",
+        "haveRev": "1",
+        "headType": "binary+l",
+        "otherOpen": ["other@their_ws"],
+    },
+}
+
+
+@pytest.fixture
+def checkout_server(p4_server):
+    p4_server.handlers["fstat"] = lambda p4, args, kwargs: [
+        RECORDS[arg] for arg in args if arg in RECORDS
+    ]
+    p4_server.handlers["edit"] = lambda p4, args, kwargs: [
+        {"depotFile": arg, "action": "edit"} for arg in args if arg.startswith("//")
+    ]
+    return p4_server
+
+
+def test_checkout_runs_one_fstat_and_edit(manager, checkout_server):
+    result = manager.checkout(["/ws/a.ma", "/ws/b.ma"])
+
+    assert list(result.values()) == [True, True]
+    commands = [command.name for command in checkout_server.commands]
+    assert commands.count("fstat") == 1
+    assert commands.count("edit") == 1
+    assert "sync" not in commands
+    assert checkout_server.get_commands("edit")[0].args == [
+        "//depot/ws/a.ma",
+        "//depot/ws/b.ma",
+    ]
+
+
+def test_checkout_skips_exclusively_opened_files(manager, checkout_server):
+    with pytest.raises(p4_errors.P4ExclusiveCheckoutError):
+        manager.checkout(["/ws/a.ma", "/ws/locked.ma"])
+
+    assert checkout_server.get_commands("edit")[0].args == ["//depot/ws/a.ma"]
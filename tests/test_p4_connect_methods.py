@@ -0,0 +1,45 @@
+import inspect
+
+from version_control.backends.perforce.api import P4ConnectionManager
+from version_control.backends.perforce.api import _ConnectMethod
+
+
+def test_every_connect_method_is_exposed():
+    for name, function in inspect.getmembers(P4ConnectionManager, inspect.isfunction):
+        if not name.startswith("_connect_"):
+            continue
+
+        exposed = inspect.getattr_static(P4ConnectionManager, name[len("_connect_"):])
+        assert isinstance(exposed, _ConnectMethod)
+        assert exposed.connect_name == name
+        assert name in P4ConnectionManager._path_arg_indices
+
+
+def test_path_arg_indices_match_the_signatures():
+    for name, index in P4ConnectionManager._path_arg_indices.items():
+        function = getattr(P4ConnectionManager, name)
+        assert index == P4ConnectionManager._get_path_index_from_args(function)
+
+
+def test_wrapped_method_is_cached_per_instance(p4_server):
+    manager = P4ConnectionManager()
+    other = P4ConnectionManager()
+
+    assert manager.get_info is manager.get_info
+    assert manager.get_info is not other.get_info
+    assert manager.get_info.__wrapped__ == manager._connect_get_info
+
+
+def test_subclass_methods_are_exposed(p4_server):
+    class Manager(P4ConnectionManager):
+        def _connect_get_answer(self):
+            return 42
+
+        def get_info(self):
+            return "overridden"
+
+    assert isinstance(inspect.getattr_static(Manager, "get_answer"), _ConnectMethod)
+    assert not hasattr(P4ConnectionManager, "get_answer")
+    # Attributes defined by the class are never replaced:
+    assert Manager().get_info() == "overridden"
+
@@ -0,0 +1,53 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from version_control.backends.perforce import api
+
+
+def _sync_estimates(p4, args, kwargs):
+    return ["Server network estimates: files added/updated/deleted=0/1/0, bytes added/updated=0/10"]
+
+
+def test_fan_out_from_a_group_worker_does_not_deadlock(manager, p4_server, monkeypatch):
+    p4_server.handlers["sync"] = _sync_estimates
+    group_executor = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(api, "_group_executor", group_executor)
+    folders = [f"/ws/folder_{index}\\..." for index in range(8)]
+
+    def _probe():
+        with manager.__connect__():
+            return manager._are_folders_latest(folders)
+
+    # With its only worker busy probing, the group executor
+    # can't run the probes of the other connections:
+    future = api._get_group_executor().submit(_probe)
+
+    assert future.result(timeout=10) == [False] * 8
+    group_executor.shutdown()
+
+
+def test_fan_out_probes_every_folder_once(manager, p4_server):
+    p4_server.handlers["sync"] = _sync_estimates
+    folders = [f"/ws/folder_{index}\\..." for index in range(20)]
+
+    with manager.__connect__():
+        assert manager._are_folders_latest(folders) == [False] * 20
+
+    probed = sorted(command.args[-1] for command in p4_server.get_commands("sync"))
+    assert probed == sorted(folders)
+
+
+def test_chunked_sync_from_a_group_worker_does_not_deadlock(manager, p4_server, monkeypatch):
+    group_executor = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(api, "_group_executor", group_executor)
+    chunks = [[f"//depot/ws/file_{index}.ma#1"] for index in range(8)]
+
+    def _sync():
+        with manager.__connect__():
+            return manager._sync_chunks(chunks)
+
+    future = api._get_group_executor().submit(_sync)
+
+    assert future.result(timeout=10) == []
+    synced = sorted(command.args[-1] for command in p4_server.get_commands("sync"))
+    assert synced == sorted(chunk[0] for chunk in chunks)
+    group_executor.shutdown()
@@ -0,0 +1,98 @@
+import pytest
+
+from p4_fake import matches_filter
+from version_control.backends.perforce.api import P4PathDateData
+
+
+@pytest.fixture
+def folder_server(p4_server):
+    folders = {
+        "/ws/scenes\\*": [
+            {"clientFile": "/ws/scenes/Hero_v001.ma", "headTime": "1000"},
+            {"clientFile": "/ws/scenes/Hero_v002.ma", "headTime": "2000"},
+            {"clientFile": "/ws/scenes/Hero_v003.MA", "headTime": "3000"},
+        ],
+        "/ws/empty\\*": [],
+    }
+
+    def fstat(p4, args, kwargs):
+        records = folders[args[-1]]
+        if "-F" in args:
+            expression = args[args.index("-F") + 1]
+            records = [data for data in records if matches_filter(expression, data["clientFile"])]
+
+        if "-r" in args:
+            records = records[::-1]
+
+        if "-m" in args:
+            records = records[:int(args[args.index("-m") + 1])]
+
+        handler = kwargs["handler"]
+        for data in records:
+            handler.outputStat(data)
+
+        return []
+
+    p4_server.handlers["fstat"] = fstat
+    return p4_server
+
+
+
+def test_extension_filter_has_every_case(manager):
+    assert manager._get_extension_filter({".mb", ".ma"}) == (
+        "(clientFile=*.MA | clientFile=*.MB | clientFile=*.Ma | clientFile=*.Mb"
+        " | clientFile=*.mA | clientFile=*.mB | clientFile=*.ma | clientFile=*.mb)"
+    )
+
+
+def test_unsafe_or_long_extensions_are_left_to_python(manager):
+    assert manager._get_extension_filter({".m(a"}) == ""
+    assert manager._get_extension_filter({".tar.gz"}) == ""
+    assert manager._get_extension_filter({".uasset"}) == ""
+    assert manager._get_extension_filter(None) == ""
+
+
+@pytest.mark.parametrize("name_pattern", ["hero", "HERO"])
+def test_names_match_in_any_case(manager, folder_server, name_pattern):
+    result = manager.get_files_in_folder_in_date_order(
+        ["/ws/scenes"], name_pattern=name_pattern, extensions=["ma"]
+    )
+
+    assert [str(data.path) for data in result["/ws/scenes"]] == [
+        "/ws/scenes/Hero_v001.ma",
+        "/ws/scenes/Hero_v002.ma",
+        "/ws/scenes/Hero_v003.MA",
+    ]
+    args = folder_server.get_commands("fstat")[0].args
+    assert "-m" not in args
+
+
+def test_newest_file_in_any_case(manager, folder_server):
+    newest = manager.get_newest_file_in_folder(["/ws/scenes"], name_pattern="hero", extensions=[".ma"])
+
+    assert str(newest.path) == "/ws/scenes/Hero_v003.MA"
+
+
+def test_newest_file_without_filters_is_limited(manager, folder_server):
+    manager.get_newest_file_in_folder(["/ws/scenes"])
+
+    args = folder_server.get_commands("fstat")[0].args
+    assert args[args.index("-m") + 1] == "1"
+
+
+@pytest.mark.parametrize("name_pattern", [None, "villain"])
+def test_empty_folder_placeholder(manager, folder_server, name_pattern):
+    result = manager.get_files_in_folder_in_date_order(
+        ["/ws/empty"], name_pattern=name_pattern
+    )
+
+    assert result == {"/ws/empty": (P4PathDateData(),)}
+
+
+@pytest.mark.parametrize("name_pattern", ["villain", "hero|villain"])
+def test_no_placeholder_without_matching_files(manager, folder_server, name_pattern):
+    result = manager.get_files_in_folder_in_date_order(
+        ["/ws/scenes"], name_pattern=name_pattern
+    )
+
+    assert result == {"/ws/scenes": ()}
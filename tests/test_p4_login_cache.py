@@ -0,0 +1,38 @@
+import P4
+
+from version_control.backends.perforce.api import p4_login_cache
+
+
+def _login(manager, user):
+    manager.login("fake", 1666, user, "secret", workspace_name="ws")
+
+
+def _count_logins(p4_server):
+    return len(p4_server.get_commands("login"))
+
+
+def test_switching_back_to_a_valid_session_skips_login(manager, p4_server):
+    _login(manager, "artist")
+    _login(manager, "lead")
+    login_count = _count_logins(p4_server)
+
+    _login(manager, "artist")
+
+    assert _count_logins(p4_server) == login_count
+    assert manager.p4.user == "artist"
+
+
+def test_rejected_ticket_invalidates_the_session(manager, p4_server):
+    _login(manager, "artist")
+
+    def fstat(p4, args, kwargs):
+        p4.errors = ["Perforce password (P4PASSWD) invalid or unset."]
+        raise P4.P4Exception(p4.errors[0])
+
+    p4_server.handlers["fstat"] = fstat
+    manager.exists_on_server(["/ws/file.ma"])
+
+    assert not p4_login_cache.get_login_cache().is_valid(manager._session)
+    login_count = _count_logins(p4_server)
+    _login(manager, "artist")
+    assert _count_logins(p4_server) > login_count
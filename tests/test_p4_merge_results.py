@@ -0,0 +1,21 @@
+from version_control.backends.perforce.api import P4ConnectionManager
+
+
+def test_dict_results_are_merged_by_key():
+    paths = ("/a/1.ma", "/b/2.ma", "/a/3.ma", "/b\\...")
+    group_results = [
+        # The first group only returned one of its paths:
+        ([0, 2], {"/a/3.ma": True}),
+        ([1, 3], {"/b": False, "/b/2.ma": True}),
+    ]
+
+    merged = P4ConnectionManager._merge_results(paths, group_results)
+
+    assert list(merged.items()) == [("/b/2.ma", True), ("/a/3.ma", True), ("/b", False)]
+
+
+def test_list_results_are_put_back_in_path_order():
+    paths = ("/a/1.ma", "/b/2.ma", "/a/3.ma")
+    group_results = [([0, 2], [1, 3]), ([1], [2])]
+
+    assert P4ConnectionManager._merge_results(paths, group_results) == [1, 2, 3]
@@ -0,0 +1,71 @@
+import pytest
+
+from version_control.backends.perforce.api import p4_errors
+from version_control.backends.perforce.api import p4_pool
+
+
+def test_connection_is_reused(p4_server):
+    pool = p4_pool.P4ConnectionPool()
+    p4 = pool.acquire("fake:1666", "artist", password="secret")
+    pool.release(p4)
+
+    assert pool.acquire("fake:1666", "artist", password="secret") is p4
+    assert p4_server.peak_connections == 1
+    assert p4_server.count("login") == 1
+
+
+def test_login_runs_once_per_password(p4_server):
+    pool = p4_pool.P4ConnectionPool()
+    p4 = pool.acquire("fake:1666", "artist", password="secret")
+
+    assert not pool.login(p4, "secret")
+    assert pool.login(p4, "changed")
+    assert pool.login(p4, "changed", force=True)
+    assert p4_server.count("login") == 3
+
+
+def test_full_pool_times_out(p4_server):
+    pool = p4_pool.P4ConnectionPool(max_size=1, acquire_timeout=0.05)
+    pool.acquire("fake:1666", "artist")
+
+    with pytest.raises(p4_errors.P4ServerConnectionError):
+        pool.acquire("fake:1666", "artist")
+
+
+def test_manager_logs_in_once(manager, p4_server):
+    manager.login("fake", 1666, "artist", "secret", workspace_name="ws")
+
+    logins = [
+        command for command in p4_server.get_commands("login")
+        if "-s" not in command.args
+    ]
+    assert len(logins) == 1
+
+
+def test_manager_stays_online_when_pool_is_exhausted(manager, p4_server):
+    p4_pool.configure_connection_pool(max_size=1, acquire_timeout=0.05)
+    p4_pool.get_connection_pool().acquire("fake:1666", "other")
+
+    with pytest.raises(p4_errors.P4ServerConnectionError):
+        manager.get_workspaces()
+
+    assert not manager.is_offline
+
+
+def test_full_pool_fails_without_waiting(p4_server):
+    pool = p4_pool.P4ConnectionPool(max_size=1, acquire_timeout=None)
+    pool.acquire("fake:1666", "artist")
+
+    with pytest.raises(p4_errors.P4ServerConnectionError):
+        pool.acquire("fake:1666", "artist", wait=False)
+
+
+def test_sessions_with_other_clients_use_other_connections(p4_server):
+    pool = p4_pool.P4ConnectionPool()
+    p4 = pool.acquire("fake:1666", "artist", client="ws")
+    pool.release(p4)
+
+    other = pool.acquire("fake:1666", "artist", client="other")
+    assert other is not p4
+    assert other.client == "other"
+    assert pool.acquire("fake:1666", "artist", client="ws") is p4
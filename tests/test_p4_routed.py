@@ -0,0 +1,16 @@
+from conftest import HOST_NAME
+from version_control.backends.perforce.api import p4_pool
+
+
+def test_groups_run_on_the_callers_connection_when_the_pool_is_full(manager, p4_server):
+    p4_server.handlers["clients"] = lambda p4, args, kwargs: [
+        {"client": client, "Host": HOST_NAME, "Root": f"/{client}", "Stream": ""}
+        for client in ("ws", "other")
+    ]
+    p4_pool.configure_connection_pool(max_size=1, acquire_timeout=5)
+
+    result = manager.exists_on_server(["/ws/a.ma", "/other/b.ma"])
+
+    assert result == {"/ws/a.ma": False, "/other/b.ma": False}
+    fstats = {(command.client, command.args[-1]) for command in p4_server.get_commands("fstat")}
+    assert fstats == {("ws", "/ws/a.ma"), ("other", "/other/b.ma")}
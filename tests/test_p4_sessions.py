@@ -0,0 +1,74 @@
+import threading
+
+import pytest
+
+from conftest import HOST_NAME
+from version_control.backends.perforce import api
+
+
+@pytest.fixture(autouse=True)
+def two_workspaces(p4_server):
+    p4_server.handlers["clients"] = lambda p4, args, kwargs: [
+        {"client": client, "Host": HOST_NAME, "Root": f"/{client}", "Stream": ""}
+        for client in ("ws", "other")
+    ]
+
+
+def _login(user, workspace):
+    return api.login("fake", 1666, user, "secret", workspace_name=workspace)
+
+
+def _get_info_sessions(p4_server):
+    return {(command.user, command.client) for command in p4_server.get_commands("info")}
+
+
+def test_bound_session_outlives_other_logins(p4_server):
+    artist_key = _login("artist", "ws")
+    _login("lead", "other")
+
+    with api.bind_session(api.get_session(artist_key)):
+        api.get_info()
+
+    assert _get_info_sessions(p4_server) == {("artist", "ws")}
+
+
+def test_threads_run_with_their_own_session(p4_server):
+    sessions = [api.get_session(_login("artist", "ws")), api.get_session(_login("lead", "other"))]
+    barrier = threading.Barrier(len(sessions))
+    clients = {}
+
+    def _run(session):
+        with api.bind_session(session):
+            barrier.wait(timeout=5)
+            for _ in range(10):
+                api.get_info()
+
+            clients[session.client] = api._get_connection_manager().p4.client
+
+    threads = [threading.Thread(target=_run, args=(session,)) for session in sessions]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert clients == {"ws": "ws", "other": "other"}
+    assert _get_info_sessions(p4_server) == {("artist", "ws"), ("lead", "other")}
+    assert len(p4_server.get_commands("info")) == 20
+
+
+def test_group_managers_keep_the_session(p4_server):
+    session = api.P4Session(port="fake:1666", user="artist", password="secret", client="ws")
+    manager = api.P4ConnectionManager(session=session)
+
+    assert manager._create_group_manager()._session is session
+
+
+def test_unbound_threads_use_the_last_login(p4_server):
+    _login("artist", "ws")
+    _login("lead", "other")
+
+    with api.bind_session(None):
+        api.get_info()
+
+    assert _get_info_sessions(p4_server) == {("lead", "other")}
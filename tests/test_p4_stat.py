@@ -0,0 +1,93 @@
+from version_control.backends.perforce.api import p4_stat
+
+from p4_fake import raise_warnings
+
+RECORDS = [
+    {"depotFile": "//depot/ws/a.ma", "headRev": "3", "haveRev": "3", "headTime": "100"},
+    {"depotFile": "//depot/ws/b.ma", "headRev": "3", "haveRev": "1", "action": "edit"},
+    {"depotFile": "//depot/ws/c.ma", "headRev": "2"},
+    {},
+]
+
+
+def test_file_stat():
+    stat = p4_stat.FileStat.from_record(RECORDS[0])
+
+    assert stat.exists
+    assert (stat.head_rev, stat.have_rev, stat.head_time) == (3, 3, 100)
+    assert stat.is_latest
+    assert p4_stat.FileStat.from_record({}).is_latest is None
+
+
+def test_batch_columns():
+    batch = p4_stat.FileStatBatch.from_records(RECORDS)
+
+    assert len(batch) == 4
+    assert batch.is_latest() == [True, True, False, None]
+    assert batch.head_revisions() == [3, 3, 2, None]
+    assert batch.have_revisions() == [3, 1, 0, None]
+    assert batch.revision_info()[3] == (None, None)
+    assert batch[1].action == "edit"
+    assert [stat.depot_file for stat in batch.iter_stats()] == [
+        "//depot/ws/a.ma",
+        "//depot/ws/b.ma",
+        "//depot/ws/c.ma",
+        None,
+    ]
+
+
+def test_actions_are_interned():
+    batch = p4_stat.FileStatBatch.from_records(
+        [{"depotFile": "//a", "action": "".join(("ed", "it"))}, {"depotFile": "//b", "action": "edit"}]
+    )
+
+    assert batch.actions[0] is batch.actions[1]
+
+
+def test_get_stat_batch_keeps_files_aligned(manager, p4_server):
+    folder_records = [
+        {"depotFile": "//depot/ws/scenes/x.ma", "headRev": "1", "haveRev": "1"},
+        {"depotFile": "//depot/ws/scenes/y.ma", "headRev": "1", "haveRev": "1"},
+    ]
+
+    def fstat(p4, args, kwargs):
+        if "handler" in kwargs:
+            for data in folder_records:
+                kwargs["handler"].outputStat(data)
+
+            return []
+
+        if "/ws/missing.ma" in args:
+            raise_warnings(p4, ["/ws/missing.ma - no such file(s)."])
+
+        return [{"depotFile": "//depot/ws/a.ma", "headRev": "1", "haveRev": "1"}]
+
+    p4_server.handlers["fstat"] = fstat
+    batch = manager.get_stat_batch(["/ws/scenes", "/ws/missing.ma", "/ws/a.ma"])
+
+    assert batch.depot_files == [
+        None,
+        "//depot/ws/a.ma",
+        "//depot/ws/scenes/x.ma",
+        "//depot/ws/scenes/y.ma",
+    ]
+
+
+def test_revisions_keep_the_order_of_mixed_paths(manager, p4_server):
+    records = {
+        "/ws/a.ma": {"depotFile": "//depot/ws/a.ma", "headRev": "3", "haveRev": "3"},
+        "/ws/b.ma": {"depotFile": "//depot/ws/b.ma", "headRev": "2", "haveRev": "1"},
+    }
+    p4_server.handlers["fstat"] = lambda p4, args, kwargs: [
+        records[arg] for arg in args if arg in records
+    ]
+    p4_server.handlers["sync"] = lambda p4, args, kwargs: [
+        "Server network estimates: files added/updated/deleted=0/1/0, bytes added/updated=0/10"
+    ]
+
+    result = manager.is_latest(["/ws/b.ma", "/ws/scenes", "/ws/a.ma"])
+    assert list(result.items()) == [("/ws/b.ma", False), ("/ws/scenes", False), ("/ws/a.ma", True)]
+    result = manager.get_current_server_revision(["/ws/b.ma", "/ws/a.ma"])
+    assert list(result.items()) == [("/ws/b.ma", 2), ("/ws/a.ma", 3)]
+    result = manager.get_current_revision_info(["/ws/b.ma", "/ws/a.ma"])
+    assert list(result.items()) == [("/ws/b.ma", (2, 1)), ("/ws/a.ma", (3, 3))]
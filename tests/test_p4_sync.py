@@ -0,0 +1,193 @@
+import threading
+import time
+
+from version_control.backends.perforce import api
+from version_control.backends.perforce.api import p4_pool
+from version_control.backends.perforce.api import p4_sync
+
+
+def _create_manager():
+    manager = api.P4ConnectionManager()
+    settings = manager._p4_settings
+    settings.port = "fake:1666"
+    settings.user = "artist"
+    settings.client = "ws"
+    manager.sync_chunk_files = 2
+    return manager
+
+
+def _serve_slow_sync(p4_server, file_count, delay):
+    def sync(p4, args, kwargs):
+        if "-N" in args:
+            return [f"Server network estimates: files added/updated/deleted=0/{file_count}/0"]
+
+        if "-n" not in args:
+            time.sleep(delay)
+            return []
+
+        return [
+            {
+                "depotFile": f"//depot/ws/scenes/file_{index}.ma",
+                "clientFile": f"/ws/scenes/file_{index}.ma",
+                "rev": "1",
+                "fileSize": "10",
+            }
+            for index in range(file_count)
+        ]
+
+    p4_server.handlers["sync"] = sync
+
+
+def _get_syncs(p4_server):
+    # The syncs that transfer files, without the previews and estimates:
+    return [
+        command
+        for command in p4_server.get_commands("sync")
+        if "-n" not in command.args and "-N" not in command.args
+    ]
+
+
+def test_chunked_syncs_leave_connections_to_other_calls(p4_server):
+    _serve_slow_sync(p4_server, file_count=16, delay=0.1)
+    p4_pool.configure_connection_pool(max_size=8, acquire_timeout=0.5)
+    p4_server.handlers["fstat"] = lambda p4, args, kwargs: [
+        {"depotFile": "//depot/ws/scenes/file_0.ma", "headAction": "add"}
+    ]
+    sync_results = []
+
+    def _sync():
+        sync_results.append(_create_manager().get_latest(["/ws/scenes"]))
+
+    threads = [threading.Thread(target=_sync) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+
+    try:
+        # Let both syncs take their connections first:
+        time.sleep(0.2)
+        exists = _create_manager().exists_on_server(["/ws/scenes/file_0.ma"])
+    finally:
+        for thread in threads:
+            thread.join(timeout=10)
+
+    assert exists == {"/ws/scenes/file_0.ma": True}
+    assert len(sync_results) == 2
+    # Two syncs, at most two extra connections for them and one exists_on_server:
+    assert p4_server.peak_connections <= 5
+
+
+def test_plan_chunks_balances_sizes():
+    files = [("a", 100), ("b", 60), ("c", 40), ("d", 30), ("e", 30)]
+    chunks = p4_sync.plan_chunks(files, 2)
+    sizes = dict(files)
+
+    assert sorted(file for chunk in chunks for file in chunk) == ["a", "b", "c", "d", "e"]
+    assert sorted(sum(sizes[file] for file in chunk) for chunk in chunks) == [130, 130]
+
+
+def test_plan_chunks_spreads_empty_files_and_drops_empty_chunks():
+    assert sorted(map(len, p4_sync.plan_chunks([(str(index), 0) for index in range(6)], 3))) == [2, 2, 2]
+    assert p4_sync.plan_chunks([("a", 1), ("b", 1)], 4) == [["a"], ["b"]]
+    assert p4_sync.plan_chunks([], 4) == []
+
+
+def test_small_folder_sync_stays_on_one_connection(manager, p4_server):
+    _serve_slow_sync(p4_server, file_count=2, delay=0)
+
+    manager.get_latest(["/ws/scenes"])
+
+    assert [command.args for command in p4_server.get_commands("sync")] == [
+        ["-N", "/ws/scenes\\..."],
+        ["/ws/scenes\\..."],
+    ]
+    assert p4_server.peak_connections == 1
+
+
+def test_small_checkpointed_sync_saves_no_checkpoint(manager, p4_server, tmp_path, monkeypatch):
+    monkeypatch.setenv("APPDATA", str(tmp_path))
+    _serve_slow_sync(p4_server, file_count=2, delay=0)
+
+    manager.get_latest(["/ws/scenes"], checkpoint=True)
+
+    assert ["/ws/scenes\\..."] in [command.args for command in p4_server.get_commands("sync")]
+    assert not any(p4_sync.get_checkpoint_dir().glob("*.json"))
+
+
+def test_large_checkpointed_sync_saves_a_checkpoint(manager, p4_server, tmp_path, monkeypatch):
+    monkeypatch.setenv("APPDATA", str(tmp_path))
+    _serve_slow_sync(p4_server, file_count=4, delay=0)
+    p4_server.handlers["changes"] = lambda p4, args, kwargs: [{"change": "12"}]
+    manager.sync_chunk_files = 2
+    saved = []
+    save = p4_sync.P4SyncCheckpoint.save
+
+    def _save(sync_checkpoint):
+        saved.append(sync_checkpoint)
+        save(sync_checkpoint)
+
+    monkeypatch.setattr(p4_sync.P4SyncCheckpoint, "save", _save)
+
+    assert manager.get_latest(["/ws/scenes"], checkpoint=True) == {"/ws/scenes": True}
+    assert [sync_checkpoint.change for sync_checkpoint in saved] == [12]
+
+
+def test_checkpoint_resumes_remaining_chunks(tmp_path, monkeypatch):
+    monkeypatch.setenv("APPDATA", str(tmp_path))
+    chunks = [["//depot/a.ma#1"], ["//depot/b.ma#2"]]
+    sync_checkpoint = p4_sync.P4SyncCheckpoint("key", "", 12, chunks, missing_paths=["/ws/gone"])
+    sync_checkpoint.save()
+    sync_checkpoint.set_chunk_synced(chunks[0])
+
+    loaded = p4_sync.P4SyncCheckpoint.load("key", max_age=60)
+    assert loaded.change == 12
+    assert loaded.missing_paths == ["/ws/gone"]
+    assert loaded.get_remaining_chunks() == [chunks[1]]
+
+    loaded.remove()
+    assert p4_sync.P4SyncCheckpoint.load("key") is None
+
+
+def test_old_checkpoint_is_discarded(tmp_path, monkeypatch):
+    monkeypatch.setenv("APPDATA", str(tmp_path))
+    sync_checkpoint = p4_sync.P4SyncCheckpoint("key", "", 12, [["//depot/a.ma#1"]])
+    sync_checkpoint.created -= 120
+    sync_checkpoint.save()
+
+    assert p4_sync.P4SyncCheckpoint.load("key") is not None
+    assert p4_sync.P4SyncCheckpoint.load("key", max_age=60) is None
+    assert not sync_checkpoint.file_path.exists()
+
+
+def test_checkpoint_far_behind_head_is_synced_again(manager, p4_server, tmp_path, monkeypatch):
+    monkeypatch.setenv("APPDATA", str(tmp_path))
+    _serve_slow_sync(p4_server, file_count=2, delay=0)
+    p4_server.handlers["changes"] = lambda p4, args, kwargs: [{"change": "5000"}]
+    key = p4_sync.P4SyncCheckpoint.make_key("fake:1666", "ws", ["/ws/scenes\\..."])
+    p4_sync.P4SyncCheckpoint(key, "", 12, [["//depot/ws/scenes/old.ma#1"]]).save()
+
+    assert manager.get_latest(["/ws/scenes"], checkpoint=True) == {"/ws/scenes": True}
+    synced = [command.args for command in p4_server.get_commands("sync")]
+    assert ["-n", "/ws/scenes\\...@5000"] in synced
+    assert not any("//depot/ws/scenes/old.ma#1" in args for args in synced)
+    assert p4_sync.P4SyncCheckpoint.load(key) is None
+
+
+def test_paused_sync_waits_between_chunks(manager, p4_server):
+    _serve_slow_sync(p4_server, file_count=4, delay=0)
+    paused = threading.Event()
+    paused.set()
+    manager.sync_chunk_files = 2
+    manager.max_sync_connections = 1
+    manager.sync_throttle = p4_sync.P4SyncThrottle(is_paused_fn=paused.is_set)
+    # Files of a running chunk are never held back by a pause:
+    manager.sync_throttle.wait(10)
+
+    thread = threading.Thread(target=manager.get_latest, args=(["/ws/scenes"],))
+    thread.start()
+    time.sleep(0.2)
+    synced = _get_syncs(p4_server)
+    paused.clear()
+    thread.join(timeout=10)
+
+    assert synced == []
+    assert len(_get_syncs(p4_server)) == 2
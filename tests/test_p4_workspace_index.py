@@ -0,0 +1,55 @@
+from version_control.backends.perforce.api import p4_workspace_index
+
+
+def _create_index():
+    index = p4_workspace_index.P4WorkspaceIndex()
+    index.add("project", "C:\\Work\\Project", "//project/main")
+    index.add("engine", "C:\\Work\\Project\\Engine", "//engine/main")
+    index.add("project_copy", "D:\\Copy", "//project/main")
+    return index
+
+
+def test_split_path():
+    assert p4_workspace_index.split_path("C:\\Work\\Project\\...") == [
+        "c:",
+        "work",
+        "project",
+    ]
+    assert p4_workspace_index.split_path("//Depot/Main/file.ma") == [
+        "//",
+        "depot",
+        "main",
+        "file.ma",
+    ]
+
+
+def test_resolve_the_innermost_root():
+    index = _create_index()
+
+    assert index.resolve("c:/work/project/file.ma") == "project"
+    assert index.resolve("C:\\Work\\Project\\Engine\\file.uasset") == "engine"
+    assert index.resolve("//engine/main/...") == "engine"
+    assert index.resolve("E:\\Elsewhere\\file.ma") is None
+
+
+def test_resolve_shared_roots_by_preference():
+    index = _create_index()
+
+    assert index.resolve("//project/main/file.ma") == "project"
+    assert index.resolve("//project/main/file.ma", ("project_copy",)) == "project_copy"
+
+
+def test_group_paths():
+    index = _create_index()
+    paths = [
+        "C:\\Work\\Project\\Engine\\a.uasset",
+        "C:\\Work\\Project\\b.ma",
+        "E:\\c.ma",
+        "C:\\Work\\Project\\Engine\\d.uasset",
+    ]
+
+    groups, unresolved = index.group_paths(paths)
+
+    assert groups == {"engine": [0, 3], "project": [1]}
+    assert unresolved == [2]
+    assert index.workspaces == ("project", "engine", "project_copy")
@@ -0,0 +1,20 @@
+from conftest import HOST_NAME
+
+
+def test_get_workspaces_lists_new_workspaces(manager, p4_server):
+    assert manager.get_workspaces() == "ws"  # A single result is unwrapped
+
+    p4_server.handlers["clients"] = lambda p4, args, kwargs: [
+        {"client": "ws", "Host": HOST_NAME, "Root": "/ws", "Stream": ""},
+        {"client": "new", "Host": HOST_NAME, "Root": "/new", "Stream": ""},
+    ]
+
+    assert sorted(manager.get_workspaces()) == ["new", "ws"]
+
+
+def test_workspace_exists_uses_the_cache(manager, p4_server):
+    manager.get_workspaces()
+    count = p4_server.count("clients")
+
+    assert manager.workspace_exists("ws")
+    assert p4_server.count("clients") == count
@@ -0,0 +1,46 @@
+from version_control.rest.perforce import rest_stub
+
+
+def test_configure_can_restore_unlimited_read_timeout(monkeypatch):
+    session = rest_stub._StubSession()
+    monkeypatch.setattr(rest_stub, "_stub_session", session)
+
+    rest_stub.PerforceRestStub.configure(read_timeout=5.0)
+    rest_stub.PerforceRestStub.configure(retries=1)
+    assert session.read_timeout == 5.0
+
+    rest_stub.PerforceRestStub.configure(read_timeout=None)
+    assert session.read_timeout is None
+    assert session.retries == 1
+
+
+class _Response:
+    ok = True
+
+    def __init__(self, value):
+        self._value = value
+
+    def json(self):
+        return self._value
+
+
+class _RecordingSession:
+    def __init__(self):
+        self.headers = []
+
+    def post(self, url, json, headers, timeout):
+        self.headers.append(headers)
+        return _Response("session-key" if url.endswith("/login") else True)
+
+
+def test_calls_send_the_session_of_the_login(monkeypatch):
+    session = rest_stub._StubSession()
+    recording = _RecordingSession()
+    monkeypatch.setattr(rest_stub, "_stub_session", session)
+    monkeypatch.setattr(session, "_create_session", lambda: recording)
+    monkeypatch.setenv("PERFORCE_WEBSERVER_URL", "http://localhost:8079")
+
+    rest_stub.PerforceRestStub.login("perforce", 1666, "artist", "secret", workspace_name="ws")
+    rest_stub.PerforceRestStub.exists_on_server("/ws/file.ma")
+
+    assert recording.headers == [None, {rest_stub.SESSION_HEADER: "session-key"}]
@@ -0,0 +1,41 @@
+from ayon_core.settings import lib
+
+from version_control.api import settings_cache
+
+
+def _set_settings(monkeypatch, servers):
+    monkeypatch.setitem(lib.PROJECT_SETTINGS, "project", {"version_control": {"servers": servers}})
+
+
+def test_settings_are_fetched_once_per_ttl(monkeypatch):
+    _set_settings(monkeypatch, ["studio"])
+    cache = settings_cache.SettingsCache(ttl=60)
+    version = cache.get_version("project")
+
+    _set_settings(monkeypatch, ["remote"])
+
+    assert cache.get_version("project") == version
+    assert cache.get_settings("project") == {"servers": ["studio"]}
+
+
+def test_version_changes_with_the_settings(monkeypatch):
+    _set_settings(monkeypatch, ["studio"])
+    cache = settings_cache.SettingsCache(ttl=60)
+    version = cache.get_version("project")
+
+    cache.invalidate("project")
+    assert cache.get_version("project") == version
+
+    _set_settings(monkeypatch, ["remote"])
+    cache.invalidate()
+    assert cache.get_version("project") != version
+    assert cache.get_settings("project") == {"servers": ["remote"]}
+
+
+def test_settings_are_copies(monkeypatch):
+    _set_settings(monkeypatch, ["studio"])
+    cache = settings_cache.SettingsCache()
+
+    cache.get_settings("project")["servers"].append("remote")
+
+    assert cache.get_settings("project") == {"servers": ["studio"]}